@@ -0,0 +1,276 @@
+"""Monte Carlo runner: many seeded simulations, aggregated statistics.
+
+A single simulation shows one shuffle sequence, so balance signal and
+shuffle luck can't be told apart. This module runs N seeded simulations,
+sharded across a process pool in chunks (one task per chunk keeps IPC
+overhead low), and reduces them to mean/p5/p50/p95 per metric.
+
+Workers return compact per-run summaries only (no event traces or state
+history), so the parent process stays small no matter how many runs.
+With record_fights, each run's FightLog (one small row per fight) comes
+back too, and the logs are joined into one table across runs.
+"""
+
+import math
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from simulator.core.balance_config import BalanceConfig
+from simulator.core.combat import ENGINES, CombatSimulator, RecordLevel
+from simulator.core.deck import Deck, starter_deck
+from simulator.core.fight_log import FightLog
+
+# Engines accepted by run_monte_carlo ("batch" = BatchCombatSimulator per chunk)
+MONTE_CARLO_ENGINES = (*ENGINES, "batch")
+
+# Per-run metrics reported by summarize_runs (key, display label)
+SUMMARY_METRICS = [
+    ("enemies_defeated", "Enemies Defeated"),
+    ("player_deaths", "Player Deaths"),
+    ("furthest_enemy", "Furthest Enemy"),
+    ("final_essence", "Final Essence"),
+]
+
+# Percentiles reported for every metric
+PERCENTILES = (5, 50, 95)
+
+
+def _summarize_result(run_index: int, results: Mapping[str, Any]) -> dict[str, Any]:
+    """Reduce one simulation result to the compact per-run summary.
+
+    Only scalar stats are read, so nothing of a SimulationResult's event
+    log, state history or fight table is converted.
+
+    Args:
+        run_index: Index of the run within the Monte Carlo batch
+        results: CombatSimulator.simulate() results (or a batch run's dict)
+
+    Returns:
+        Per-run summary (plain Python values, cheap to pickle)
+    """
+    return {
+        "run_index": run_index,
+        "final_essence": float(results["final_essence"]),
+        "enemies_defeated": int(results["enemies_defeated"]),
+        "player_deaths": int(results["player_deaths"]),
+        "furthest_enemy": int(results["furthest_enemy"]),
+        "pack_affordable_times": {
+            int(pack): float(time) for pack, time in results["pack_affordable_times"].items()
+        },
+    }
+
+
+def _run_chunk(
+    run_indices: list[int],
+    seed: int,
+    duration_minutes: float,
+    deck: Deck,
+    engine: str,
+    config: BalanceConfig | None = None,
+    record_fights: bool = False,
+) -> list[dict[str, Any]]:
+    """Run one chunk of seeded simulations (executed in a worker process).
+
+    Args:
+        run_indices: Indices of the runs in this chunk
+        seed: Base seed of the Monte Carlo batch
+        duration_minutes: Simulation duration in minutes
+        deck: Deck to simulate with
+        engine: Simulation engine (see MONTE_CARLO_ENGINES)
+        config: Balance config (default: game-data/balance-config.json)
+        record_fights: Add each run's FightLog to its summary ("fights")
+
+    Returns:
+        Per-run summaries, in run order
+    """
+    if engine == "batch":
+        return _run_batch_chunk(run_indices, seed, duration_minutes, deck, config)
+
+    sim = CombatSimulator(record_level=RecordLevel.OFF, config=config)
+    summaries = []
+    for run_index in run_indices:
+        results = sim.simulate(
+            duration_minutes=duration_minutes,
+            deck=deck,
+            engine=engine,
+            seed=seed,
+            run_index=run_index,
+        )
+        summary = _summarize_result(run_index, results)
+        if record_fights:
+            summary["fights"] = results["fights"]
+        summaries.append(summary)
+    return summaries
+
+
+def _run_batch_chunk(
+    run_indices: list[int],
+    seed: int,
+    duration_minutes: float,
+    deck: Deck,
+    config: BalanceConfig | None = None,
+) -> list[dict[str, Any]]:
+    """Run one chunk as a single vectorized batch.
+
+    Args:
+        run_indices: Indices of the runs in this chunk
+        seed: Base seed of the Monte Carlo batch
+        duration_minutes: Simulation duration in minutes
+        deck: Deck to simulate with
+        config: Balance config (default: game-data/balance-config.json)
+
+    Returns:
+        Per-run summaries, in run order
+    """
+    from simulator.core.batch import BatchCombatSimulator
+
+    batch = BatchCombatSimulator(config=config).simulate(
+        duration_minutes=duration_minutes,
+        deck=deck,
+        n_runs=len(run_indices),
+        seed=seed,
+        run_index=run_indices[0],
+    )
+    summaries = []
+    for row, run_index in enumerate(run_indices):
+        run = {key: batch[key][row] for key, _ in SUMMARY_METRICS}
+        run["pack_affordable_times"] = {
+            pack: times[row]
+            for pack, times in batch["pack_affordable_times"].items()
+            if not np.isnan(times[row])
+        }
+        summaries.append(_summarize_result(run_index, run))
+    return summaries
+
+
+def run_monte_carlo(
+    runs: int,
+    workers: int | None = None,
+    seed: int = 0,
+    duration_minutes: float = 30.0,
+    deck: Deck | None = None,
+    engine: str = "event",
+    chunk_size: int | None = None,
+    config: BalanceConfig | None = None,
+    record_fights: bool = False,
+) -> dict[str, Any]:
+    """Run seeded simulations across a process pool and aggregate them.
+
+    Run i shuffles from the stream run_seed_sequence(seed, i), so results do
+    not depend on the number of workers or the chunk size, and any run can
+    be replayed with full tracing via CombatSimulator(seed=seed, run_index=i)
+    (except with the "batch" engine, whose shuffles are drawn per chunk).
+
+    Args:
+        runs: Number of simulations
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        seed: Base seed
+        duration_minutes: Simulation duration in minutes
+        deck: Deck to simulate with (default: starter deck)
+        engine: Simulation engine ("stepped", "event", "resolved" or "batch")
+        chunk_size: Runs per task (default: ~4 tasks per worker)
+        config: Balance config (default: game-data/balance-config.json)
+        record_fights: Also return every run's fights as one FightLog ("fights";
+            its "run" column is the run index). Not supported by the "batch" engine.
+
+    Returns:
+        Dictionary with per-run summaries ("runs") and aggregate statistics ("stats")
+    """
+    if engine not in MONTE_CARLO_ENGINES:
+        raise ValueError(
+            f"Unknown engine '{engine}' (expected one of {', '.join(MONTE_CARLO_ENGINES)})"
+        )
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+    if record_fights and engine == "batch":
+        raise ValueError("The 'batch' engine does not record per-fight rows")
+
+    deck = deck or starter_deck()
+    workers = max(1, min(workers or os.cpu_count() or 1, runs))
+    chunk_size = chunk_size or max(1, math.ceil(runs / (workers * 4)))
+    chunks = [
+        list(range(start, min(start + chunk_size, runs))) for start in range(0, runs, chunk_size)
+    ]
+
+    summaries: list[dict[str, Any]] = []
+    if workers == 1:
+        for chunk in chunks:
+            summaries.extend(
+                _run_chunk(chunk, seed, duration_minutes, deck, engine, config, record_fights)
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_chunk, chunk, seed, duration_minutes, deck, engine, config, record_fights
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                summaries.extend(future.result())
+
+    mc_results = {
+        "runs": summaries,
+        "stats": summarize_runs(summaries),
+        "n_runs": runs,
+        "workers": workers,
+        "seed": seed,
+        "duration_minutes": duration_minutes,
+        "engine": engine,
+    }
+    if record_fights:
+        mc_results["fights"] = FightLog.concat(run.pop("fights") for run in summaries)
+    return mc_results
+
+
+def _describe(values: np.ndarray) -> dict[str, float]:
+    """Mean and percentiles of a sample.
+
+    Args:
+        values: Sample values
+
+    Returns:
+        Dictionary with mean, p5, p50, p95 (NaN for an empty sample)
+    """
+    if len(values) == 0:
+        return {"mean": math.nan, **{f"p{p}": math.nan for p in PERCENTILES}}
+    percentiles = np.percentile(values, PERCENTILES)
+    return {
+        "mean": float(values.mean()),
+        **{f"p{p}": float(v) for p, v in zip(PERCENTILES, percentiles, strict=True)},
+    }
+
+
+def summarize_runs(summaries: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    """Aggregate per-run summaries into mean/p5/p50/p95 statistics.
+
+    Pack times are described over the runs that reached the pack; the
+    fraction of runs that did is reported as "reached".
+
+    Args:
+        summaries: Per-run summaries from run_monte_carlo
+
+    Returns:
+        Dictionary mapping metric name ("enemies_defeated", "pack_1", ...) to statistics
+    """
+    stats = {
+        key: _describe(np.array([run[key] for run in summaries], dtype=np.float64))
+        for key, _ in SUMMARY_METRICS
+    }
+
+    pack_numbers = sorted({pack for run in summaries for pack in run["pack_affordable_times"]})
+    for pack in pack_numbers:
+        times = np.array(
+            [
+                run["pack_affordable_times"][pack]
+                for run in summaries
+                if pack in run["pack_affordable_times"]
+            ]
+        )
+        stats[f"pack_{pack}"] = {**_describe(times), "reached": len(times) / len(summaries)}
+
+    return stats
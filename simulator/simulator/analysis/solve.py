@@ -0,0 +1,431 @@
+"""Balance solver: find the config value that hits a baseline target.
+
+BaselineValidator states targets such as "Pack 1 at ~7 min" or "Enemy 50
+at ~23 min". run_solve() takes one of them, a single balance-config key
+and a bracket [low, high] of values for it, and runs bisection or Brent's
+method on
+
+    f(x) = mean of the metric over seeded runs with the key set to x - target
+
+Each evaluation is a Monte Carlo batch sharded across one process pool
+(kept open, with warm variant caches, for the whole solve; see sweep.py).
+Every evaluation uses the same seed and run indices 0..n-1 (common
+random numbers), so two candidate values are compared on identical
+shuffle sequences and f(x) does not jitter between evaluations.
+
+Batches grow adaptively: a point starts at the current batch size and
+doubles it until the confidence interval on the mean either excludes the
+target (the sign of f is known, which is all the bracket update needs)
+or lies within target +/- tolerance (solved). The batch size never
+shrinks, so later evaluations always share the earlier seeds.
+
+Time metrics are censored at the simulation horizon: a run that never
+reaches the pack or enemy counts as reaching it at the horizon. The
+default horizon is twice the target, so censoring only matters far from
+the solution; each evaluation reports the fraction of runs that reached it.
+"""
+
+import math
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from statistics import NormalDist
+from typing import Any
+
+import numpy as np
+
+from simulator.analysis.montecarlo import _run_chunk
+from simulator.analysis.sweep import _variant_config
+from simulator.analysis.validation import BaselineValidator, ValidationTarget
+from simulator.core.balance_config import BalanceConfig, default_balance_config
+from simulator.core.combat import ENGINES
+from simulator.core.deck import Deck, starter_deck
+
+# Root-finding methods accepted by run_solve
+SOLVE_METHODS = ("brent", "bisect")
+
+
+def solve_targets() -> dict[str, ValidationTarget]:
+    """Baseline targets that run_solve can aim for, by metric name.
+
+    Returns:
+        "pack_<n>" (minutes until pack n is affordable), "enemy_<n>" (minutes
+        until enemy n is first reached) and "defeat_rate" (enemies/min) ->
+        the BaselineValidator target
+    """
+    validator = BaselineValidator()
+    targets = {
+        f"pack_{pack}": target for pack, target in enumerate(validator.pack_timing_targets, 1)
+    }
+    targets.update(
+        {
+            f"enemy_{enemy}": target
+            for enemy, target in zip(
+                validator.milestone_enemies, validator.milestone_targets, strict=True
+            )
+        }
+    )
+    targets["defeat_rate"] = validator.gameplay_targets[1]
+    return targets
+
+
+def default_solve_duration(metric: str, target: float) -> float:
+    """Simulation horizon for a metric: twice the target time (30 min for rates).
+
+    Args:
+        metric: Metric name (see solve_targets)
+        target: Target value of the metric
+
+    Returns:
+        Duration in minutes
+    """
+    return 2.0 * target if metric.startswith(("pack_", "enemy_")) else 30.0
+
+
+def metric_values(
+    metric: str, summaries: list[dict[str, Any]], duration_minutes: float
+) -> list[tuple[float, bool]]:
+    """Per-run metric values from Monte Carlo run summaries.
+
+    Args:
+        metric: Metric name (see solve_targets)
+        summaries: Per-run summaries (with "fights" for enemy metrics)
+        duration_minutes: Simulation horizon (value of runs that never got there)
+
+    Returns:
+        (value, reached) per run
+    """
+    kind, _, number = metric.partition("_")
+    values = []
+    for run in summaries:
+        if metric == "defeat_rate":
+            values.append((run["enemies_defeated"] / duration_minutes, True))
+        elif kind == "pack":
+            time = run["pack_affordable_times"].get(int(number))
+            values.append((duration_minutes, False) if time is None else (time, True))
+        elif kind == "enemy":
+            fights = run["fights"]
+            spawns = fights.column("spawn_time")[fights.indices(enemy_number=int(number))]
+            reached = len(spawns) > 0
+            values.append((float(spawns[0]) / 60 if reached else duration_minutes, reached))
+        else:
+            raise ValueError(f"Unknown metric '{metric}'")
+    return values
+
+
+def _run_solve_chunk(
+    overrides: dict[str, Any],
+    run_indices: list[int],
+    seed: int,
+    duration_minutes: float,
+    deck: Deck,
+    engine: str,
+    metric: str,
+    base: BalanceConfig | None = None,
+) -> list[tuple[float, bool]]:
+    """Run one chunk at one candidate value (executed in a worker process).
+
+    Args:
+        overrides: The candidate's config override
+        run_indices: Indices of the runs in this chunk
+        seed: Base seed of the solve
+        duration_minutes: Simulation duration in minutes
+        deck: Deck to simulate with
+        engine: Simulation engine
+        metric: Metric name (see solve_targets)
+        base: Config the override applies to (default: balance-config.json)
+
+    Returns:
+        (value, reached) per run, in run order
+    """
+    config = _variant_config(overrides, base)
+    summaries = _run_chunk(
+        run_indices,
+        seed,
+        duration_minutes,
+        deck,
+        engine,
+        config,
+        record_fights=metric.startswith("enemy_"),
+    )
+    return metric_values(metric, summaries, duration_minutes)
+
+
+def run_solve(
+    metric: str,
+    param: str,
+    low: float,
+    high: float,
+    target: float | None = None,
+    tolerance: float | None = None,
+    template: str | None = None,
+    method: str = "brent",
+    runs: int = 32,
+    max_runs: int = 1024,
+    confidence: float = 0.95,
+    max_iterations: int = 30,
+    xtol: float | None = None,
+    workers: int | None = None,
+    seed: int = 0,
+    duration_minutes: float | None = None,
+    deck: Deck | None = None,
+    engine: str = "event",
+    base_config: BalanceConfig | None = None,
+) -> dict[str, Any]:
+    """Find the value of one balance-config key that puts a metric on target.
+
+    The metric must move monotonically enough with the key that the bracket
+    ends land on opposite sides of the target.
+
+    Args:
+        metric: Metric name (see solve_targets)
+        param: Dotted balance-config key to solve for
+        low: Lower end of the bracket
+        high: Upper end of the bracket
+        target: Target value (default: the BaselineValidator target)
+        tolerance: Accepted distance from the target, in metric units
+            (default: 1% of the target)
+        template: Format string for the config value, with {x} for the
+            candidate (e.g. "20 + (n - 1) * {x}"); default: the number itself
+        method: "brent" or "bisect"
+        runs: Initial seeded runs per evaluation
+        max_runs: Largest batch per evaluation
+        confidence: Confidence level of the interval on the mean
+        max_iterations: Evaluations inside the bracket before giving up
+        xtol: Stop once the bracket is this narrow (default: 1e-6 of its width)
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        seed: Base seed (shared by every evaluation)
+        duration_minutes: Simulation duration (default: default_solve_duration)
+        deck: Deck to simulate with (default: starter deck)
+        engine: Simulation engine ("stepped", "event" or "resolved")
+        base_config: Config the key is set in (default: balance-config.json)
+
+    Returns:
+        Dictionary with the solution ("value", plus its "mean", "half_width"
+        and "runs"), whether the interval is within tolerance ("converged")
+        and why the solve stopped ("reason": "tolerance", "bracket" or
+        "iterations"), every evaluation in order ("evaluations"), and the
+        total number of simulated runs ("simulated")
+
+    Raises:
+        KeyError: If param is not a balance-config key
+        ValueError: If the bracket ends are on the same side of the target, or
+            the tolerance is not positive
+    """
+    targets = solve_targets()
+    if metric not in targets:
+        raise ValueError(f"Unknown metric '{metric}' (expected one of {', '.join(targets)})")
+    if method not in SOLVE_METHODS:
+        raise ValueError(f"Unknown method '{method}' (expected one of {', '.join(SOLVE_METHODS)})")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}' (expected one of {', '.join(ENGINES)})")
+    if not 2 <= runs <= max_runs:
+        raise ValueError("runs must be at least 2 and at most max_runs")
+
+    target = targets[metric].expected if target is None else target
+    if tolerance is None:
+        tolerance = 0.01 * abs(target)
+    if tolerance <= 0:
+        raise ValueError(f"tolerance must be positive (got {tolerance:g}; pass --tolerance)")
+    duration_minutes = duration_minutes or default_solve_duration(metric, target)
+    deck = deck or starter_deck()
+    base = base_config or default_balance_config()
+    base.with_overrides({param: low})  # Fail fast on a bad key
+    xtol = xtol or 1e-6 * abs(high - low)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    workers = max(1, min(workers or os.cpu_count() or 1, max_runs))
+
+    values: dict[float, list[tuple[float, bool]]] = {}  # Candidate -> per-run values
+    evaluations: list[dict[str, Any]] = []
+    batch = runs
+
+    def simulate(executor: Executor | None, x: float, run_indices: list[int]) -> None:
+        overrides = {param: template.format(x=x) if template else x}
+        chunk_size = max(1, math.ceil(len(run_indices) / workers))
+        chunks = [
+            run_indices[start : start + chunk_size]
+            for start in range(0, len(run_indices), chunk_size)
+        ]
+        args = (seed, duration_minutes, deck, engine, metric, base_config)
+        if executor is None:
+            results = [_run_solve_chunk(overrides, chunk, *args) for chunk in chunks]
+        else:
+            futures = [
+                executor.submit(_run_solve_chunk, overrides, chunk, *args) for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+        values.setdefault(x, []).extend(value for chunk in results for value in chunk)
+
+    def evaluate(executor: Executor | None, x: float) -> dict[str, Any]:
+        nonlocal batch
+        while True:
+            done = len(values.get(x, []))
+            if done < batch:
+                simulate(executor, x, list(range(done, batch)))
+            sample = np.array([value for value, _ in values[x]])
+            mean = float(sample.mean())
+            half_width = z * float(sample.std(ddof=1)) / math.sqrt(len(sample))
+            offset = abs(mean - target)
+            within = offset + half_width <= tolerance
+            if within or offset > half_width or batch >= max_runs:
+                break
+            batch = min(2 * batch, max_runs)
+        evaluation = {
+            "value": x,
+            "mean": mean,
+            "half_width": half_width,
+            "runs": len(sample),
+            "reached": sum(reached for _, reached in values[x]) / len(sample),
+            "within_tolerance": within,
+        }
+        evaluations.append(evaluation)
+        return evaluation
+
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+
+        def f(x: float) -> tuple[float, bool]:
+            evaluation = evaluate(executor, x)
+            return evaluation["mean"] - target, evaluation["within_tolerance"]
+
+        solver = _brent if method == "brent" else _bisect
+        reason = _bracketed_search(solver, f, low, high, xtol, max_iterations)
+
+    solution = min(
+        evaluations, key=lambda e: (not e["within_tolerance"], abs(e["mean"] - target))
+    )
+    return {
+        "metric": metric,
+        "param": param,
+        "target": target,
+        "tolerance": tolerance,
+        "confidence": confidence,
+        "value": solution["value"],
+        "config_value": template.format(x=solution["value"]) if template else solution["value"],
+        "mean": solution["mean"],
+        "half_width": solution["half_width"],
+        "runs": solution["runs"],
+        "converged": solution["within_tolerance"],
+        "reason": reason,
+        "evaluations": evaluations,
+        "simulated": sum(len(sample) for sample in values.values()),
+        "method": method,
+        "seed": seed,
+        "duration_minutes": duration_minutes,
+        "engine": engine,
+    }
+
+
+# f(x) -> (f value, within tolerance)
+_Objective = Callable[[float], tuple[float, bool]]
+
+
+class _SolvedError(Exception):
+    """Raised inside a search once an evaluation is within tolerance."""
+
+
+def _bracketed_search(
+    solver: Callable[..., str],
+    f: _Objective,
+    low: float,
+    high: float,
+    xtol: float,
+    max_iterations: int,
+) -> str:
+    """Evaluate the bracket ends, then run a solver until it stops.
+
+    Returns:
+        Why the search stopped: "tolerance", "bracket" or "iterations"
+
+    Raises:
+        ValueError: If both ends are on the same side of the target
+    """
+
+    def checked(x: float) -> float:
+        fx, within = f(x)
+        if within:
+            raise _SolvedError
+        return fx
+
+    try:
+        f_low, f_high = checked(low), checked(high)
+        if f_low * f_high > 0:
+            raise ValueError(
+                f"Bracket [{low:g}, {high:g}] does not straddle the target "
+                f"(metric - target is {f_low:+.3g} and {f_high:+.3g})"
+            )
+        return solver(checked, low, high, f_low, f_high, xtol, max_iterations)
+    except _SolvedError:
+        return "tolerance"
+
+
+def _bisect(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    xtol: float,
+    max_iterations: int,
+) -> str:
+    """Bisection on a bracket with f(a) and f(b) of opposite signs."""
+    for _ in range(max_iterations):
+        if abs(b - a) <= xtol:
+            return "bracket"
+        m = 0.5 * (a + b)
+        fm = f(m)
+        if (fm < 0) == (fa < 0):
+            a, fa = m, fm
+        else:
+            b = m
+    return "iterations"
+
+
+def _brent(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    xtol: float,
+    max_iterations: int,
+) -> str:
+    """Brent's method (inverse quadratic interpolation, secant and bisection steps).
+
+    Follows Brent (1973) as in the classic zbrent: interpolation steps are
+    taken only while they shrink the bracket fast enough, otherwise it bisects.
+    """
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(max_iterations):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * np.finfo(float).eps * abs(b) + 0.5 * xtol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol or fb == 0:
+            return "bracket"
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * xm * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * xm * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, xm)
+        fb = f(b)
+    return "iterations"
@@ -0,0 +1,331 @@
+"""Parameter sweeps: Monte Carlo runs over balance-config variants.
+
+A sweep takes one or more balance-config keys with candidate values,
+builds every combination as an in-memory overlay on balance-config.json
+(BalanceConfig.with_overrides), and runs the same seeded runs against
+each variant. Work is split into (variant x chunk of run indices) tasks
+on one process pool. Workers stay warm across variants: each keeps the
+variant configs it has built (and their enemy tables), so a task only
+ships its overrides.
+
+Results form a tidy table with one row per (variant, run). Each row
+carries a content-addressed key (run_key of the deck, the variant's
+config contents, seed, run index, duration and engine). Passing the
+previous table back in skips every cell whose key is already in it, so
+rerunning a sweep with one more value only simulates the new variant.
+"""
+
+import csv
+import itertools
+import json
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from simulator.analysis.montecarlo import SUMMARY_METRICS, _run_chunk, summarize_runs
+from simulator.core.balance_config import BalanceConfig, default_balance_config
+from simulator.core.combat import ENGINES
+from simulator.core.deck import Deck, starter_deck
+from simulator.core.run_cache import canonical_json, run_key
+
+# Pack-time columns of a sweep table ("pack_<n>")
+_PACK_COLUMN = re.compile(r"pack_(\d+)")
+
+# Variant configs built in this process, by base digest + overrides (warm workers)
+_VARIANTS: dict[str, BalanceConfig] = {}
+
+
+def parse_sweep_value(text: str) -> Any:
+    """Parse one --values entry: a JSON literal (number, list, ...) or else a string.
+
+    Args:
+        text: Value as typed (e.g. "130", "[1, 50]", "20 + (n - 1) * 130")
+
+    Returns:
+        Parsed value
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text.strip()
+
+
+def parse_sweep_values(text: str) -> list[Any]:
+    """Parse a comma-separated --values list.
+
+    Args:
+        text: e.g. "110,130,150", "[1, 50], [1, 60]" or "20 + (n - 1) * 120,20 + (n - 1) * 140"
+
+    Returns:
+        Parsed values
+    """
+    try:
+        return json.loads(f"[{text}]")  # Numbers, quoted strings, lists
+    except ValueError:
+        return [parse_sweep_value(part) for part in text.split(",")]
+
+
+def sweep_variants(params: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Every combination of parameter values, first parameter varying slowest.
+
+    Args:
+        params: Dotted config key -> candidate values
+
+    Returns:
+        Overrides (key -> value) per variant
+    """
+    keys = list(params)
+    return [dict(zip(keys, values, strict=True)) for values in itertools.product(*params.values())]
+
+
+def _variant_config(overrides: dict[str, Any], base: BalanceConfig | None = None) -> BalanceConfig:
+    """Variant of the base config, built once per process, base and overrides."""
+    base = base or default_balance_config()
+    cache_key = canonical_json([base.digest, overrides])
+    config = _VARIANTS.get(cache_key)
+    if config is None:
+        config = base.with_overrides(overrides)
+        _VARIANTS[cache_key] = config
+    return config
+
+
+def _run_sweep_chunk(
+    overrides: dict[str, Any],
+    run_indices: list[int],
+    seed: int,
+    duration_minutes: float,
+    deck: Deck,
+    engine: str,
+    base: BalanceConfig | None = None,
+) -> list[dict[str, Any]]:
+    """Run one chunk of one variant (executed in a worker process).
+
+    Args:
+        overrides: The variant's config overrides
+        run_indices: Indices of the runs in this chunk
+        seed: Base seed of the sweep
+        duration_minutes: Simulation duration in minutes
+        deck: Deck to simulate with
+        engine: Simulation engine
+        base: Config the overrides apply to (default: balance-config.json)
+
+    Returns:
+        Per-run summaries (see montecarlo), in run order
+    """
+    config = _variant_config(overrides, base)
+    return _run_chunk(run_indices, seed, duration_minutes, deck, engine, config)
+
+
+def run_sweep(
+    params: dict[str, list[Any]],
+    runs: int,
+    workers: int | None = None,
+    seed: int = 0,
+    duration_minutes: float = 30.0,
+    deck: Deck | None = None,
+    engine: str = "event",
+    chunk_size: int | None = None,
+    base_config: BalanceConfig | None = None,
+    previous: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Run the same seeded runs against every variant of a parameter grid.
+
+    Run i of every variant shuffles from run_seed_sequence(seed, i), so
+    variants are compared on identical shuffle sequences.
+
+    Args:
+        params: Dotted config key -> candidate values (every combination is run)
+        runs: Seeded runs per variant
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        seed: Base seed
+        duration_minutes: Simulation duration in minutes
+        deck: Deck to simulate with (default: starter deck)
+        engine: Simulation engine ("stepped", "event" or "resolved")
+        chunk_size: Runs per task (default: ~4 tasks per worker)
+        base_config: Config the overrides apply to (default: balance-config.json)
+        previous: Rows of an earlier sweep table; cells with the same key are reused
+
+    Returns:
+        Dictionary with the variants' overrides ("variants"), the tidy table
+        ("rows", one per variant and run), per-variant statistics ("stats"),
+        and how many cells were simulated ("computed") or reused ("reused")
+
+    Raises:
+        KeyError: If a parameter is not a balance-config key
+        ValueError: If a parameter name is also a table column (e.g. "seed")
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}' (expected one of {', '.join(ENGINES)})")
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+
+    reserved = {"variant", "seed", "run_index", "key", *(metric for metric, _ in SUMMARY_METRICS)}
+    clashes = [key for key in params if key in reserved or _PACK_COLUMN.fullmatch(key)]
+    if clashes:
+        raise ValueError(f"Parameter names clash with sweep table columns: {', '.join(clashes)}")
+
+    deck = deck or starter_deck()
+    base = base_config or default_balance_config()
+    variants = sweep_variants(params)
+    reusable = {row["key"]: row for row in previous or []}
+
+    # Cell keys, and which cells still need simulating
+    keys: list[list[str]] = []
+    missing: list[tuple[int, int]] = []  # (variant, run index)
+    for variant, overrides in enumerate(variants):
+        config = _variant_config(overrides, base)
+        keys.append(
+            [
+                run_key(
+                    deck,
+                    config,
+                    seed=seed,
+                    run_index=run_index,
+                    duration_minutes=duration_minutes,
+                    engine=engine,
+                )
+                for run_index in range(runs)
+            ]
+        )
+        missing.extend((variant, i) for i in range(runs) if keys[variant][i] not in reusable)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(missing) or 1))
+    chunk_size = chunk_size or max(1, math.ceil(len(missing) / (workers * 4)))
+    tasks = []
+    for variant, cells in itertools.groupby(missing, key=lambda cell: cell[0]):
+        indices = [run_index for _, run_index in cells]
+        for start in range(0, len(indices), chunk_size):
+            tasks.append((variant, indices[start : start + chunk_size]))
+
+    computed: dict[tuple[int, int], dict[str, Any]] = {}
+    if workers == 1:
+        for variant, chunk in tasks:
+            summaries = _run_sweep_chunk(
+                variants[variant], chunk, seed, duration_minutes, deck, engine, base_config
+            )
+            computed.update(((variant, run["run_index"]), run) for run in summaries)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_sweep_chunk,
+                    variants[variant],
+                    chunk,
+                    seed,
+                    duration_minutes,
+                    deck,
+                    engine,
+                    base_config,
+                )
+                for variant, chunk in tasks
+            ]
+            for (variant, _), future in zip(tasks, futures, strict=True):
+                computed.update(((variant, run["run_index"]), run) for run in future.result())
+
+    rows = []
+    stats = []
+    for variant, overrides in enumerate(variants):
+        summaries = []
+        for run_index, key in enumerate(keys[variant]):
+            summary = computed.get((variant, run_index)) or _row_summary(reusable[key])
+            summaries.append(summary)
+            rows.append(_summary_row(variant, overrides, seed, summary, key))
+        stats.append(summarize_runs(summaries))
+
+    return {
+        "variants": variants,
+        "rows": rows,
+        "stats": stats,
+        "computed": len(computed),
+        "reused": len(variants) * runs - len(computed),
+        "runs": runs,
+        "seed": seed,
+        "duration_minutes": duration_minutes,
+        "engine": engine,
+    }
+
+
+def _summary_row(
+    variant: int, overrides: dict[str, Any], seed: int, summary: dict[str, Any], key: str
+) -> dict[str, Any]:
+    """Flatten a per-run summary into a table row."""
+    row: dict[str, Any] = {"variant": variant, **overrides, "seed": seed}
+    row["run_index"] = summary["run_index"]
+    row.update({metric: summary[metric] for metric, _ in SUMMARY_METRICS})
+    row.update(
+        {f"pack_{pack}": time for pack, time in sorted(summary["pack_affordable_times"].items())}
+    )
+    row["key"] = key
+    return row
+
+
+def _row_summary(row: dict[str, Any]) -> dict[str, Any]:
+    """Per-run summary back from a table row (packs not reached are missing)."""
+    return {
+        "run_index": int(row["run_index"]),
+        **{metric: row[metric] for metric, _ in SUMMARY_METRICS},
+        "pack_affordable_times": {
+            int(match.group(1)): float(value)
+            for column, value in row.items()
+            if (match := _PACK_COLUMN.fullmatch(column)) and value not in (None, "")
+        },
+    }
+
+
+def write_sweep_table(path: Path | str, rows: list[dict[str, Any]]) -> Path:
+    """Write sweep rows as CSV (empty cells for packs a run did not reach).
+
+    Args:
+        path: CSV file
+        rows: Rows from run_sweep
+
+    Returns:
+        CSV file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = list(dict.fromkeys(column for row in rows for column in row if column != "key"))
+    packs = sorted(
+        (column for column in columns if _PACK_COLUMN.fullmatch(column)),
+        key=lambda column: int(column.removeprefix("pack_")),
+    )
+    columns = [column for column in columns if column not in packs] + packs + ["key"]
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=columns, restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def read_sweep_table(path: Path | str) -> list[dict[str, Any]]:
+    """Read a sweep CSV back (numbers parsed, empty cells None).
+
+    Args:
+        path: CSV file written by write_sweep_table
+
+    Returns:
+        Rows (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    with path.open(newline="", encoding="utf-8") as file:
+        return [
+            {column: _parse_cell(value) for column, value in row.items()}
+            for row in csv.DictReader(file)
+        ]
+
+
+def _parse_cell(value: str) -> Any:
+    """CSV cell -> int, float, None (empty) or the string itself."""
+    if value == "":
+        return None
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
@@ -0,0 +1,290 @@
+"""Time-indexed queries over one simulation's results.
+
+SimulationTimeline is built once from a results dict and answers the
+questions validation and charts keep asking ("state at minute 17", "when
+was enemy 50 first reached", "how did that fight go", "what happened
+between t0 and t1") by bisection over sorted arrays instead of scanning
+the state history or event log each time:
+
+- state snapshot times are one sorted column (state_at / nearest_state)
+- row indices of each event type are split out once, in time order
+  (indices / events_between)
+- fights come from the run's FightLog (rebuilt from the events for results
+  without one), with an index sorted by enemy number (fight /
+  first_time_reaching_enemy)
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from simulator.core.event_log import EVENT_TYPES, EventLog, as_event_log
+from simulator.core.fight_log import FightLog
+from simulator.core.state_history import StateHistory, as_state_history
+
+
+@dataclass(frozen=True)
+class Fight:
+    """One fight: from an enemy's spawn to its defeat, a death or the end of the run."""
+
+    enemy_number: int
+    spawn_time: float  # Seconds
+    end_time: float  # Victory/death time (end of run if unresolved)
+    outcome: str  # "victory", "death" or "unresolved"
+    ticks: int
+    damage_dealt: float
+    damage_taken: float
+    overkill: float
+    player_hp_start: float
+    player_hp_end: float
+    max_health: float
+    atk_per_tick: float
+    def_per_tick: float
+    is_boss: bool
+
+    @property
+    def combat_duration(self) -> float:
+        """Seconds from spawn to end_time."""
+        return self.end_time - self.spawn_time
+
+
+class SimulationTimeline:
+    """Indexed view of a simulation's state history and event log.
+
+    Attributes:
+        results: Results dict the timeline was built from
+        events: Columnar event log of the run
+        fight_log: One row per fight
+        state_history: State snapshots (indexing yields results-format dicts)
+        state_times: Snapshot times in seconds (sorted)
+        duration_seconds: Simulated duration
+    """
+
+    def __init__(self, results: dict[str, Any]) -> None:
+        """Index a simulation's results.
+
+        Args:
+            results: Simulation results from CombatSimulator.simulate()
+        """
+        self.results = results
+        self.events: EventLog = as_event_log(results.get("events", []))
+        self.state_history: StateHistory = as_state_history(results.get("state_history", []))
+        self.state_times = self.state_history.times
+        self.duration_seconds = float(
+            results.get("duration_seconds", results.get("duration_minutes", 0.0) * 60)
+        )
+        self._state_series: dict[str, np.ndarray] = {}
+
+        # Row indices per event type (stable sort keeps each type in time order)
+        codes = self.events.type_codes
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(EVENT_TYPES) + 1))
+        self._type_rows = {
+            name: order[bounds[code] : bounds[code + 1]] for code, name in enumerate(EVENT_TYPES)
+        }
+
+        fight_log = results.get("fights")
+        if fight_log is None:
+            fight_log = FightLog.from_events(self.events, self.duration_seconds)
+        self.fight_log: FightLog = fight_log
+
+        # Fights sorted by enemy number (then by time) for per-enemy lookups
+        enemies = fight_log.column("enemy_number")
+        self._fights_by_enemy = np.argsort(enemies, kind="stable")
+        self._sorted_enemies = enemies[self._fights_by_enemy]
+
+    # ------------------------------------------------------------------
+    # State history
+    # ------------------------------------------------------------------
+
+    def state_at(self, time: float) -> dict[str, Any] | None:
+        """Latest state snapshot at or before a time.
+
+        Args:
+            time: Simulation time (seconds)
+
+        Returns:
+            State dict, or None if no snapshot was taken by then
+        """
+        index = int(np.searchsorted(self.state_times, time, side="right")) - 1
+        return self.state_history.row(index) if index >= 0 else None
+
+    def nearest_state(self, time: float) -> dict[str, Any] | None:
+        """State snapshot closest to a time (the earlier one on a tie).
+
+        Args:
+            time: Simulation time (seconds)
+
+        Returns:
+            State dict, or None if there is no state history
+        """
+        if not self.state_history:
+            return None
+        index = int(np.searchsorted(self.state_times, time))
+        if index == len(self.state_times) or (
+            index > 0 and time - self.state_times[index - 1] <= self.state_times[index] - time
+        ):
+            index -= 1
+        return self.state_history.row(index)
+
+    def state_series(self, field: str) -> np.ndarray:
+        """One state history field as an array (built once per field).
+
+        Args:
+            field: State dict key (e.g. "essence", "player_attack")
+
+        Returns:
+            Values aligned with state_times
+        """
+        series = self._state_series.get(field)
+        if series is None:
+            series = self.state_history.column(field)
+            self._state_series[field] = series
+        return series
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def indices(self, *event_types: str) -> np.ndarray:
+        """Row positions of events with any of the given types.
+
+        Args:
+            event_types: Event type names (all rows if none given)
+
+        Returns:
+            Sorted row indices
+        """
+        if not event_types:
+            return np.arange(len(self.events))
+        if len(event_types) == 1:
+            return self._type_rows[event_types[0]]
+        return np.sort(np.concatenate([self._type_rows[name] for name in event_types]))
+
+    def indices_between(self, start: float, end: float, *event_types: str) -> np.ndarray:
+        """Row positions of events with start <= time < end.
+
+        Args:
+            start: Start time (seconds, inclusive)
+            end: End time (seconds, exclusive)
+            event_types: Event type names (all types if none given)
+
+        Returns:
+            Sorted row indices
+        """
+        times = self.events.times
+        if not event_types:
+            return np.arange(*np.searchsorted(times, [start, end]))
+        rows = self.indices(*event_types)
+        first, last = np.searchsorted(times[rows], [start, end])
+        return rows[first:last]
+
+    def events_between(
+        self, start: float, end: float, *event_types: str
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily materialize the events with start <= time < end.
+
+        Args:
+            start: Start time (seconds, inclusive)
+            end: End time (seconds, exclusive)
+            event_types: Event type names (all types if none given)
+
+        Yields:
+            Results-format event dicts
+        """
+        for row in self.indices_between(start, end, *event_types):
+            yield self.events.row(int(row))
+
+    # ------------------------------------------------------------------
+    # Fights
+    # ------------------------------------------------------------------
+
+    @property
+    def fight_count(self) -> int:
+        """Number of fights (enemy spawns) in the run."""
+        return len(self.fight_log)
+
+    def first_time_reaching_enemy(self, enemy_number: int) -> float | None:
+        """Time an enemy was first spawned.
+
+        Args:
+            enemy_number: Enemy sequence number
+
+        Returns:
+            Spawn time in seconds, or None if the enemy was never reached
+        """
+        fight = self._fight_index(enemy_number, 0)
+        return None if fight is None else float(self.fight_log.column("spawn_time")[fight])
+
+    def fight(self, enemy_number: int, occurrence: int = 0) -> Fight | None:
+        """A fight against an enemy (enemies are fought again after each death).
+
+        Args:
+            enemy_number: Enemy sequence number
+            occurrence: Which fight against that enemy (0: first, -1: latest)
+
+        Returns:
+            Fight, or None if there is no such fight
+        """
+        fight = self._fight_index(enemy_number, occurrence)
+        return None if fight is None else self._fight_at(fight)
+
+    def _fight_at(self, fight: int) -> Fight:
+        """Fight at a row of the fight log."""
+        row = self.fight_log.row(fight)
+        return Fight(
+            enemy_number=row["enemy_number"],
+            spawn_time=row["spawn_time"],
+            end_time=row["end_time"],
+            outcome=row["outcome"],
+            ticks=row["ticks"],
+            damage_dealt=row["damage_dealt"],
+            damage_taken=row["damage_taken"],
+            overkill=row["overkill"],
+            player_hp_start=row["player_hp_start"],
+            player_hp_end=row["player_hp_end"],
+            max_health=row["enemy_max_hp"],
+            atk_per_tick=row["enemy_atk_per_tick"],
+            def_per_tick=row["enemy_def_per_tick"],
+            is_boss=row["is_boss"],
+        )
+
+    def fights(self, enemy_number: int) -> list[Fight]:
+        """Every fight against an enemy, in time order.
+
+        Args:
+            enemy_number: Enemy sequence number
+
+        Returns:
+            Fights (empty if the enemy was never reached)
+        """
+        first, last = self._fight_range(enemy_number)
+        return [self._fight_at(int(fight)) for fight in self._fights_by_enemy[first:last]]
+
+    def _fight_range(self, enemy_number: int) -> tuple[int, int]:
+        """Slice of _fights_by_enemy holding one enemy's fights."""
+        first, last = np.searchsorted(self._sorted_enemies, [enemy_number, enemy_number + 1])
+        return int(first), int(last)
+
+    def _fight_index(self, enemy_number: int, occurrence: int) -> int | None:
+        """Row of a fight in the fight log (None if there is no such fight)."""
+        first, last = self._fight_range(enemy_number)
+        if not -(last - first) <= occurrence < last - first:
+            return None
+        return int(self._fights_by_enemy[first + occurrence % (last - first)])
+
+
+def as_timeline(results: "dict[str, Any] | SimulationTimeline") -> SimulationTimeline:
+    """Get a timeline for simulation results.
+
+    Args:
+        results: Results dict, or a timeline (returned as-is)
+
+    Returns:
+        SimulationTimeline over the results
+    """
+    if isinstance(results, SimulationTimeline):
+        return results
+    return SimulationTimeline(results)
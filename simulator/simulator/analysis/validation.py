@@ -26,9 +26,10 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
-from simulator.core.cards import STARTER_DECK_CARDS
-from simulator.core.combat import BALANCE_CONFIG, CombatSimulator
-from simulator.core.deck import Deck
+from simulator.analysis.timeline import SimulationTimeline, as_timeline
+from simulator.core.combat import BALANCE_CONFIG, CombatSimulator, RecordLevel
+from simulator.core.deck import starter_deck
+from simulator.core.run_cache import RunCache
 
 
 @dataclass
@@ -122,7 +123,8 @@ class BaselineValidator:
             ValidationTarget("Enemy 50 Combat", expected=47.0, tolerance=0.20, unit="sec"),  # ~47 seconds (boss)
         ]
         
-        # Progression milestone targets (Session 2.0.3)
+        # Progression milestone targets (Session 2.0.3), one per milestone enemy
+        self.milestone_enemies = [50, 60]
         self.milestone_targets = [
             ValidationTarget("Enemy 50 Time", expected=23.0, tolerance=0.15, unit="min"),  # Mini-Boss #1
             ValidationTarget("Enemy 60 Time", expected=30.0, tolerance=0.15, unit="min"),  # 30-min milestone
@@ -144,11 +146,13 @@ class BaselineValidator:
             },
         }
 
-    def validate_simulation(self, results: dict, verbose: bool = True) -> dict:
+    def validate_simulation(
+        self, results: dict | SimulationTimeline, verbose: bool = True
+    ) -> dict:
         """Validate simulation results against all targets.
         
         Args:
-            results: Simulation results from CombatSimulator.simulate()
+            results: Simulation results from CombatSimulator.simulate() (or their timeline)
             verbose: If True, print detailed validation messages
             
         Returns:
@@ -166,6 +170,8 @@ class BaselineValidator:
             "death_system": [],
             "summary": {},
         }
+        timeline = as_timeline(results)
+        results = timeline.results
 
         # Validate pack timing
         if verbose:
@@ -194,18 +200,10 @@ class BaselineValidator:
         if verbose:
             print("\n=== Essence Rate Validation ===")
 
-        state_history = results.get("state_history", [])
         target_times = [8, 17, 27]  # minutes
 
         for i, target_min in enumerate(target_times):
-            target_sec = target_min * 60
-
-            # Find closest state
-            closest_state = min(
-                state_history,
-                key=lambda s: abs(s["time"] - target_sec),
-                default=None,
-            )
+            closest_state = timeline.nearest_state(target_min * 60)
 
             if closest_state:
                 actual_rate = closest_state["player_essence_rate"]
@@ -294,35 +292,14 @@ class BaselineValidator:
         if verbose:
             print("\n=== Combat Duration Validation ===")
         
-        # Build enemy_events dict from events list
-        enemy_events = {}
-        events = results.get("events", [])
-        
-        # First pass: get enemy stats from spawn events
-        for event in events:
-            if event["type"] == "enemy_spawn":
-                enemy_num = event["data"].get("enemy_number")
-                if enemy_num:
-                    enemy_events[enemy_num] = {
-                        "time": event["time"],
-                        "enemy_max_hp": event["data"].get("max_health", 0.0),
-                        "enemy_attack": event["data"].get("attack", 0),
-                        "combat_duration": 0.0,  # Will be updated from victory event
-                    }
-        
-        # Second pass: get combat durations from victory events
-        for event in events:
-            if event["type"] == "victory":
-                enemy_num = event["data"].get("enemy_number")
-                if enemy_num and enemy_num in enemy_events:
-                    enemy_events[enemy_num]["combat_duration"] = event["data"].get("combat_duration", 0.0)
-        
         test_enemies = [1, 10, 25, 50]  # Enemies to test duration
         
         for i, enemy_num in enumerate(test_enemies):
-            if enemy_num in enemy_events:
-                event = enemy_events[enemy_num]
-                actual_duration = event.get("combat_duration", 0.0)
+            fights = timeline.fights(enemy_num)
+            if fights:
+                # Latest win against the enemy (0 if it was never beaten)
+                won = [fight for fight in fights if fight.outcome == "victory"]
+                actual_duration = won[-1].combat_duration if won else 0.0
                 
                 passed, msg = self.combat_duration_targets[i].check(actual_duration)
                 if verbose:
@@ -346,12 +323,10 @@ class BaselineValidator:
         if verbose:
             print("\n=== Progression Milestone Validation ===")
         
-        milestone_enemies = [50, 60]
-        
-        for i, enemy_num in enumerate(milestone_enemies):
-            if enemy_num in enemy_events:
-                event = enemy_events[enemy_num]
-                actual_time_min = event.get("time", 0.0) / 60.0
+        for i, enemy_num in enumerate(self.milestone_enemies):
+            reached = timeline.first_time_reaching_enemy(enemy_num)
+            if reached is not None:
+                actual_time_min = reached / 60.0
                 
                 passed, msg = self.milestone_targets[i].check(actual_time_min)
                 if verbose:
@@ -376,11 +351,10 @@ class BaselineValidator:
             print("\n=== Boss Encounter Validation ===")
         
         for boss_num, boss_targets in self.boss_targets.items():
-            if boss_num in enemy_events:
-                event = enemy_events[boss_num]
-                
+            fight = timeline.fight(boss_num)
+            if fight is not None:
                 # HP validation
-                actual_hp = event.get("enemy_max_hp", 0.0)
+                actual_hp = fight.max_health
                 passed, msg = boss_targets["hp"].check(actual_hp)
                 if verbose:
                     print(msg)
@@ -398,7 +372,7 @@ class BaselineValidator:
                     validation_report["overall_passed"] = False
                 
                 # Attack validation
-                actual_attack = event.get("enemy_attack", 0.0)
+                actual_attack = fight.atk_per_tick
                 passed, msg = boss_targets["attack"].check(actual_attack)
                 if verbose:
                     print(msg)
@@ -478,12 +452,20 @@ class BaselineValidator:
         return validation_report
 
 
-def run_baseline_validation(duration_minutes: float = 30.0, verbose: bool = True) -> dict:
+def run_baseline_validation(
+    duration_minutes: float = 30.0,
+    verbose: bool = True,
+    seed: int | None = None,
+    cache: RunCache | None = None,
+) -> dict:
     """Run full baseline validation with starter deck.
     
     Args:
         duration_minutes: Simulation duration (default 30 min to test all 3 packs)
         verbose: Print detailed output
+        seed: Shuffle seed (default: random)
+        cache: Reuse the simulation of an earlier validation with the same
+            seed from this cache (unseeded runs are never cached)
         
     Returns:
         Validation report dictionary
@@ -495,7 +477,7 @@ def run_baseline_validation(duration_minutes: float = 30.0, verbose: bool = True
         print(f"\nRunning {duration_minutes} minute simulation with starter deck...")
 
     # Create starter deck
-    deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+    deck = starter_deck()
 
     if verbose:
         print(f"\nDeck: {deck.name}")
@@ -505,8 +487,8 @@ def run_baseline_validation(duration_minutes: float = 30.0, verbose: bool = True
         print(f"  Total Rate: {deck.total_essence_rate}/sec")
         print(f"  Total Burst: {deck.total_essence_burst}")
 
-    # Run simulation
-    sim = CombatSimulator()
+    # Run simulation (validation only reads the fight log and state history)
+    sim = CombatSimulator(record_level=RecordLevel.OFF, seed=seed, cache=cache)
     results = sim.simulate(duration_minutes=duration_minutes, deck=deck)
 
     if verbose:
@@ -11,20 +11,25 @@ Generates interactive charts for:
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from simulator.analysis.timeline import SimulationTimeline, as_timeline
+from simulator.core.event_log import EVENT_TYPE_CODES
 
-def create_progression_chart(results: dict, title: str = "Simulation Progression") -> go.Figure:
+
+def create_progression_chart(
+    results: dict | SimulationTimeline, title: str = "Simulation Progression"
+) -> go.Figure:
     """Create interactive progression curve chart showing essence and rate over time.
     
     Args:
-        results: Simulation results from CombatSimulator
+        results: Simulation results from CombatSimulator (or their timeline)
         title: Chart title
         
     Returns:
         Plotly figure with dual-axis progression chart
     """
-    state_history = results.get("state_history", [])
+    timeline = as_timeline(results)
 
-    if not state_history:
+    if not timeline.state_history:
         fig = go.Figure()
         fig.add_annotation(
             text="No state history data available",
@@ -37,9 +42,9 @@ def create_progression_chart(results: dict, title: str = "Simulation Progression
         return fig
 
     # Extract time series data
-    times = [s["time_minutes"] for s in state_history]
-    essence = [s["essence"] for s in state_history]
-    essence_rate = [s["player_essence_rate"] for s in state_history]
+    times = timeline.state_times / 60
+    essence = timeline.state_series("essence")
+    essence_rate = timeline.state_series("player_essence_rate")
 
     # Create figure with dual y-axes
     fig = make_subplots(
@@ -79,7 +84,7 @@ def create_progression_chart(results: dict, title: str = "Simulation Progression
     )
 
     # Add pack affordable markers
-    pack_times = results.get("pack_affordable_times", {})
+    pack_times = timeline.results.get("pack_affordable_times", {})
     pack_costs = {1: 40_000, 2: 100_000, 3: 250_000, 4: 625_000}
 
     for pack_num, pack_time in pack_times.items():
@@ -112,18 +117,18 @@ def create_progression_chart(results: dict, title: str = "Simulation Progression
     return fig
 
 
-def create_combat_stats_chart(results: dict) -> go.Figure:
+def create_combat_stats_chart(results: dict | SimulationTimeline) -> go.Figure:
     """Create chart showing combat power accumulation over time.
     
     Args:
-        results: Simulation results from CombatSimulator
+        results: Simulation results from CombatSimulator (or their timeline)
         
     Returns:
         Plotly figure with combat stats over time
     """
-    state_history = results.get("state_history", [])
+    timeline = as_timeline(results)
 
-    if not state_history:
+    if not timeline.state_history:
         fig = go.Figure()
         fig.add_annotation(
             text="No state history data available",
@@ -135,10 +140,10 @@ def create_combat_stats_chart(results: dict) -> go.Figure:
         )
         return fig
 
-    times = [s["time_minutes"] for s in state_history]
-    attack = [s["player_attack"] for s in state_history]
-    defense = [s["player_defense"] for s in state_history]
-    enemies = [s["enemies_defeated"] for s in state_history]
+    times = timeline.state_times / 60
+    attack = timeline.state_series("player_attack")
+    defense = timeline.state_series("player_defense")
+    enemies = timeline.state_series("enemies_defeated")
 
     fig = make_subplots(
         rows=2,
@@ -243,17 +248,18 @@ def create_deck_composition_chart(deck: object) -> go.Figure:
     return fig
 
 
-def create_event_timeline(results: dict, max_events: int = 100) -> go.Figure:
+def create_event_timeline(results: dict | SimulationTimeline, max_events: int = 100) -> go.Figure:
     """Create event timeline visualization.
     
     Args:
-        results: Simulation results
+        results: Simulation results (or their timeline)
         max_events: Maximum number of events to display
         
     Returns:
         Plotly figure with event timeline
     """
-    events = results.get("events", [])
+    timeline = as_timeline(results)
+    events = timeline.events
 
     if not events:
         fig = go.Figure()
@@ -267,15 +273,15 @@ def create_event_timeline(results: dict, max_events: int = 100) -> go.Figure:
         )
         return fig
 
-    # Filter to important events only
+    # Filter to important events only (row indices into the columnar log)
     important_types = ["enemy_spawn", "victory", "pack_affordable"]
-    filtered_events = [e for e in events if e["type"] in important_types]
+    filtered_rows = timeline.indices(*important_types)
 
     # Limit to max_events
-    if len(filtered_events) > max_events:
+    if len(filtered_rows) > max_events:
         # Sample evenly
-        step = len(filtered_events) // max_events
-        filtered_events = filtered_events[::step]
+        step = len(filtered_rows) // max_events
+        filtered_rows = filtered_rows[::step]
 
     # Color mapping
     colors = {
@@ -285,28 +291,26 @@ def create_event_timeline(results: dict, max_events: int = 100) -> go.Figure:
         "draw": "#94A3B8",
     }
 
-    # Create scatter plot
-    times = [e["time_minutes"] for e in filtered_events]
-    types = [e["type"] for e in filtered_events]
-    event_colors = [colors.get(t, "#94A3B8") for t in types]
+    times_minutes = events.times / 60
+    filtered_codes = events.type_codes[filtered_rows]
 
     fig = go.Figure()
 
     for event_type in important_types:
-        type_events = [e for e in filtered_events if e["type"] == event_type]
-        if not type_events:
+        type_rows = filtered_rows[filtered_codes == EVENT_TYPE_CODES[event_type]]
+        if len(type_rows) == 0:
             continue
 
         fig.add_trace(
             go.Scatter(
-                x=[e["time_minutes"] for e in type_events],
-                y=[event_type] * len(type_events),
+                x=times_minutes[type_rows],
+                y=[event_type] * len(type_rows),
                 mode="markers",
                 name=event_type.replace("_", " ").title(),
                 marker=dict(size=8, color=colors[event_type]),
                 hovertemplate="<b>%{text}</b><br>Time: %{x:.2f} min<extra></extra>",
                 text=[
-                    f"{e['type']}: {e['data']}" for e in type_events
+                    f"{event_type}: {events.row(int(row))['data']}" for row in type_rows
                 ],
             )
         )
@@ -322,11 +326,13 @@ def create_event_timeline(results: dict, max_events: int = 100) -> go.Figure:
     return fig
 
 
-def save_all_charts(results: dict, deck: object, output_dir: str = "output") -> list[str]:
+def save_all_charts(
+    results: dict | SimulationTimeline, deck: object, output_dir: str = "output"
+) -> list[str]:
     """Generate and save all visualization charts.
     
     Args:
-        results: Simulation results
+        results: Simulation results (or their timeline)
         deck: Deck object
         output_dir: Output directory for HTML files
         
@@ -338,15 +344,16 @@ def save_all_charts(results: dict, deck: object, output_dir: str = "output") ->
     os.makedirs(output_dir, exist_ok=True)
 
     saved_files = []
+    timeline = as_timeline(results)  # Indexed once, shared by every chart
 
     # Progression chart
-    fig = create_progression_chart(results)
+    fig = create_progression_chart(timeline)
     filepath = os.path.join(output_dir, "progression.html")
     fig.write_html(filepath)
     saved_files.append(filepath)
 
     # Combat stats chart
-    fig = create_combat_stats_chart(results)
+    fig = create_combat_stats_chart(timeline)
     filepath = os.path.join(output_dir, "combat_stats.html")
     fig.write_html(filepath)
     saved_files.append(filepath)
@@ -358,7 +365,7 @@ def save_all_charts(results: dict, deck: object, output_dir: str = "output") ->
     saved_files.append(filepath)
 
     # Event timeline
-    fig = create_event_timeline(results)
+    fig = create_event_timeline(timeline)
     filepath = os.path.join(output_dir, "event_timeline.html")
     fig.write_html(filepath)
     saved_files.append(filepath)
@@ -19,6 +19,10 @@ console = Console()
 def validate(
     duration: int = typer.Option(30, "--duration", "-t", help="Simulation duration (minutes)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    seed: int | None = typer.Option(None, "--seed", "-s", help="Shuffle seed (default: random)"),
+    cache: bool = typer.Option(
+        False, "--cache/--no-cache", help="Reuse/store seeded runs in the on-disk run cache"
+    ),
 ) -> None:
     """Validate Session 1.3 baseline numbers.
     
@@ -26,6 +30,7 @@ def validate(
     to ensure generator rates, pack timing, and enemy scaling are correct.
     """
     from simulator.analysis.validation import run_baseline_validation
+    from simulator.core.run_cache import RunCache
     
     console.print(
         Panel.fit(
@@ -38,7 +43,12 @@ def validate(
     console.print("[yellow]Running simulation...[/yellow]\n")
     
     try:
-        report = run_baseline_validation(duration_minutes=duration, verbose=verbose)
+        report = run_baseline_validation(
+            duration_minutes=duration,
+            verbose=verbose,
+            seed=seed,
+            cache=RunCache() if cache else None,
+        )
         
         if report["overall_passed"]:
             console.print("\n[bold green]VALIDATION PASSED[/bold green]")
@@ -63,15 +73,28 @@ def combat(
         help="Output directory for results and charts",
     ),
     save_charts: bool = typer.Option(True, "--charts/--no-charts", help="Generate visualization charts"),
+    engine: str = typer.Option(
+        "stepped", "--engine", "-e", help="Simulation engine (stepped, event, resolved)"
+    ),
+    seed: int | None = typer.Option(None, "--seed", "-s", help="Shuffle seed (default: random)"),
+    run_index: int = typer.Option(
+        0, "--run-index", help="Run index within the seed (replays a montecarlo run)"
+    ),
+    cache: bool = typer.Option(
+        False, "--cache/--no-cache", help="Reuse/store seeded runs in the on-disk run cache"
+    ),
+    archive: Path | None = typer.Option(
+        None, "--archive", help="Save the results archive (typed columns, e.g. run.simrun) here"
+    ),
 ) -> None:
     """Run combat simulation with starter deck.
     
     Simulates card draw, power accumulation, enemy intervals,
     and resource generation over the specified duration.
     """
-    from simulator.core.cards import STARTER_DECK_CARDS
     from simulator.core.combat import CombatSimulator
-    from simulator.core.deck import Deck
+    from simulator.core.deck import starter_deck
+    from simulator.core.run_cache import RunCache
     from simulator.analysis.visualization import save_all_charts
     
     console.print(
@@ -86,11 +109,17 @@ def combat(
     
     try:
         # Create starter deck
-        deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+        deck = starter_deck()
         
         # Run simulation
-        sim = CombatSimulator()
-        results = sim.simulate(duration_minutes=duration, deck=deck)
+        sim = CombatSimulator(seed=seed, run_index=run_index, cache=RunCache() if cache else None)
+        # The resolved engine skips per-tick events, so only milestones are recorded
+        results = sim.simulate(
+            duration_minutes=duration,
+            deck=deck,
+            engine=engine,
+            record_level="milestones" if engine == "resolved" else None,
+        )
         
         # Display results
         console.print("[bold green]Simulation Complete![/bold green]\n")
@@ -107,6 +136,7 @@ def combat(
         table.add_row("Player HP", f"{results['player_hp']:.0f}/{results['player_max_hp']:.0f}")
         table.add_row("Player Deaths", f"{results['player_deaths']}")
         table.add_row("Furthest Enemy", f"{results['furthest_enemy']}")
+        table.add_row("Seed", f"{results['seed']} (run {results['run_index']})")
         
         console.print(table)
         
@@ -116,6 +146,10 @@ def combat(
             for pack_num, time in sorted(results['pack_affordable_times'].items()):
                 console.print(f"  Pack {pack_num}: [green]{time:.1f}[/green] minutes")
         
+        if archive is not None:
+            results.save(archive)
+            console.print(f"\n[green]Saved results archive to {archive}/[/green]")
+
         # Save charts
         if save_charts:
             output_dir = output or Path("output")
@@ -128,6 +162,316 @@ def combat(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def montecarlo(
+    runs: int = typer.Option(1000, "--runs", "-n", help="Number of seeded simulations"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", help="Worker processes (default: CPU count)"
+    ),
+    seed: int = typer.Option(
+        0, "--seed", "-s", help="Base seed (run i replays with sim combat --seed S --run-index i)"
+    ),
+    duration: int = typer.Option(30, "--duration", "-t", help="Simulation duration (minutes)"),
+    engine: str = typer.Option(
+        "event", "--engine", "-e", help="Simulation engine (stepped, event, resolved, batch)"
+    ),
+    chunk_size: int | None = typer.Option(
+        None, "--chunk-size", help="Runs per worker task (default: ~4 tasks per worker)"
+    ),
+) -> None:
+    """Run many seeded simulations and report outcome distributions.
+
+    Shards seeds across a process pool and prints mean/p5/p50/p95 for
+    pack times, enemies defeated, deaths and furthest enemy, so balance
+    changes can be told apart from shuffle luck.
+    """
+    import time
+
+    from simulator.analysis.montecarlo import SUMMARY_METRICS, run_monte_carlo
+
+    console.print(
+        Panel.fit(
+            f"[bold cyan]Monte Carlo Simulation ({runs:,} runs x {duration} minutes)[/bold cyan]",
+            border_style="cyan",
+        )
+    )
+
+    try:
+        start = time.perf_counter()
+        report = run_monte_carlo(
+            runs=runs,
+            workers=workers,
+            seed=seed,
+            duration_minutes=duration,
+            engine=engine,
+            chunk_size=chunk_size,
+        )
+        elapsed = time.perf_counter() - start
+
+        console.print(
+            f"[green]Completed {runs:,} runs in {elapsed:.1f}s "
+            f"({report['workers']} workers, {engine} engine)[/green]\n"
+        )
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Metric", style="cyan")
+        for column in ["Mean", "P5", "P50", "P95", "Reached"]:
+            table.add_column(column, justify="right")
+
+        stats = report["stats"]
+        pack_keys = [key for key in stats if key.startswith("pack_")]
+        for key in sorted(pack_keys, key=lambda k: int(k.removeprefix("pack_"))):
+            s = stats[key]
+            table.add_row(
+                f"Pack {key.removeprefix('pack_')} (min)",
+                f"{s['mean']:.1f}",
+                f"{s['p5']:.1f}",
+                f"{s['p50']:.1f}",
+                f"{s['p95']:.1f}",
+                f"{s['reached'] * 100:.0f}%",
+            )
+        for key, label in SUMMARY_METRICS:
+            s = stats[key]
+            table.add_row(
+                label,
+                f"{s['mean']:,.1f}",
+                f"{s['p5']:,.0f}",
+                f"{s['p50']:,.0f}",
+                f"{s['p95']:,.0f}",
+                "",
+            )
+
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1) from e
+
+
+@app.command()
+def sweep(
+    param: list[str] = typer.Option(
+        ..., "--param", "-p", help="Balance-config key, dotted (repeat for a grid)"
+    ),
+    values: list[str] = typer.Option(
+        ..., "--values", "-V", help="Comma-separated values, one --values per --param"
+    ),
+    runs: int = typer.Option(100, "--runs", "-n", help="Seeded simulations per variant"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", help="Worker processes (default: CPU count)"
+    ),
+    seed: int = typer.Option(0, "--seed", "-s", help="Base seed (shared by every variant)"),
+    duration: int = typer.Option(30, "--duration", "-t", help="Simulation duration (minutes)"),
+    engine: str = typer.Option(
+        "event", "--engine", "-e", help="Simulation engine (stepped, event, resolved)"
+    ),
+    chunk_size: int | None = typer.Option(
+        None, "--chunk-size", help="Runs per worker task (default: ~4 tasks per worker)"
+    ),
+    output: Path = typer.Option(
+        Path("output/sweep.csv"), "--output", "-o", help="Results table (CSV, one row per run)"
+    ),
+    reuse: bool = typer.Option(
+        True, "--reuse/--fresh", help="Reuse cells already in the output table"
+    ),
+) -> None:
+    """Sweep balance-config values and compare seeded outcome distributions.
+
+    Every combination of the given values is applied as an in-memory
+    overlay on balance-config.json and run with the same seeds, e.g.
+    sim sweep -p enemy_scaling.hp_formulas.act_1.formula
+    -V "20 + (n - 1) * 110,20 + (n - 1) * 130" -n 200
+    """
+    import time
+
+    from simulator.analysis.sweep import (
+        parse_sweep_values,
+        read_sweep_table,
+        run_sweep,
+        write_sweep_table,
+    )
+
+    if len(param) != len(values):
+        console.print("[bold red]Error:[/bold red] Give one --values list per --param")
+        raise typer.Exit(code=1)
+    params = {key: parse_sweep_values(text) for key, text in zip(param, values, strict=True)}
+    n_variants = 1
+    for candidates in params.values():
+        n_variants *= len(candidates)
+
+    console.print(
+        Panel.fit(
+            f"[bold cyan]Parameter Sweep ({n_variants} variants x {runs:,} runs x "
+            f"{duration} minutes)[/bold cyan]",
+            border_style="cyan",
+        )
+    )
+
+    try:
+        start = time.perf_counter()
+        report = run_sweep(
+            params,
+            runs=runs,
+            workers=workers,
+            seed=seed,
+            duration_minutes=duration,
+            engine=engine,
+            chunk_size=chunk_size,
+            previous=read_sweep_table(output) if reuse else None,
+        )
+        elapsed = time.perf_counter() - start
+        write_sweep_table(output, report["rows"])
+
+        console.print(
+            f"[green]Simulated {report['computed']:,} runs in {elapsed:.1f}s "
+            f"(reused {report['reused']:,}); table saved to {output}[/green]\n"
+        )
+
+        table = Table(show_header=True, header_style="bold magenta")
+        for key in params:
+            table.add_column(key.rsplit(".", 1)[-1], style="cyan")
+        for column in ["Enemies", "Furthest", "Deaths"]:
+            table.add_column(f"{column} (mean)", justify="right")
+        pack_keys = sorted(
+            {key for stats in report["stats"] for key in stats if key.startswith("pack_")},
+            key=lambda k: int(k.removeprefix("pack_")),
+        )
+        for key in pack_keys:
+            table.add_column(f"Pack {key.removeprefix('pack_')} p50 (min)", justify="right")
+
+        for overrides, stats in zip(report["variants"], report["stats"], strict=True):
+            cells = [str(value) for value in overrides.values()]
+            cells += [
+                f"{stats[key]['mean']:,.1f}"
+                for key in ("enemies_defeated", "furthest_enemy", "player_deaths")
+            ]
+            for key in pack_keys:
+                pack = stats.get(key)
+                cells.append(
+                    f"{pack['p50']:.1f} ({pack['reached'] * 100:.0f}%)" if pack else "-"
+                )
+            table.add_row(*cells)
+
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1) from e
+
+
+@app.command()
+def solve(
+    metric: str = typer.Argument(
+        ..., help="Target metric: pack_1..pack_3, enemy_50, enemy_60 or defeat_rate"
+    ),
+    param: str = typer.Option(..., "--param", "-p", help="Balance-config key to solve for"),
+    low: float = typer.Option(..., "--low", help="Lower end of the bracket"),
+    high: float = typer.Option(..., "--high", help="Upper end of the bracket"),
+    target: float | None = typer.Option(
+        None, "--target", help="Target value (default: the baseline validation target)"
+    ),
+    tolerance: float | None = typer.Option(
+        None, "--tolerance", help="Accepted distance from the target (default: 1% of it)"
+    ),
+    template: str | None = typer.Option(
+        None,
+        "--template",
+        help='Config value with {x} for the candidate, e.g. "20 + (n - 1) * {x}"',
+    ),
+    method: str = typer.Option("brent", "--method", "-m", help="Root finder (brent, bisect)"),
+    runs: int = typer.Option(32, "--runs", "-n", help="Initial seeded runs per evaluation"),
+    max_runs: int = typer.Option(1024, "--max-runs", help="Largest batch per evaluation"),
+    max_iterations: int = typer.Option(30, "--max-iterations", help="Evaluations in the bracket"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", help="Worker processes (default: CPU count)"
+    ),
+    seed: int = typer.Option(0, "--seed", "-s", help="Base seed (shared by every evaluation)"),
+    duration: float | None = typer.Option(
+        None, "--duration", "-t", help="Simulation duration (default: twice a time target)"
+    ),
+    engine: str = typer.Option(
+        "event", "--engine", "-e", help="Simulation engine (stepped, event, resolved)"
+    ),
+) -> None:
+    """Find the balance-config value that puts a baseline metric on target.
+
+    Runs Brent's method (or bisection) over the bracket; every evaluation
+    is a Monte Carlo batch on the same seeds, grown until its confidence
+    interval settles the comparison with the target, e.g.
+    sim solve pack_1 -p pack_costs.Arcane_Pack.1 --low 20000 --high 80000
+    """
+    import time
+
+    from simulator.analysis.solve import run_solve
+
+    console.print(
+        Panel.fit(
+            f"[bold cyan]Balance Solver ({metric} via {param})[/bold cyan]", border_style="cyan"
+        )
+    )
+
+    try:
+        start = time.perf_counter()
+        report = run_solve(
+            metric,
+            param,
+            low,
+            high,
+            target=target,
+            tolerance=tolerance,
+            template=template,
+            method=method,
+            runs=runs,
+            max_runs=max_runs,
+            max_iterations=max_iterations,
+            workers=workers,
+            seed=seed,
+            duration_minutes=duration,
+            engine=engine,
+        )
+        elapsed = time.perf_counter() - start
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("#", justify="right")
+        table.add_column(param.rsplit(".", 1)[-1], justify="right", style="cyan")
+        table.add_column(f"{metric} (mean)", justify="right")
+        table.add_column("CI +/-", justify="right")
+        table.add_column("Runs", justify="right")
+        table.add_column("Reached", justify="right")
+        for i, evaluation in enumerate(report["evaluations"], 1):
+            table.add_row(
+                str(i),
+                f"{evaluation['value']:.6g}",
+                f"{evaluation['mean']:.3f}",
+                f"{evaluation['half_width']:.3f}",
+                f"{evaluation['runs']:,}",
+                f"{evaluation['reached'] * 100:.0f}%",
+            )
+        console.print(table)
+
+        console.print(
+            f"\n[yellow]Simulated {report['simulated']:,} runs in {elapsed:.1f}s "
+            f"({report['method']}, stopped on {report['reason']})[/yellow]"
+        )
+        summary = (
+            f"{param} = {report['config_value']}\n"
+            f"{metric} = {report['mean']:.3f} +/- {report['half_width']:.3f} "
+            f"(target {report['target']:g} +/- {report['tolerance']:.3g}, "
+            f"{report['confidence'] * 100:.0f}% CI over {report['runs']:,} runs)"
+        )
+        if report["converged"]:
+            console.print(f"[bold green]Solved:[/bold green] {summary}")
+        else:
+            console.print(f"[bold yellow]Not within tolerance:[/bold yellow] {summary}")
+            raise typer.Exit(code=1)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1) from e
+
+
 @app.command()
 def analyze(
     deck: Path = typer.Argument(..., help="Path to deck JSON file"),
@@ -198,37 +542,69 @@ def report(
 @app.command()
 def live(
     duration: int = typer.Option(30, "--duration", "-t", help="Simulation duration (minutes)"),
-    speed: int = typer.Option(1, "--speed", "-s", help="Initial speed multiplier (1, 2, 5, 10)"),
+    speed: str = typer.Option(
+        "1", "--speed", "-s", help="Initial speed multiplier (e.g. 1, 10, 1000, or 'max')"
+    ),
     no_pause: bool = typer.Option(False, "--no-pause", help="Disable auto-pause on milestones"),
+    export: Path | None = typer.Option(
+        None, "--export", help="Record the replay to an asciicast file instead of playing it"
+    ),
+    fps: float = typer.Option(
+        10.0, "--fps", help="Frames per second of the recording (with --export)"
+    ),
 ) -> None:
     """Run live terminal simulation with real-time visualization.
     
     Watch the simulation unfold in real-time with card draws, enemy spawns,
     and combat resolution. Control playback speed and step through events.
     
+    With --export, nothing is shown: the replay is rendered headless at
+    --speed and --fps and written to an asciicast v2 file
+    (play it with `asciinema play FILE`).
+    
     Controls:
-        1-4        Set speed (1x, 2x, 5x, 10x)
+        1-7        Set speed (1x, 2x, 5x, 10x, 100x, 1000x, max)
         Space      Pause/Resume
         N          Step forward (when paused)
         Q or Esc   Quit to summary
     """
-    from simulator.core.cards import STARTER_DECK_CARDS
-    from simulator.core.deck import Deck
+    from simulator.core.deck import starter_deck
     from simulator.visualization import LiveViewer
+    from simulator.visualization.event_player import parse_speed
     
     # Validate speed
-    if speed not in [1, 2, 5, 10]:
-        console.print(f"[red]Invalid speed: {speed}. Must be 1, 2, 5, or 10[/red]")
-        raise typer.Exit(code=1)
+    try:
+        initial_speed = parse_speed(speed)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from e
     
     try:
         # Create starter deck
-        deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+        deck = starter_deck()
+        
+        # Headless recording
+        if export is not None:
+            from simulator.visualization.cast_export import export_cast
+            from simulator.visualization.event_player import format_speed
+            
+            console.print(
+                f"[yellow]Recording {duration}-minute replay at {format_speed(initial_speed)}, "
+                f"{fps:g} fps...[/yellow]"
+            )
+            recording = export_cast(
+                export, deck, duration_minutes=duration, speed=initial_speed, fps=fps
+            )
+            console.print(
+                f"[green]Saved {recording.frames:,} frames ({recording.cast_seconds:.0f}s) "
+                f"to {recording.path}[/green]"
+            )
+            return
         
         # Create and run live viewer
         viewer = LiveViewer(
             duration_minutes=duration,
-            initial_speed=speed,
+            initial_speed=initial_speed,
             auto_pause_milestones=not no_pause,
         )
         
@@ -272,10 +648,9 @@ def info() -> None:
     console.print(table)
     
     # Quick stats
-    from simulator.core.cards import STARTER_DECK_CARDS
-    from simulator.core.deck import Deck
+    from simulator.core.deck import starter_deck
     
-    deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+    deck = starter_deck()
     
     console.print("\n[bold cyan]Starter Deck Info:[/bold cyan]")
     console.print(f"  Cards: {deck.size}")
@@ -290,6 +665,7 @@ def info() -> None:
     console.print("[dim]Run [cyan]sim live[/cyan] for real-time simulation view[/dim]")
     console.print("[dim]Run [cyan]sim validate[/cyan] to test baseline numbers[/dim]")
     console.print("[dim]Run [cyan]sim combat[/cyan] to run a simulation[/dim]")
+    console.print("[dim]Run [cyan]sim montecarlo[/cyan] to run many seeded simulations[/dim]")
     console.print("[dim]Run [cyan]sim --help[/cyan] to see all commands[/dim]")
 
 
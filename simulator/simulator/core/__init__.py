@@ -1,7 +1,7 @@
 """Core game logic modules."""
 
 from simulator.core.cards import Card, CardType, GeneratorType
-from simulator.core.deck import Deck
+from simulator.core.deck import Deck, starter_deck
 
-__all__ = ["Card", "CardType", "GeneratorType", "Deck"]
+__all__ = ["Card", "CardType", "GeneratorType", "Deck", "starter_deck"]
 
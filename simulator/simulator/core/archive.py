@@ -0,0 +1,282 @@
+"""On-disk archive of simulation results (typed .npy columns + JSON header).
+
+An archive is a directory holding one or more runs:
+
+    run.simrun/
+        header.json           # Format, per-run scalars and row offsets
+        events/<column>.npy   # Event log columns, every run concatenated
+        state/<column>.npy    # State history columns
+        fights/<column>.npy   # Fight log columns
+
+Each column is a plain .npy file, so load_results() memory-maps it: a
+notebook can open a large archive of many runs and slice one column
+(or one run) while only the pages it touches are read. Rows of run i are
+offsets[table][i]:offsets[table][i + 1] of each of that table's columns.
+
+SimulationResult.save() and SimulationResult.load() cover the one-run
+case; save_results() and load_results() take many runs.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+from simulator.core.event_log import COLUMNS, EventLog
+from simulator.core.fight_log import FIGHT_COLUMNS, FightLog
+from simulator.core.results import SimulationResult
+from simulator.core.state_history import STATE_COLUMNS, StateHistory
+
+# Header "format" written by this version
+ARCHIVE_FORMAT = 2  # 2: pack costs in the float "value" event column
+
+# Tables of a result: directory name -> column dtypes
+ARCHIVE_TABLES: dict[str, dict[str, type]] = {
+    "events": COLUMNS,
+    "state": STATE_COLUMNS,
+    "fights": FIGHT_COLUMNS,
+}
+
+# Scalar SimulationResult fields stored in each run's header
+RESULT_SCALARS = (
+    "duration_minutes",
+    "final_essence",
+    "final_shards",
+    "cards_drawn",
+    "enemies_defeated",
+    "enemies_encountered",
+    "total_damage_dealt",
+    "total_damage_taken",
+    "combat_ticks",
+    "player_hp",
+    "player_max_hp",
+    "player_attack",
+    "player_defense",
+    "player_essence_rate",
+    "player_deaths",
+    "furthest_enemy",
+    "record_level",
+    "seed",
+    "run_index",
+    "status",
+)
+
+
+def to_json(value: Any) -> Any:
+    """JSON fallback for NumPy scalars (json.dumps default=)."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def result_tables(result: SimulationResult) -> dict[str, dict[str, np.ndarray]]:
+    """Columns of a result's tables (see ARCHIVE_TABLES), zero-copy where possible."""
+    return {
+        "events": result.events.columns(),
+        "state": result.state_history.columns(),
+        "fights": result.fights.columns(),
+    }
+
+
+def result_header(result: SimulationResult) -> dict[str, Any]:
+    """Everything about a result except its table columns, as JSON-ready values.
+
+    Args:
+        result: Simulation result
+
+    Returns:
+        Header dict (read back by result_from_columns)
+    """
+    state = result.state_history
+    return {
+        "scalars": {name: getattr(result, name) for name in RESULT_SCALARS},
+        "pack_affordable_times": sorted(result.pack_affordable_times.items()),
+        "cards": result.events.cards,
+        "state": {
+            "capacity": state.capacity,
+            "tolerances": state.tolerances,
+            "max_interval": state.max_interval,
+            "offered": state.offered,
+            "dropped": state.dropped,
+        },
+        "fights_run": result.fights.run,
+    }
+
+
+def result_from_columns(
+    header: dict[str, Any], tables: dict[str, dict[str, np.ndarray]]
+) -> SimulationResult:
+    """Rebuild a result from its header and table columns (arrays are not copied).
+
+    Args:
+        header: Dict from result_header (after a JSON round trip)
+        tables: Table name -> column name -> array, for every table in ARCHIVE_TABLES
+
+    Returns:
+        SimulationResult over the given arrays
+    """
+    state = header["state"]
+    state_history = StateHistory.from_columns(
+        tables["state"],
+        capacity=state["capacity"],
+        tolerances=state["tolerances"],
+        max_interval=state["max_interval"],
+    )
+    state_history.offered = state["offered"]
+    state_history.dropped = state["dropped"]
+
+    return SimulationResult(
+        **header["scalars"],
+        fights=FightLog.from_columns(tables["fights"], run=header["fights_run"]),
+        events=EventLog.from_columns(tables["events"], header["cards"]),
+        state_history=state_history,
+        pack_affordable_times={int(pack): time for pack, time in header["pack_affordable_times"]},
+    )
+
+
+def save_results(path: Path | str, results: Iterable[SimulationResult]) -> Path:
+    """Write runs to an archive directory (columns concatenated across runs).
+
+    header.json is written last, so a directory without one is an
+    incomplete archive.
+
+    Args:
+        path: Archive directory (created if needed; existing columns are replaced)
+        results: Runs to store, in order
+
+    Returns:
+        Archive directory
+    """
+    path = Path(path)
+    results = list(results)
+    tables = [result_tables(result) for result in results]
+    (path / "header.json").unlink(missing_ok=True)  # Incomplete until rewritten
+
+    offsets: dict[str, list[int]] = {}
+    for table, columns in ARCHIVE_TABLES.items():
+        (path / table).mkdir(parents=True, exist_ok=True)
+        sizes = [len(next(iter(run[table].values()))) for run in tables]
+        offsets[table] = [0, *np.cumsum(sizes, dtype=np.int64).tolist()]
+        for name, dtype in columns.items():
+            parts = [run[table][name] for run in tables]
+            np.save(path / table / f"{name}.npy", np.concatenate([np.zeros(0, dtype), *parts]))
+
+    header = {
+        "format": ARCHIVE_FORMAT,
+        "offsets": offsets,
+        "runs": [result_header(result) for result in results],
+    }
+    (path / "header.json").write_text(json.dumps(header, default=to_json), encoding="utf-8")
+    return path
+
+
+def load_results(path: Path | str, mmap: bool = True) -> "ResultArchive":
+    """Open an archive written by save_results.
+
+    Args:
+        path: Archive directory
+        mmap: Memory-map the columns (False: read them into memory)
+
+    Returns:
+        ResultArchive over the archive's runs
+    """
+    return ResultArchive(path, mmap=mmap)
+
+
+class ResultArchive:
+    """Runs stored in an archive directory, with lazily opened columns.
+
+    Indexing gives SimulationResults whose tables are views into the
+    (memory-mapped) columns; column() gives one column across every run.
+
+    Attributes:
+        path: Archive directory
+        headers: Per-run headers (scalars, pack times, table metadata)
+        offsets: Table name -> run row offsets (len(archive) + 1 entries)
+    """
+
+    def __init__(self, path: Path | str, mmap: bool = True) -> None:
+        """Read an archive's header (columns are opened on first use).
+
+        Args:
+            path: Archive directory
+            mmap: Memory-map the columns (False: read them into memory)
+
+        Raises:
+            FileNotFoundError: If the directory has no header.json
+            ValueError: If the archive was written in another format
+        """
+        self.path = Path(path)
+        header = json.loads((self.path / "header.json").read_text(encoding="utf-8"))
+        if header.get("format") != ARCHIVE_FORMAT:
+            raise ValueError(f"Unsupported archive format: {header.get('format')}")
+
+        self.headers: list[dict[str, Any]] = header["runs"]
+        self.offsets = {
+            table: np.asarray(offsets, dtype=np.int64)
+            for table, offsets in header["offsets"].items()
+        }
+        self._mmap_mode: Literal["r"] | None = "r" if mmap else None
+        self._columns: dict[tuple[str, str], np.ndarray] = {}
+
+    def column(self, table: str, name: str) -> np.ndarray:
+        """One column of a table across every run (memory-mapped, read-only).
+
+        Args:
+            table: "events", "state" or "fights"
+            name: Column name (see ARCHIVE_TABLES)
+
+        Returns:
+            Array with the rows of every run, in run order
+        """
+        key = (table, name)
+        column = self._columns.get(key)
+        if column is None:
+            if name not in ARCHIVE_TABLES[table]:
+                raise KeyError(f"Unknown {table} column: {name}")
+            column = np.load(self.path / table / f"{name}.npy", mmap_mode=self._mmap_mode)
+            self._columns[key] = column
+        return column
+
+    def rows(self, table: str, index: int) -> slice:
+        """Row range of one run within a table's columns."""
+        offsets = self.offsets[table]
+        return slice(int(offsets[index]), int(offsets[index + 1]))
+
+    def scalars(self, name: str) -> np.ndarray:
+        """One scalar stat (e.g. "final_essence") for every run.
+
+        Args:
+            name: Scalar field (see RESULT_SCALARS)
+
+        Returns:
+            Array aligned with the runs
+        """
+        return np.array([header["scalars"][name] for header in self.headers])
+
+    def __len__(self) -> int:
+        """Number of runs."""
+        return len(self.headers)
+
+    def __getitem__(self, index: int) -> SimulationResult:
+        """One run, with its tables viewing the archive's columns."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("run index out of range")
+        tables = {}
+        for table, columns in ARCHIVE_TABLES.items():
+            rows = self.rows(table, index)
+            tables[table] = {name: self.column(table, name)[rows] for name in columns}
+        return result_from_columns(self.headers[index], tables)
+
+    def __iter__(self) -> Iterator[SimulationResult]:
+        """Iterate over runs."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Short representation."""
+        return f"ResultArchive({self.path}, {len(self)} runs)"
@@ -0,0 +1,178 @@
+"""Balance configuration loaded from game-data/balance-config.json.
+
+DATA OWNERSHIP (Task 2.1.2C):
+All balance values come from balance-config.json. BalanceConfig wraps one
+version of that file: the raw sections, typed accessors for the values the
+simulators read on every run, and tables derived from them (enemy stats,
+pack costs) that are built once per config and shared by every run.
+
+Configs are loaded lazily and cached by file path + modification time, so
+repeated loads are free and an edited file is picked up without restarting
+the process. Several configs (e.g. parameter sweep variants) can be used
+side by side by passing them to the simulators.
+"""
+
+import hashlib
+import json
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from simulator.core.economy import load_pack_costs_from_config
+from simulator.core.enemy_table import EnemyTable
+
+# Default config location (project_root/game-data/balance-config.json)
+DEFAULT_CONFIG_PATH = (
+    Path(__file__).parent.parent.parent.parent / "game-data" / "balance-config.json"
+)
+
+# Loaded configs by resolved path: (mtime_ns, config)
+_CONFIG_CACHE: dict[Path, tuple[int, "BalanceConfig"]] = {}
+
+
+class BalanceConfig:
+    """One balance configuration with its derived tables.
+
+    Instances are treated as read-only once built: simulators share them
+    (and their enemy table) between runs.
+
+    Attributes:
+        data: Raw config sections, as parsed from JSON
+        path: File the config was loaded from (None if built from a dict)
+        starting_hp: Player starting/max HP
+        draw_interval: Seconds between card draws
+        combat_tick_interval: Seconds between combat ticks
+        reshuffle_cooldown: Cooldown after the deck is exhausted (seconds)
+        pack_costs: Arcane pack number -> essence cost
+    """
+
+    def __init__(self, data: dict[str, Any], path: Path | None = None) -> None:
+        """Build config from parsed balance-config.json contents.
+
+        Args:
+            data: Balance configuration dictionary
+            path: File the data was read from, if any
+        """
+        self.data = data
+        self.path = path
+
+        timing = data["combat_timing"]
+        self.starting_hp = float(data["player_stats"]["starting_hp"])
+        self.draw_interval = float(timing["card_draw_interval"])
+        self.combat_tick_interval = float(timing["combat_tick_interval"])
+        self.reshuffle_cooldown = float(timing["reshuffle_cooldown"])
+        self.pack_costs = load_pack_costs_from_config(data)
+
+    @classmethod
+    def load(cls, path: Path | str | None = None) -> "BalanceConfig":
+        """Load a config file, reusing the cached instance if it is unchanged.
+
+        Args:
+            path: Config file (default: game-data/balance-config.json)
+
+        Returns:
+            BalanceConfig for the file's current contents
+
+        Raises:
+            FileNotFoundError: If the config file doesn't exist
+        """
+        config_path = Path(path if path is not None else DEFAULT_CONFIG_PATH).resolve()
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"balance-config.json not found at {config_path}. "
+                "Simulator requires game-data/balance-config.json for all balance values."
+            ) from None
+
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with config_path.open("r", encoding="utf-8") as f:
+            config = cls(json.load(f), path=config_path)
+        _CONFIG_CACHE[config_path] = (mtime, config)
+        return config
+
+    def with_overrides(self, overrides: dict[str, Any]) -> "BalanceConfig":
+        """Build a variant of this config with some values replaced.
+
+        Only the sections along each overridden path are copied; the rest of
+        the data is shared with this config (neither is modified).
+
+        Args:
+            overrides: Dotted key path (e.g. "player_stats.starting_hp", list
+                items by index) -> new value
+
+        Returns:
+            New BalanceConfig (path None)
+
+        Raises:
+            KeyError: If a path does not exist in this config
+        """
+        data = dict(self.data)
+        for key_path, value in overrides.items():
+            keys = key_path.split(".")
+            node = data
+            for depth, key in enumerate(keys):
+                parent = node
+                try:
+                    if isinstance(parent, list):
+                        key = int(key)
+                    child = parent[key]
+                except (KeyError, IndexError, ValueError, TypeError):
+                    raise KeyError(
+                        f"'{'.'.join(keys[: depth + 1])}' not found in balance config"
+                    ) from None
+                if depth == len(keys) - 1:
+                    parent[key] = value
+                else:
+                    node = list(child) if isinstance(child, list) else dict(child)
+                    parent[key] = node
+        return BalanceConfig(data)
+
+    def timing(
+        self,
+        draw_interval: float | None = None,
+        combat_tick_interval: float | None = None,
+        reshuffle_cooldown: float | None = None,
+    ) -> tuple[float, float, float]:
+        """Combat timing, with any given value replacing the config's.
+
+        Args:
+            draw_interval: Seconds between card draws (None: from config)
+            combat_tick_interval: Seconds between combat ticks (None: from config)
+            reshuffle_cooldown: Cooldown after the deck is exhausted (None: from config)
+
+        Returns:
+            (draw_interval, combat_tick_interval, reshuffle_cooldown)
+        """
+        return (
+            self.draw_interval if draw_interval is None else draw_interval,
+            self.combat_tick_interval if combat_tick_interval is None else combat_tick_interval,
+            self.reshuffle_cooldown if reshuffle_cooldown is None else reshuffle_cooldown,
+        )
+
+    @cached_property
+    def enemy_table(self) -> EnemyTable:
+        """Enemy stats for this config (built on first use)."""
+        return EnemyTable(self.data)
+
+    @cached_property
+    def digest(self) -> str:
+        """SHA-256 of the config contents (key order and formatting ignored)."""
+        canonical = json.dumps(self.data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def __repr__(self) -> str:
+        source = self.path if self.path is not None else "<dict>"
+        return f"BalanceConfig({source})"
+
+
+def default_balance_config() -> BalanceConfig:
+    """Get the config from game-data/balance-config.json (cached).
+
+    Returns:
+        Default BalanceConfig
+    """
+    return BalanceConfig.load()
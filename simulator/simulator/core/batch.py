@@ -0,0 +1,343 @@
+"""Vectorized lockstep combat simulation for many runs at once.
+
+Runs the same combat rules as CombatSimulator's event-driven engine, but
+holds every piece of per-run state in NumPy arrays of shape (n_runs,) and
+advances all runs one synchronized tick at a time. Victory, death and
+reshuffle are masked updates, so a tick costs a few dozen array operations
+no matter how many runs are in the batch.
+
+Only aggregate outputs are produced (no event trace or state history):
+final essence, furthest enemy, deaths, pack affordability times and
+per-enemy combat durations. Individual runs are not bit-identical to the
+scalar engine (shuffles come from a NumPy generator), but their
+distributions match.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from simulator.core.balance_config import BalanceConfig, default_balance_config
+from simulator.core.combat import CLOCK_RESOLUTION, run_seed_sequence, shard_reward
+
+if TYPE_CHECKING:
+    from simulator.core.deck import Deck
+
+
+class BatchCombatSimulator:
+    """Lockstep combat engine simulating many seeds at once.
+
+    Mirrors CombatSimulator.simulate(engine="event"): every tick each run
+    draws a card (or waits out its reshuffle cooldown), then fights one
+    combat tick. Essence is integrated exactly between ticks, so pack
+    crossing times are analytic.
+    """
+
+    def __init__(
+        self,
+        draw_interval: float | None = None,
+        combat_tick_interval: float | None = None,
+        reshuffle_cooldown: float | None = None,
+        config: BalanceConfig | None = None,
+    ) -> None:
+        """Initialize batch simulator.
+
+        DATA OWNERSHIP (Task 2.1.2C):
+        If timing values not provided, load from the balance config
+
+        Args:
+            draw_interval: Seconds between card draws (default: from balance config)
+            combat_tick_interval: Seconds between combat ticks (default: from balance config)
+            reshuffle_cooldown: Cooldown after deck exhausts (default: from balance config)
+            config: Balance config (default: game-data/balance-config.json)
+        """
+        self.config = config if config is not None else default_balance_config()
+
+        self.draw_interval, self.combat_tick_interval, self.reshuffle_cooldown = self.config.timing(
+            draw_interval, combat_tick_interval, reshuffle_cooldown
+        )
+
+        pack_costs = self.config.pack_costs
+        self.pack_numbers = np.array(sorted(pack_costs, key=pack_costs.__getitem__))
+        self.pack_costs = np.array([pack_costs[n] for n in self.pack_numbers], dtype=np.float64)
+        # Next-cost lookup with an unreachable sentinel once every pack is reached
+        self._next_costs = np.append(self.pack_costs, np.inf)
+
+        self.starting_hp = self.config.starting_hp
+
+        # Enemy stat lookup tables, indexed by enemy number (index 0 unused)
+        self._enemy_table = self.config.enemy_table
+        self._enemy_hp = self._enemy_table.max_health
+        self._enemy_atk = self._enemy_table.atk_per_tick
+        self._enemy_def = self._enemy_table.def_per_tick
+        self._enemy_shards = np.zeros(1, dtype=np.int64)
+        self._ensure_enemy_table(self._enemy_table.size)
+
+    def _ensure_enemy_table(self, max_enemy: int) -> None:
+        """Extend enemy lookup tables to cover enemy numbers up to `max_enemy`.
+
+        Args:
+            max_enemy: Highest enemy number needed
+        """
+        if max_enemy < len(self._enemy_shards):
+            return
+
+        self._enemy_table.ensure(max_enemy)
+        self._enemy_hp = self._enemy_table.max_health
+        self._enemy_atk = self._enemy_table.atk_per_tick
+        self._enemy_def = self._enemy_table.def_per_tick
+        known = len(self._enemy_shards)
+        self._enemy_shards = np.concatenate(
+            [
+                self._enemy_shards,
+                [shard_reward(n) for n in range(known, len(self._enemy_hp))],
+            ]
+        ).astype(np.int64)
+
+    def _mark_packs(
+        self,
+        pack_times: np.ndarray,
+        next_pack: np.ndarray,
+        time: float,
+        essence: np.ndarray,
+        rate: np.ndarray,
+        end_essence: np.ndarray,
+    ) -> None:
+        """Record first crossing times for pack costs reached in a segment.
+
+        Essence grows linearly from `essence` at `time` to `end_essence`, so
+        the crossing time of each newly reached cost is solved analytically.
+        Costs are sorted, so each run only compares against its next
+        unreached cost.
+
+        Args:
+            pack_times: (n_runs, n_packs) first-reached times in seconds, NaN if unreached
+            next_pack: Index of each run's next unreached cost (updated in place)
+            time: Segment start time (seconds)
+            essence: Essence at segment start, per run
+            rate: Essence rate during the segment, per run
+            end_essence: Essence at segment end, per run
+        """
+        while True:
+            reached = np.flatnonzero(end_essence >= self._next_costs[next_pack])
+            if not len(reached):
+                return
+            index = next_pack[reached]
+            cost = self.pack_costs[index]
+            start = essence[reached]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                crossing = time + (cost - start) / rate[reached]
+            pack_times[reached, index] = np.where(start >= cost, time, crossing)
+            next_pack[reached] += 1
+
+    def simulate(
+        self,
+        duration_minutes: float,
+        deck: "Deck",
+        n_runs: int,
+        seed: int | None = None,
+        run_index: int = 0,
+    ) -> dict[str, Any]:
+        """Simulate `n_runs` independent runs of the same deck.
+
+        Args:
+            duration_minutes: Simulation duration in minutes
+            deck: Deck to simulate with
+            n_runs: Number of runs in the batch
+            seed: Base seed for the batch's shuffle stream
+            run_index: Index of this batch's stream within the seed (see run_seed_sequence)
+
+        Returns:
+            Results dictionary whose per-run values are arrays of shape (n_runs,)
+        """
+        if len(deck.cards) < 8:
+            raise ValueError(f"Deck must have at least 8 cards (has {len(deck.cards)})")
+        if n_runs < 1:
+            raise ValueError("n_runs must be at least 1")
+
+        tick_step = round(self.draw_interval * CLOCK_RESOLUTION)
+        if tick_step <= 0:
+            raise ValueError("draw_interval must be at least one clock tick")
+        end_clock = round(duration_minutes * 60 * CLOCK_RESOLUTION)
+        cooldown_clock = round(self.reshuffle_cooldown * CLOCK_RESOLUTION)
+
+        seed_sequence = run_seed_sequence(seed, run_index)
+        rng = np.random.default_rng(seed_sequence)
+        runs = np.arange(n_runs)
+
+        # Card stats by deck slot, plus an all-zero slot for "no draw this tick"
+        cards = list(deck.cards)
+        deck_size = len(cards)
+        no_card = deck_size
+        card_rate = np.array([max(c.essence_rate, 0.0) for c in cards] + [0.0])
+        card_burst = np.array([max(c.essence_burst, 0) for c in cards] + [0.0])
+        card_attack = np.array([c.attack for c in cards] + [0.0])
+        card_defense = np.array([c.defense for c in cards] + [0.0])
+
+        # Deck state: one shuffled draw order per run (flattened row-major)
+        order = rng.random((n_runs, deck_size)).argsort(axis=1)
+        row_start = runs * deck_size
+        draw_index = np.zeros(n_runs, dtype=np.int64)
+        reshuffling = np.zeros(n_runs, dtype=bool)
+        reshuffle_end = np.zeros(n_runs, dtype=np.int64)
+
+        # Player state
+        essence = np.zeros(n_runs)
+        shards = np.zeros(n_runs, dtype=np.int64)
+        player_hp = np.full(n_runs, self.starting_hp)
+        attack = np.zeros(n_runs)
+        defense = np.zeros(n_runs)
+        essence_rate = np.zeros(n_runs)
+        deaths = np.zeros(n_runs, dtype=np.int64)
+        furthest_enemy = np.zeros(n_runs, dtype=np.int64)
+
+        # Combat state
+        in_combat = np.zeros(n_runs, dtype=bool)
+        enemy_number = np.zeros(n_runs, dtype=np.int64)
+        enemy_hp = np.zeros(n_runs)
+        enemy_ticks = np.zeros(n_runs, dtype=np.int64)
+        combat_start = np.zeros(n_runs, dtype=np.int64)
+
+        # Statistics
+        cards_drawn = np.zeros(n_runs, dtype=np.int64)
+        enemies_defeated = np.zeros(n_runs, dtype=np.int64)
+        enemies_encountered = np.zeros(n_runs, dtype=np.int64)
+        combat_ticks = np.zeros(n_runs, dtype=np.int64)
+        total_combat_time = np.zeros(n_runs)
+        pack_times = np.full((n_runs, len(self.pack_costs)), np.nan)
+        next_pack = np.zeros(n_runs, dtype=np.int64)
+        # Latest clear duration per (run, enemy number); columns grow with the table
+        enemy_durations = np.full((n_runs, 1), np.nan)
+
+        clock = 0
+        while clock < end_clock:
+            # Spawn enemy if none active and player is alive
+            spawning = np.flatnonzero(~in_combat & (player_hp > 0))
+            if len(spawning):
+                enemy_number[spawning] += 1
+                number = enemy_number[spawning]
+                self._ensure_enemy_table(int(number.max()))
+                enemy_hp[spawning] = self._enemy_hp[number]
+                enemy_ticks[spawning] = 0
+                combat_start[spawning] = clock
+                in_combat[spawning] = True
+                enemies_encountered[spawning] += 1
+                furthest_enemy[spawning] = np.maximum(furthest_enemy[spawning], number)
+
+            # Jump to the next tick (or the end of the run), integrating essence
+            target = min(clock + tick_step, end_clock)
+            segment_end = essence + essence_rate * ((target - clock) / CLOCK_RESOLUTION)
+            self._mark_packs(
+                pack_times, next_pack, clock / CLOCK_RESOLUTION, essence, essence_rate, segment_end
+            )
+            essence = segment_end
+            clock = target
+            if clock == end_clock:
+                break
+
+            # Card draw: finished cooldowns reshuffle, exhausted decks start one
+            done = np.flatnonzero(reshuffling & (clock >= reshuffle_end))
+            if len(done):
+                reshuffling[done] = False
+                order[done] = rng.random((len(done), deck_size)).argsort(axis=1)
+                draw_index[done] = 0
+            exhausted = np.flatnonzero(~reshuffling & (draw_index >= deck_size))
+            if len(exhausted):
+                reshuffling[exhausted] = True
+                reshuffle_end[exhausted] = clock + cooldown_clock
+
+            drawing = ~reshuffling
+            slots = np.where(
+                drawing, order.take(row_start + np.minimum(draw_index, deck_size - 1)), no_card
+            )
+            draw_index += drawing
+            cards_drawn += drawing
+            essence_rate += card_rate[slots]
+            essence += card_burst[slots]
+            attack += card_attack[slots]
+            defense += card_defense[slots]
+
+            # Combat tick for runs with an active enemy (masked, full width)
+            enemy_ticks += in_combat
+            combat_ticks += in_combat
+            enemy_attack = self._enemy_atk[enemy_number] * enemy_ticks
+            enemy_defense = self._enemy_def[enemy_number] * enemy_ticks
+            player_damage = np.maximum(attack - enemy_defense, 0) * in_combat
+            enemy_damage = np.maximum(enemy_attack - defense, 0) * in_combat
+            np.maximum(enemy_hp - player_damage, 0, out=enemy_hp)
+            np.maximum(player_hp - enemy_damage, 0, out=player_hp)
+
+            # Victory (checked first, like the scalar engine)
+            won = np.flatnonzero(in_combat & (enemy_hp <= 0))
+            if len(won):
+                number = enemy_number[won]
+                duration = (clock - combat_start[won]) / CLOCK_RESOLUTION
+                enemies_defeated[won] += 1
+                total_combat_time[won] += duration
+                shards[won] += self._enemy_shards[number]
+                if enemy_durations.shape[1] < len(self._enemy_hp):
+                    enemy_durations = _pad_columns(enemy_durations, len(self._enemy_hp))
+                enemy_durations[won, number] = duration
+                attack[won] = 0
+                defense[won] = 0
+                in_combat[won] = False
+
+            # Defeat: respawn at enemy 1 with full HP, stats and essence rate reset
+            lost = np.flatnonzero(in_combat & (player_hp <= 0))
+            if len(lost):
+                deaths[lost] += 1
+                player_hp[lost] = self.starting_hp
+                attack[lost] = 0
+                defense[lost] = 0
+                essence_rate[lost] = 0
+                enemy_number[lost] = 0
+                in_combat[lost] = False
+
+            # Burst essence lands exactly on the tick
+            self._mark_packs(
+                pack_times, next_pack, clock / CLOCK_RESOLUTION, essence, essence_rate, essence
+            )
+
+        combat_count = enemies_defeated
+        enemy_durations = enemy_durations[:, : int(furthest_enemy.max()) + 1]
+        return {
+            "duration_minutes": duration_minutes,
+            "duration_seconds": duration_minutes * 60,
+            "n_runs": n_runs,
+            "seed": seed_sequence.entropy,
+            "run_index": run_index,
+            # Final stats (arrays of shape (n_runs,))
+            "final_essence": essence,
+            "final_shards": shards,
+            "cards_drawn": cards_drawn,
+            "enemies_defeated": enemies_defeated,
+            "enemies_encountered": enemies_encountered,
+            "combat_ticks": combat_ticks,
+            "player_hp": player_hp,
+            "player_essence_rate": essence_rate,
+            "player_deaths": deaths,
+            "furthest_enemy": furthest_enemy,
+            # Combat metrics
+            "avg_combat_duration": np.divide(
+                total_combat_time,
+                combat_count,
+                out=np.zeros(n_runs),
+                where=combat_count > 0,
+            ),
+            "total_combat_time": total_combat_time,
+            "combat_count": combat_count,
+            # Latest clear duration in seconds, indexed [run, enemy_number] (NaN = never cleared)
+            "enemy_durations": enemy_durations,
+            # Pack timing in minutes (NaN = not reached)
+            "pack_affordable_times": {
+                int(pack_num): pack_times[:, i] / 60
+                for i, pack_num in enumerate(self.pack_numbers)
+            },
+        }
+
+
+def _pad_columns(values: np.ndarray, width: int) -> np.ndarray:
+    """Widen a (rows, cols) float array to `width` columns, padding with NaN."""
+    padded = np.full((values.shape[0], width), np.nan)
+    padded[:, : values.shape[1]] = values
+    return padded
@@ -22,27 +22,104 @@ Data Ownership (Task 2.1.2C):
 - NO hardcoded formulas or scaling values
 """
 
-import json
-import random
+import bisect
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import TYPE_CHECKING
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from simulator.core.balance_config import BalanceConfig, default_balance_config
+from simulator.core.economy import PackThresholdTracker
+from simulator.core.enemy_table import EnemyTable
+from simulator.core.event_log import EventLog
+from simulator.core.fight import resolve_fight_arrays
+from simulator.core.fight_log import LOST, UNRESOLVED, WON, FightLog
+from simulator.core.results import SimulationResult
+from simulator.core.run_cache import RunCache, run_key
+from simulator.core.state_history import STATE_HISTORY_CAPACITY, StateHistory
 
 if TYPE_CHECKING:
     from simulator.core.cards import Card
     from simulator.core.deck import Deck
 
 
-# Load balance config at module level (Task 2.1.2C - Data Ownership)
-_BALANCE_CONFIG_PATH = Path(__file__).parent.parent.parent.parent / "game-data" / "balance-config.json"
-try:
-    with open(_BALANCE_CONFIG_PATH, "r", encoding="utf-8") as f:
-        BALANCE_CONFIG = json.load(f)
-except FileNotFoundError:
-    raise FileNotFoundError(
-        f"balance-config.json not found at {_BALANCE_CONFIG_PATH}. "
-        "Simulator requires game-data/balance-config.json for all balance values."
-    )
+def __getattr__(name: str) -> Any:
+    """Lazy module attributes for the default balance config (Task 2.1.2C).
+    
+    BALANCE_CONFIG (raw config dict) and ENEMY_TABLE (its enemy stats) are
+    read from game-data/balance-config.json on first access rather than at
+    import time; see BalanceConfig for loading other configs.
+    """
+    if name == "BALANCE_CONFIG":
+        return default_balance_config().data
+    if name == "ENEMY_TABLE":
+        return default_balance_config().enemy_table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Integer clock used by the event-driven engine (clock ticks per simulated second).
+# All scheduled times are whole milliseconds, so interval comparisons never drift.
+CLOCK_RESOLUTION = 1000
+
+# Simulation engines accepted by CombatSimulator.simulate()
+ENGINES = ("stepped", "event", "resolved")
+
+# "resolved" engine: fights lasting this many ticks are resolved in closed form
+RESOLVE_AFTER_TICKS = 48
+
+
+def run_seed_sequence(seed: int | None, run_index: int = 0) -> np.random.SeedSequence:
+    """Get the seed sequence for one run of a seeded batch.
+    
+    Equivalent to `SeedSequence(seed).spawn(n)[run_index]`, without spawning
+    the siblings, so every run of a 100k-run sweep gets an independent stream
+    and any one of them can be re-created from (seed, run_index) alone.
+    
+    Args:
+        seed: Base seed of the batch (None draws fresh OS entropy)
+        run_index: Index of the run within the batch
+        
+    Returns:
+        SeedSequence for the run's RNG stream
+    """
+    return np.random.SeedSequence(seed, spawn_key=(run_index,))
+
+
+class RecordLevel(IntEnum):
+    """How much of the event trace a simulation records.
+    
+    Each level includes everything recorded by the levels below it:
+    - OFF: No events (aggregate stats and state history only)
+    - MILESTONES: enemy_spawn, victory, death, pack_affordable
+    - FIGHTS: + combat_tick
+    - FULL: + draw, reshuffle (needed by the live viewer)
+    """
+
+    OFF = 0
+    MILESTONES = 1
+    FIGHTS = 2
+    FULL = 3
+
+    @classmethod
+    def parse(cls, value: "RecordLevel | int | str") -> "RecordLevel":
+        """Convert a level name or number to a RecordLevel.
+        
+        Args:
+            value: RecordLevel, integer level, or case-insensitive name ("off", "full", ...)
+            
+        Returns:
+            Matching RecordLevel
+        """
+        if isinstance(value, str):
+            try:
+                return cls[value.upper()]
+            except KeyError:
+                names = ", ".join(level.name.lower() for level in cls)
+                raise ValueError(
+                    f"Unknown record level '{value}' (expected one of {names})"
+                ) from None
+        return cls(value)
 
 
 @dataclass
@@ -51,10 +128,11 @@ class Player:
     
     DATA OWNERSHIP (Task 2.1.2C):
     Default HP value loaded from game-data/balance-config.json
+    (CombatSimulator passes its own config's starting HP)
     """
     
-    current_hp: float = field(default_factory=lambda: BALANCE_CONFIG["player_stats"]["starting_hp"])
-    max_hp: float = field(default_factory=lambda: BALANCE_CONFIG["player_stats"]["starting_hp"])
+    current_hp: float = field(default_factory=lambda: default_balance_config().starting_hp)
+    max_hp: float = field(default_factory=lambda: default_balance_config().starting_hp)
     
     # Combat stats (accumulate during fight, reset per enemy)
     attack: int = 0
@@ -113,11 +191,12 @@ class Enemy:
     combat_ticks_elapsed: int = 0  # Ticks since combat started
 
     @classmethod
-    def spawn(cls, enemy_number: int) -> "Enemy":
+    def spawn(cls, enemy_number: int, enemy_table: EnemyTable | None = None) -> "Enemy":
         """Spawn enemy with scaled stats.
         
         DATA OWNERSHIP (Task 2.1.2C):
         All scaling values loaded from game-data/balance-config.json
+        (precomputed once per config into an EnemyTable)
         
         PER-TICK SCALING SYSTEM (Session 2.1.2B):
         - All enemies attack from tick 0. ATK/DEF grow each combat tick
@@ -130,82 +209,14 @@ class Enemy:
         
         Args:
             enemy_number: Enemy sequence number (1-indexed)
+            enemy_table: Stats to use (default: the default config's enemy table)
             
         Returns:
             Enemy instance with scaled stats
         """
-        # Load scaling config from balance-config.json
-        enemy_config = BALANCE_CONFIG["enemy_scaling"]
-        hp_formulas = enemy_config["hp_formulas"]
-        per_tick_config = enemy_config["per_tick_scaling"]
-        boss_config = enemy_config["boss_multipliers"]
-        
-        # Boss detection (every 50 enemies)
-        is_boss = (enemy_number % 50 == 0)
-        
-        # Determine which act this enemy belongs to
-        if enemy_number <= 50:
-            act_key = "act_1"
-            hp_data = hp_formulas["act_1"]
-            tick_data = per_tick_config["act_1"]
-        elif enemy_number <= 100:
-            act_key = "act_2"
-            hp_data = hp_formulas["act_2"]
-            tick_data = per_tick_config["act_2"]
-        elif enemy_number <= 150:
-            act_key = "act_3"
-            hp_data = hp_formulas["act_3"]
-            tick_data = per_tick_config["act_3"]
-        else:
-            # Act 4+ (future content)
-            act_key = "act_4"
-            hp_data = hp_formulas["act_4"]
-            # Act 4 tick data not in config yet, use Act 3 values
-            tick_data = {
-                "atk_base": 13.5,
-                "atk_growth_per_enemy": 0.15,
-                "def_base": 6.75,
-                "def_growth_per_enemy": 0.075,
-            }
-        
-        # Calculate HP from formula in config
-        # Parse formula string to extract base and growth values
-        # Format: "base + (n - start) * growth"
-        if act_key == "act_1":
-            base_hp = 20 + (enemy_number - 1) * 120
-        elif act_key == "act_2":
-            base_hp = 6000 + (enemy_number - 51) * 130
-        elif act_key == "act_3":
-            base_hp = 12500 + (enemy_number - 101) * 140
-        else:  # act_4
-            base_hp = 38880 + (enemy_number - 151) * 200
-        
-        # Apply boss HP multiplier
-        if is_boss:
-            boss_hp_mult = boss_config["hp"].get(str(enemy_number), 2.0)  # Default 2× for future bosses
-            health = base_hp * boss_hp_mult
-        else:
-            health = base_hp
-        
-        # Calculate per-tick ATK/DEF from config
-        if act_key == "act_1":
-            atk_per_tick = tick_data["atk_base"] + (enemy_number - 1) * tick_data["atk_growth_per_enemy"]
-            def_per_tick = tick_data["def_base"] + (enemy_number - 1) * tick_data["def_growth_per_enemy"]
-        elif act_key == "act_2":
-            atk_per_tick = tick_data["atk_base"] + (enemy_number - 51) * tick_data["atk_growth_per_enemy"]
-            def_per_tick = tick_data["def_base"] + (enemy_number - 51) * tick_data["def_growth_per_enemy"]
-        elif act_key == "act_3":
-            atk_per_tick = tick_data["atk_base"] + (enemy_number - 101) * tick_data["atk_growth_per_enemy"]
-            def_per_tick = tick_data["def_base"] + (enemy_number - 101) * tick_data["def_growth_per_enemy"]
-        else:  # act_4
-            atk_per_tick = tick_data["atk_base"] + (enemy_number - 151) * tick_data["atk_growth_per_enemy"]
-            def_per_tick = tick_data["def_base"] + (enemy_number - 151) * tick_data["def_growth_per_enemy"]
-        
-        # Apply boss multiplier (2× faster scaling)
-        if is_boss:
-            boss_tick_mult = boss_config["per_tick_rates"]["multiplier"]
-            atk_per_tick *= boss_tick_mult
-            def_per_tick *= boss_tick_mult
+        if enemy_table is None:
+            enemy_table = default_balance_config().enemy_table
+        health, atk_per_tick, def_per_tick, is_boss = enemy_table.stats(enemy_number)
 
         return cls(
             number=enemy_number, 
@@ -250,28 +261,58 @@ class Enemy:
         self.current_health = max(0, self.current_health - amount)
 
 
-@dataclass
-class SimulationEvent:
-    """Timestamped simulation event."""
+def _card_stats(cards: list["Card"]) -> np.ndarray:
+    """Stats of a run of draws as a (5, len(cards)) array.
+    
+    Rows: attack, defense, essence_rate, essence_burst, drawn (1), with
+    generator effects counted only when positive (as in _apply_card_effects).
+    
+    Args:
+        cards: Cards in draw order
+        
+    Returns:
+        Per-draw stats
+    """
+    return np.array(
+        [
+            [c.attack for c in cards],
+            [c.defense for c in cards],
+            [c.essence_rate if c.essence_rate > 0 else 0.0 for c in cards],
+            [c.essence_burst if c.essence_burst > 0 else 0 for c in cards],
+            [1] * len(cards),
+        ],
+        dtype=np.float64,
+    )
 
-    time: float  # Time in seconds
-    event_type: str  # 'draw', 'enemy_spawn', 'victory', 'defeat', 'death', 'combat_tick', 'pack_affordable', 'reshuffle'
-    data: dict = field(default_factory=dict)
 
+def _running_total(total: float, values: np.ndarray) -> float:
+    """Add values to a total one at a time (same rounding as a += loop).
+    
+    Args:
+        total: Starting total
+        values: Values to add, in order
+        
+    Returns:
+        Final total
+    """
+    return float(np.add.accumulate(np.concatenate([[total], values]))[-1])
 
-@dataclass
-class SimulationState:
-    """Current simulation state snapshot."""
 
-    time: float
-    essence: float
-    player: Player
-    cards_drawn: int
-    enemies_defeated: int
-    enemies_encountered: int
-    current_enemy: Enemy | None
-    in_combat: bool
-    combat_ticks: int  # Total combat ticks this run
+def shard_reward(enemy_number: int) -> int:
+    """Calculate shards earned for defeating an enemy.
+    
+    Rewards grow 2-3 early, 4-6 mid, 8-12 late; bosses give 3x-5x regular rewards.
+    
+    Args:
+        enemy_number: Enemy sequence number (1-indexed)
+        
+    Returns:
+        Shards earned
+    """
+    if enemy_number % 50 == 0:
+        base_shards = 2 + (enemy_number // 50) * 3
+        return base_shards * 4
+    return 2 + (enemy_number // 100)
 
 
 class CombatSimulator:
@@ -297,36 +338,51 @@ class CombatSimulator:
         draw_interval: float | None = None,
         combat_tick_interval: float | None = None,
         reshuffle_cooldown: float | None = None,
+        record_level: RecordLevel | int | str = RecordLevel.FULL,
+        seed: int | None = None,
+        run_index: int = 0,
+        config: BalanceConfig | None = None,
+        cache: RunCache | None = None,
     ) -> None:
         """Initialize combat simulator.
         
         DATA OWNERSHIP (Task 2.1.2C):
-        If timing values not provided, load from game-data/balance-config.json
+        If timing values not provided, load from the balance config
         
         Args:
-            draw_interval: Seconds between card draws (default: from balance-config.json)
-            combat_tick_interval: Seconds between combat ticks (default: from balance-config.json)
-            reshuffle_cooldown: Cooldown after deck exhausts (default: from balance-config.json)
+            draw_interval: Seconds between card draws (default: from balance config)
+            combat_tick_interval: Seconds between combat ticks (default: from balance config)
+            reshuffle_cooldown: Cooldown after deck exhausts (default: from balance config)
+            record_level: Default event recording level (see RecordLevel)
+            seed: Base seed for deck shuffles (None: fresh entropy per run)
+            run_index: Run index within the seeded batch (see run_seed_sequence)
+            config: Balance config (default: game-data/balance-config.json)
+            cache: Reuse results of identical seeded runs from this cache
+                (see simulate)
         """
-        # Load timing from balance-config.json if not provided
-        timing_config = BALANCE_CONFIG["combat_timing"]
-        
-        self.draw_interval = draw_interval if draw_interval is not None else timing_config["card_draw_interval"]
-        self.combat_tick_interval = combat_tick_interval if combat_tick_interval is not None else timing_config["combat_tick_interval"]
-        self.reshuffle_cooldown = reshuffle_cooldown if reshuffle_cooldown is not None else timing_config["reshuffle_cooldown"]
+        self.config = config if config is not None else default_balance_config()
+        self.cache = cache
+
+        self.draw_interval, self.combat_tick_interval, self.reshuffle_cooldown = self.config.timing(
+            draw_interval, combat_tick_interval, reshuffle_cooldown
+        )
 
         # Simulation state
         self.current_time: float = 0.0
         self.essence: float = 0.0
         self.shards: int = 0  # Combat rewards
-        self.player: Player = Player()
+        self.player: Player = self._new_player()
 
         # Deck state
-        self.deck_cards: list["Card"] = []
-        self.draw_pile: list["Card"] = []
+        self.deck_cards: list[Card] = []
+        self.draw_pile: list[Card] = []
         self.draw_index: int = 0
         self.is_reshuffling: bool = False
         self.reshuffle_end_time: float = 0.0
+        # Piles shuffled ahead of time by the "resolved" engine, in RNG order
+        self._pile_queue: list[list[Card]] = []
+        self._deck_stats = np.zeros((5, 1))  # _card_stats of the deck + a no-draw column
+        self._deck_slots: dict[int, int] = {}  # id(card) -> column in _deck_stats
 
         # Combat state
         self.current_enemy: Enemy | None = None
@@ -334,6 +390,14 @@ class CombatSimulator:
         self.in_combat: bool = False
         self.combat_start_time: float = 0.0  # Track combat start for duration
 
+        # Event-driven engine clock (None when running the stepped engine)
+        self._clock: int | None = None
+        self._next_state_clock: int = 0
+        self._state_clock_step: int = 0
+
+        # Pack affordability (DATA OWNERSHIP - Task 2.1.2C: costs from balance-config.json)
+        self.pack_tracker = PackThresholdTracker(self.config.pack_costs)
+
         # Statistics
         self.cards_drawn: int = 0
         self.enemies_defeated: int = 0
@@ -341,36 +405,79 @@ class CombatSimulator:
         self.total_damage_dealt: float = 0.0
         self.total_damage_taken: float = 0.0
         self.combat_ticks: int = 0  # Total combat ticks
-        self.combat_durations: list[float] = []  # Duration per enemy
+        self.fights: FightLog = FightLog()  # One row per fight
+        self._fight_start_damage = (0.0, 0.0)  # Damage totals when the current fight started
+        self.loop_iterations: int = 0  # Main loop iterations (engine diagnostics)
 
         # Event tracking
-        self.events: list[SimulationEvent] = []
-        self.state_history: list[SimulationState] = []
+        self.events: EventLog = EventLog()
+        self._event_sink: Callable[[EventLog, float], None] | None = None
+        self._sink_interval = 0.0
+        self._next_flush_time = 0.0
+        self.state_history = StateHistory()
+        self.record_level = RecordLevel.parse(record_level)
+        self._set_record_level(self.record_level)
+
+        # Shuffle RNG (owned by this simulator, never the module-global random)
+        self.seed = seed
+        self.run_index = run_index
+        self._start_rng(seed, run_index)
+
+    def _new_player(self) -> Player:
+        """Create a player at full HP for this simulator's config."""
+        return Player(current_hp=self.config.starting_hp, max_hp=self.config.starting_hp)
 
     def reset(self) -> None:
         """Reset simulation state."""
         self.current_time = 0.0
         self.essence = 0.0
         self.shards = 0
-        self.player = Player()
+        self.player = self._new_player()
         self.deck_cards = []
         self.draw_pile = []
         self.draw_index = 0
         self.is_reshuffling = False
         self.reshuffle_end_time = 0.0
+        self._pile_queue = []
         self.current_enemy = None
         self.enemy_number = 0
         self.in_combat = False
         self.combat_start_time = 0.0
+        self._clock = None
+        self._next_state_clock = 0
+        self._state_clock_step = 0
+        self.pack_tracker.reset()
         self.cards_drawn = 0
         self.enemies_defeated = 0
         self.enemies_encountered = 0
         self.total_damage_dealt = 0.0
         self.total_damage_taken = 0.0
         self.combat_ticks = 0
-        self.combat_durations = []
-        self.events = []
-        self.state_history = []
+        self.fights = FightLog()
+        self._fight_start_damage = (0.0, 0.0)
+        self.loop_iterations = 0
+        self.events = EventLog()
+        self.state_history = StateHistory()
+
+    def _start_rng(self, seed: int | None, run_index: int) -> None:
+        """Start a fresh shuffle RNG stream for (seed, run_index).
+        
+        Args:
+            seed: Base seed (None draws fresh entropy, kept in seed_sequence)
+            run_index: Run index within the seeded batch
+        """
+        self.seed_sequence = run_seed_sequence(seed, run_index)
+        self.rng = np.random.default_rng(self.seed_sequence)
+
+    def _set_record_level(self, record_level: RecordLevel) -> None:
+        """Cache per-category recording flags for the hot loop.
+        
+        Args:
+            record_level: Recording level for the next run
+        """
+        self._record_milestones = record_level >= RecordLevel.MILESTONES
+        self._record_ticks = record_level >= RecordLevel.FIGHTS
+        self._record_draws = record_level >= RecordLevel.FULL
 
     def load_deck(self, deck: "Deck") -> None:
         """Load deck and prepare for simulation.
@@ -383,14 +490,27 @@ class CombatSimulator:
             raise ValueError(f"Deck must have at least 8 cards (has {len(deck.cards)})")
         
         self.deck_cards = list(deck.cards)
+        for card in self.deck_cards:
+            self.events.register_card(card)
+        self._deck_stats = np.concatenate([_card_stats(self.deck_cards), np.zeros((5, 1))], axis=1)
+        self._deck_slots = {id(card): slot for slot, card in enumerate(self.deck_cards)}
         self._shuffle_deck()
 
     def _shuffle_deck(self) -> None:
         """Shuffle deck and reset draw pile."""
-        self.draw_pile = self.deck_cards.copy()
-        random.shuffle(self.draw_pile)
+        if self._pile_queue:
+            # Already shuffled ahead of time (same RNG draws, same order)
+            self.draw_pile = self._pile_queue.pop(0)
+        else:
+            self.draw_pile = self._new_pile()
         self.draw_index = 0
 
+    def _new_pile(self) -> list["Card"]:
+        """Get a freshly shuffled copy of the deck."""
+        pile = self.deck_cards.copy()
+        self.rng.shuffle(pile)
+        return pile
+
     def _can_draw_card(self) -> bool:
         """Check if a card can be drawn (not in reshuffle cooldown).
         
@@ -422,19 +542,13 @@ class CombatSimulator:
         if self.draw_index >= len(self.draw_pile):
             # Deck exhausted, start reshuffle cooldown
             self.is_reshuffling = True
-            self.reshuffle_end_time = self.current_time + self.reshuffle_cooldown
+            self.reshuffle_end_time = self._time_after(self.reshuffle_cooldown)
             
             # Record reshuffle event for display
-            self.events.append(
-                SimulationEvent(
-                    time=self.current_time,
-                    event_type="reshuffle",
-                    data={
-                        "deck_size": len(self.deck_cards),
-                        "cooldown": self.reshuffle_cooldown,
-                    },
+            if self._record_draws:
+                self.events.add_reshuffle(
+                    self.current_time, len(self.deck_cards), self.reshuffle_cooldown
                 )
-            )
             
             return None
 
@@ -446,26 +560,42 @@ class CombatSimulator:
         self._apply_card_effects(card)
 
         # Record event
-        self.events.append(
-            SimulationEvent(
-                time=self.current_time,
-                event_type="draw",
-                data={
-                    "card_id": card.id,
-                    "card_name": card.name,
-                    "essence_rate": card.essence_rate,
-                    "essence_burst": card.essence_burst,
-                    "attack": card.attack,
-                    "defense": card.defense,
-                    "player_attack": self.player.attack,
-                    "player_defense": self.player.defense,
-                    "player_essence_rate": self.player.essence_rate,
-                },
+        if self._record_draws:
+            self.events.add_draw(
+                self.current_time,
+                self.events.card_slot(card.id),
+                self.player.attack,
+                self.player.defense,
+                self.player.essence_rate,
             )
-        )
 
         return card
 
+    def _time_after(self, seconds: float) -> float:
+        """Get the simulation time `seconds` after the current time.
+        
+        On the event-driven engine the offset is snapped to the integer clock,
+        so later comparisons against clock-derived times are exact.
+        
+        Args:
+            seconds: Offset from the current time
+            
+        Returns:
+            Absolute simulation time in seconds
+        """
+        if self._clock is None:
+            return self.current_time + seconds
+        return (self._clock + round(seconds * CLOCK_RESOLUTION)) / CLOCK_RESOLUTION
+
+    def _process_tick(self) -> None:
+        """Process one synchronized tick: card draw, then combat tick."""
+        # Draw card first (adds stats for this tick's combat)
+        self._draw_card()  # Returns None if in reshuffle cooldown
+        
+        # Combat tick happens immediately after card draw
+        if self.in_combat:
+            self._combat_tick()
+
     def _apply_card_effects(self, card: "Card") -> None:
         """Apply card effects to player when drawn.
         
@@ -500,7 +630,7 @@ class CombatSimulator:
     def _spawn_enemy(self) -> None:
         """Spawn next enemy and start combat."""
         self.enemy_number += 1
-        self.current_enemy = Enemy.spawn(self.enemy_number)
+        self.current_enemy = Enemy.spawn(self.enemy_number, self.config.enemy_table)
         self.enemies_encountered += 1
         self.in_combat = True
         self.combat_start_time = self.current_time
@@ -509,22 +639,30 @@ class CombatSimulator:
         if self.enemy_number > self.player.furthest_enemy:
             self.player.furthest_enemy = self.enemy_number
 
-        self.events.append(
-            SimulationEvent(
-                time=self.current_time,
-                event_type="enemy_spawn",
-                data={
-                    "enemy_number": self.enemy_number,
-                    "max_health": self.current_enemy.max_health,
-                    "atk_per_tick": self.current_enemy.atk_per_tick,
-                    "def_per_tick": self.current_enemy.def_per_tick,
-                    "is_boss": self.current_enemy.is_boss,
-                    "player_hp": self.player.current_hp,
-                    "player_attack": self.player.attack,
-                    "player_defense": self.player.defense,
-                },
-            )
+        enemy = self.current_enemy
+        self.fights.start(
+            self.current_time,
+            enemy_number=self.enemy_number,
+            player_hp=self.player.current_hp,
+            max_health=enemy.max_health,
+            atk_per_tick=enemy.atk_per_tick,
+            def_per_tick=enemy.def_per_tick,
+            is_boss=enemy.is_boss,
         )
+        self._fight_start_damage = (self.total_damage_dealt, self.total_damage_taken)
+
+        if self._record_milestones:
+            self.events.add_enemy_spawn(
+                self.current_time,
+                enemy_number=self.enemy_number,
+                max_health=self.current_enemy.max_health,
+                atk_per_tick=self.current_enemy.atk_per_tick,
+                def_per_tick=self.current_enemy.def_per_tick,
+                is_boss=self.current_enemy.is_boss,
+                player_hp=self.player.current_hp,
+                player_attack=self.player.attack,
+                player_defense=self.player.defense,
+            )
 
     def _combat_tick(self) -> None:
         """Process one combat tick (1 second).
@@ -552,7 +690,8 @@ class CombatSimulator:
         player_damage = max(self.player.attack - enemy_defense, 0)
         enemy_damage = max(enemy_attack - self.player.defense, 0)
         
-        # Apply damage
+        # Apply damage (HP is clamped at 0, so keep it for the overkill)
+        enemy_hp_before = self.current_enemy.current_health
         if player_damage > 0:
             self.current_enemy.take_damage(player_damage)
             self.total_damage_dealt += player_damage
@@ -563,67 +702,55 @@ class CombatSimulator:
         
         # Record combat tick event for live viewer
         # (Every tick so live viewer can show real-time HP updates)
-        self.events.append(
-            SimulationEvent(
-                time=self.current_time,
-                event_type="combat_tick",
-                data={
-                    "enemy_number": self.enemy_number,
-                    "player_damage": player_damage,
-                    "enemy_damage": enemy_damage,
-                    "enemy_hp": self.current_enemy.current_health,
-                    "enemy_attack": enemy_attack,
-                    "enemy_defense": enemy_defense,
-                    "player_hp": self.player.current_hp,
-                    "player_attack": self.player.attack,
-                    "player_defense": self.player.defense,
-                    "ticks_elapsed": self.current_enemy.combat_ticks_elapsed,
-                },
+        if self._record_ticks:
+            self.events.add_combat_tick(
+                self.current_time,
+                enemy_number=self.enemy_number,
+                player_damage=player_damage,
+                enemy_damage=enemy_damage,
+                enemy_hp=self.current_enemy.current_health,
+                enemy_attack=enemy_attack,
+                enemy_defense=enemy_defense,
+                player_hp=self.player.current_hp,
+                player_attack=self.player.attack,
+                player_defense=self.player.defense,
+                ticks_elapsed=self.current_enemy.combat_ticks_elapsed,
             )
-        )
         
         # Check for victory or defeat
         if not self.current_enemy.is_alive():
-            self._handle_victory()
+            self._handle_victory(overkill=player_damage - enemy_hp_before)
         elif not self.player.is_alive():
             self._handle_defeat()
 
-    def _handle_victory(self) -> None:
-        """Handle enemy defeat - grant rewards, reset combat stats."""
+    def _handle_victory(self, overkill: float = 0.0) -> None:
+        """Handle enemy defeat - grant rewards, reset combat stats.
+
+        Args:
+            overkill: Damage of the killing tick beyond the enemy's remaining HP
+        """
         if not self.current_enemy:
             return
 
         self.enemies_defeated += 1
         combat_duration = self.current_time - self.combat_start_time
-        self.combat_durations.append(combat_duration)
+        self._end_fight(WON, overkill=overkill)
         
-        # Calculate shard rewards (2-3 early, 4-6 mid, 8-12 late)
         is_boss = (self.current_enemy.number % 50 == 0)
-        if is_boss:
-            # Bosses give 3x-5x regular rewards
-            base_shards = 2 + (self.current_enemy.number // 50) * 3
-            shards = base_shards * 4
-        else:
-            base_shards = 2 + (self.current_enemy.number // 100)
-            shards = base_shards
-        
+        shards = shard_reward(self.current_enemy.number)
         self.shards += shards
 
         # Record victory event
-        self.events.append(
-            SimulationEvent(
-                time=self.current_time,
-                event_type="victory",
-                data={
-                    "enemy_number": self.current_enemy.number,
-                    "combat_duration": combat_duration,
-                    "overkill": abs(self.current_enemy.current_health),
-                    "shards_earned": shards,
-                    "is_boss": is_boss,
-                    "player_hp": self.player.current_hp,
-                },
+        if self._record_milestones:
+            self.events.add_victory(
+                self.current_time,
+                enemy_number=self.current_enemy.number,
+                combat_duration=combat_duration,
+                overkill=overkill,
+                shards_earned=shards,
+                is_boss=is_boss,
+                player_hp=self.player.current_hp,
             )
-        )
 
         # Reset combat stats (ATK/DEF reset, essence_rate persists, HP persists)
         self.player.reset_combat_stats()
@@ -634,20 +761,18 @@ class CombatSimulator:
 
     def _handle_defeat(self) -> None:
         """Handle player death - respawn at Enemy 1, reset stats, keep resources."""
+        self._end_fight(LOST)
+
         # Record death event
-        self.events.append(
-            SimulationEvent(
-                time=self.current_time,
-                event_type="death",
-                data={
-                    "furthest_enemy": self.player.furthest_enemy,
-                    "enemies_defeated": self.enemies_defeated,
-                    "essence_earned": self.essence,
-                    "shards_earned": self.shards,
-                    "deaths": self.player.deaths + 1,
-                },
+        if self._record_milestones:
+            self.events.add_death(
+                self.current_time,
+                furthest_enemy=self.player.furthest_enemy,
+                enemies_defeated=self.enemies_defeated,
+                essence_earned=self.essence,
+                shards_earned=self.shards,
+                deaths=self.player.deaths + 1,
             )
-        )
         
         # Player dies - reset stats and HP, keep resources
         self.player.die()
@@ -657,65 +782,92 @@ class CombatSimulator:
         self.current_enemy = None
         self.in_combat = False
 
-    def _check_pack_affordability(self, pack_number: int, pack_cost: int) -> None:
-        """Check if pack is now affordable and log event.
+    def _end_fight(self, outcome: int, overkill: float = 0.0) -> None:
+        """Close the current fight's row in the fight log.
         
         Args:
-            pack_number: Pack number to check
-            pack_cost: Cost of the pack
+            outcome: WON, LOST, or UNRESOLVED (run ended mid-fight)
+            overkill: Damage beyond the enemy's remaining HP (victories)
         """
-        if self.essence >= pack_cost:
-            # Check if we've already logged this pack
-            pack_events = [
-                e
-                for e in self.events
-                if e.event_type == "pack_affordable" and e.data.get("pack_number") == pack_number
-            ]
-            if not pack_events:
-                self.events.append(
-                    SimulationEvent(
-                        time=self.current_time,
-                        event_type="pack_affordable",
-                        data={
-                            "pack_number": pack_number,
-                            "pack_cost": pack_cost,
-                            "essence": self.essence,
-                        },
-                    )
-                )
-
-    def _record_state(self) -> None:
-        """Record current state snapshot."""
-        # Make a copy of player for state history
-        player_copy = Player(
-            current_hp=self.player.current_hp,
-            max_hp=self.player.max_hp,
-            attack=self.player.attack,
-            defense=self.player.defense,
-            essence_rate=self.player.essence_rate,
-            deaths=self.player.deaths,
-            furthest_enemy=self.player.furthest_enemy,
+        dealt, taken = self._fight_start_damage
+        self.fights.end(
+            self.current_time,
+            outcome,
+            ticks=self.current_enemy.combat_ticks_elapsed,
+            damage_dealt=self.total_damage_dealt - dealt,
+            damage_taken=self.total_damage_taken - taken,
+            player_hp=self.player.current_hp,
+            overkill=overkill,
         )
+
+    def _check_pack_affordability(
+        self,
+        start_time: float,
+        start_essence: float,
+        end_time: float,
+        rate: float | None = None,
+    ) -> None:
+        """Log packs whose cost is first reached between two times.
         
-        state = SimulationState(
-            time=self.current_time,
-            essence=self.essence,
-            player=player_copy,
-            cards_drawn=self.cards_drawn,
-            enemies_defeated=self.enemies_defeated,
-            enemies_encountered=self.enemies_encountered,
-            current_enemy=self.current_enemy,
-            in_combat=self.in_combat,
-            combat_ticks=self.combat_ticks,
+        Essence is assumed to grow linearly at the current essence rate from
+        `start_essence` at `start_time`, so crossings get their exact time.
+        
+        Args:
+            start_time: Segment start time (seconds)
+            start_essence: Essence at segment start
+            end_time: Segment end time (seconds)
+            rate: Essence rate during the segment (default: player's current rate)
+        """
+        if rate is None:
+            rate = self.player.essence_rate
+        reached = self.pack_tracker.advance(start_time, start_essence, rate, end_time)
+        if not self._record_milestones:
+            return
+        for pack_num, pack_cost, crossing_time in reached:
+            self.events.add_pack_affordable(
+                crossing_time, pack_num, pack_cost, max(start_essence, pack_cost)
+            )
+
+    def _record_state(self, force: bool = False) -> None:
+        """Offer the current state to the state history.
+        
+        Args:
+            force: Keep the snapshot even if adaptive sampling would skip it
+        """
+        player = self.player
+        enemy = self.current_enemy
+        self.state_history.record(
+            self.current_time,
+            self.essence,
+            player.current_hp,
+            player.essence_rate,
+            player.attack,
+            player.defense,
+            player.deaths,
+            self.cards_drawn,
+            self.enemies_defeated,
+            self.in_combat,
+            enemy.number if enemy is not None else 0,
+            enemy.current_health if enemy is not None else 0.0,
+            force=force,
         )
-        self.state_history.append(state)
 
     def simulate(
         self,
         duration_minutes: float,
         deck: "Deck",
         state_recording_interval: float = 10.0,  # Record state every 10s
-    ) -> dict:
+        engine: str = "stepped",
+        time_step: float = 0.1,
+        record_level: RecordLevel | int | str | None = None,
+        seed: int | None = None,
+        run_index: int | None = None,
+        event_sink: Callable[[EventLog, float], None] | None = None,
+        sink_interval: float = 5.0,
+        state_capacity: int = STATE_HISTORY_CAPACITY,
+        state_tolerances: dict[str, float] | None = None,
+        state_resolution: float = 1.0,
+    ) -> SimulationResult:
         """Run tick-based combat simulation for specified duration.
         
         NEW Simulation loop (Session 2.0.3 - Tick-Based Combat):
@@ -734,61 +886,188 @@ class CombatSimulator:
         - Death triggers respawn, not game over
         - Stats reset per enemy (ATK/DEF), essence_rate persists
         
+        Engines:
+        - "stepped": Advances a float clock in fixed `time_step` increments
+          (original loop, ~10 iterations per tick)
+        - "event": Jumps from one scheduled tick to the next on an integer
+          clock (see CLOCK_RESOLUTION) and integrates essence exactly in
+          between. Pack crossings and state snapshots are resolved inside
+          each segment, so the loop runs once per tick.
+        - "resolved": The event engine, but fights that last RESOLVE_AFTER_TICKS
+          ticks are resolved in closed form (see resolve_fight) and jumped
+          over up to their outcome tick. Results are identical to "event";
+          per-tick events (draws, combat ticks) are not recorded.
+        
         Args:
             duration_minutes: Simulation duration in minutes
             deck: Deck to simulate with
             state_recording_interval: How often to record state snapshots (seconds)
+            engine: Simulation engine ("stepped", "event" or "resolved")
+            time_step: Clock increment for the stepped engine (seconds)
+            record_level: Event recording level for this run (default: the
+                simulator's record_level). RecordLevel.OFF skips all event
+                allocation in the hot loop.
+            seed: Base seed for this run (default: the simulator's seed)
+            run_index: Run index for this run (default: the simulator's run_index)
+            event_sink: Called with (batch, time) every `sink_interval` simulated
+                seconds while the run is in progress. `batch` holds the events
+                recorded since the previous call, and every event before `time`
+                has been delivered. The last batch is passed when the run ends,
+                and results["events"] is left empty.
+            sink_interval: Simulated seconds between event_sink calls
+            state_capacity: Most state snapshots kept (the oldest are overwritten)
+            state_tolerances: Adaptive state sampling: field -> change that is
+                worth a snapshot (see ADAPTIVE_STATE_TOLERANCES). Snapshots are
+                then offered every `state_resolution` seconds and kept when a
+                field moved more than its tolerance, or `state_recording_interval`
+                seconds after the last one kept. None: one snapshot every
+                `state_recording_interval` seconds.
+            state_resolution: Seconds between offered snapshots in adaptive mode
+
+        With a cache (see __init__), a seeded run without an event_sink is
+        looked up first and its results returned directly on a hit (the
+        simulator's own state is then left untouched); a miss is simulated
+        and stored.
             
         Returns:
-            Simulation results dictionary with events, stats, and timeline
+            SimulationResult with stats, events, state history and fights
+            (also readable as the results dict; see SimulationResult.to_dict)
         """
-        # Reset and initialize
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}' (expected one of {', '.join(ENGINES)})")
+
+        run_seed = self.seed if seed is None else seed
+        run_record_level = (
+            self.record_level if record_level is None else RecordLevel.parse(record_level)
+        )
+        cache_key = None
+        if self.cache is not None and run_seed is not None and event_sink is None:
+            cache_key = run_key(
+                deck,
+                self.config,
+                seed=run_seed,
+                run_index=self.run_index if run_index is None else run_index,
+                duration_minutes=duration_minutes,
+                engine=engine,
+                time_step=time_step,
+                record_level=run_record_level.name.lower(),
+                state_recording_interval=state_recording_interval,
+                state_capacity=state_capacity,
+                state_tolerances=state_tolerances,
+                state_resolution=state_resolution,
+                draw_interval=self.draw_interval,
+                combat_tick_interval=self.combat_tick_interval,
+                reshuffle_cooldown=self.reshuffle_cooldown,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Reset and initialize (each run restarts its RNG stream, so it can be
+        # re-created bit-for-bit from the seed and run_index in its results)
         self.reset()
+        self._start_rng(run_seed, self.run_index if run_index is None else run_index)
         self.load_deck(deck)
+        self.fights.run = self.seed_sequence.spawn_key[0]
+        self._set_record_level(run_record_level)
 
         duration_seconds = duration_minutes * 60
-        last_tick_time = 0.0  # Combined card draw + combat tick
-        last_state_record = 0.0
-
-        # Pack costs to track affordability (DATA OWNERSHIP - Task 2.1.2C)
-        # Load from balance-config.json instead of hardcoded values
-        pack_config = BALANCE_CONFIG["pack_costs"]["Arcane_Pack"]
-        pack_costs = {
-            1: pack_config["1"],
-            2: pack_config["2"],
-            3: pack_config["3"],
-            4: pack_config["4"],
-        }
+        self._event_sink = event_sink
+        self._sink_interval = sink_interval
+        self._next_flush_time = sink_interval
 
         # Record initial state
-        self._record_state()
+        self.state_history = StateHistory(
+            capacity=state_capacity,
+            tolerances=state_tolerances,
+            max_interval=state_recording_interval if state_tolerances is not None else None,
+        )
+        if state_tolerances is not None:
+            state_recording_interval = state_resolution
+        self._record_state(force=True)
+
+        if engine in ("event", "resolved"):
+            if engine == "resolved" and run_record_level > RecordLevel.MILESTONES:
+                raise ValueError(
+                    "The 'resolved' engine skips per-tick events; "
+                    "use record_level 'milestones' or 'off'"
+                )
+            self._simulate_event_driven(
+                duration_seconds, state_recording_interval, resolve_fights=engine == "resolved"
+            )
+        else:
+            self._simulate_stepped(duration_seconds, state_recording_interval, time_step)
+
+        # Final state record
+        self._record_state(force=True)
+        if self.in_combat:
+            self._end_fight(UNRESOLVED)
+        if event_sink is not None:
+            self._flush_events()
+            self._event_sink = None
+
+        # Compile results
+        results = self._compile_results(duration_minutes)
+        results.record_level = run_record_level.name.lower()
+        results.seed = self.seed_sequence.entropy
+        results.run_index = self.seed_sequence.spawn_key[0]
+        if cache_key is not None:
+            self.cache.put(cache_key, results)
+        return results
+
+    def _flush_events(self) -> None:
+        """Hand the events recorded so far to the event sink and start a new batch.
+
+        Called at the top of a loop iteration, before anything at
+        current_time is recorded, so every event before current_time is in
+        the batch.
+        """
+        batch = self.events
+        self.events = batch.empty_like(capacity=max(len(batch), 64))
+        self._event_sink(batch, self.current_time)
+        self._next_flush_time = self.current_time + self._sink_interval
+
+    def _simulate_stepped(
+        self,
+        duration_seconds: float,
+        state_recording_interval: float,
+        time_step: float,
+    ) -> None:
+        """Run the fixed-step simulation loop.
+        
+        Args:
+            duration_seconds: Simulation duration in seconds
+            state_recording_interval: How often to record state snapshots (seconds)
+            time_step: Clock increment per iteration (seconds)
+        """
+        last_tick_time = 0.0  # Combined card draw + combat tick
+        last_state_record = 0.0
 
         # Simulation loop (advance time in small steps)
-        time_step = 0.1  # 100ms resolution for smooth essence generation
         self.current_time = 0.0
 
         while self.current_time < duration_seconds:
+            self.loop_iterations += 1
+            if self._event_sink is not None and self.current_time >= self._next_flush_time:
+                self._flush_events()
+
             # Spawn enemy if none active and player is alive
             if self.current_enemy is None and self.player.is_alive():
                 self._spawn_enemy()
 
             # Process tick (card draw + combat) every 1 second
             if self.current_time - last_tick_time >= self.draw_interval:
-                # Draw card first (adds stats for this tick's combat)
-                self._draw_card()  # Returns None if in reshuffle cooldown
-                
-                # Combat tick happens immediately after card draw
-                if self.in_combat:
-                    self._combat_tick()
-                    
+                self._process_tick()
                 last_tick_time = self.current_time
 
             # Generate essence continuously (based on player.essence_rate)
+            step_start_essence = self.essence
             self._generate_essence(time_step)
 
-            # Check pack affordability
-            for pack_num, cost in pack_costs.items():
-                self._check_pack_affordability(pack_num, cost)
+            # Check pack affordability (exact crossing time within this step)
+            self._check_pack_affordability(
+                self.current_time, step_start_essence, self.current_time + time_step
+            )
 
             # Record state periodically
             if self.current_time - last_state_record >= state_recording_interval:
@@ -798,88 +1077,334 @@ class CombatSimulator:
             # Advance time
             self.current_time += time_step
 
-        # Final state record
-        self._record_state()
+    def _simulate_event_driven(
+        self,
+        duration_seconds: float,
+        state_recording_interval: float,
+        resolve_fights: bool = False,
+    ) -> None:
+        """Run the event-driven simulation loop.
+        
+        Time only advances to the next scheduled tick. Between ticks the
+        player's essence rate is constant, so essence is integrated exactly
+        and pack thresholds are crossed at their analytic times.
+        
+        Args:
+            duration_seconds: Simulation duration in seconds
+            state_recording_interval: How often to record state snapshots (seconds)
+            resolve_fights: Jump over long fights in closed form (see _fast_forward_fight)
+        """
+        end_clock = round(duration_seconds * CLOCK_RESOLUTION)
+        tick_step = round(self.draw_interval * CLOCK_RESOLUTION)
+        if tick_step <= 0:
+            raise ValueError("draw_interval must be at least one clock tick")
 
-        # Compile results
-        return self._compile_results(duration_minutes)
+        self._clock = 0
+        self.current_time = 0.0
+        self._state_clock_step = max(1, round(state_recording_interval * CLOCK_RESOLUTION))
+        self._next_state_clock = self._state_clock_step
+        next_tick = tick_step
+
+        while self._clock < end_clock:
+            if self._event_sink is not None and self.current_time >= self._next_flush_time:
+                self._flush_events()
 
-    def _compile_results(self, duration_minutes: float) -> dict:
-        """Compile simulation results into structured dictionary.
+            # Spawn enemy if none active and player is alive
+            if self.current_enemy is None and self.player.is_alive():
+                self._spawn_enemy()
+
+            # Long fight: jump to the tick before its outcome
+            if (
+                resolve_fights
+                and self.in_combat
+                and self.current_enemy is not None
+                and self.current_enemy.combat_ticks_elapsed >= RESOLVE_AFTER_TICKS
+            ):
+                next_tick = self._fast_forward_fight(next_tick, tick_step, end_clock)
+
+            # Jump to the next tick (or the end of the run)
+            target = min(next_tick, end_clock)
+            self._advance_clock(target)
+            if target == end_clock:
+                break
+
+            self.loop_iterations += 1
+            self._process_tick()
+            self._check_pack_affordability(self.current_time, self.essence, self.current_time)
+            next_tick += tick_step
+
+            # State snapshots due exactly on this tick are taken after it
+            if self._next_state_clock == self._clock:
+                self._record_state()
+                self._next_state_clock += self._state_clock_step
+
+    def _fast_forward_fight(self, next_tick: int, tick_step: int, end_clock: int) -> int:
+        """Apply every tick of the current fight before its outcome in one step.
+        
+        Plans the upcoming draws (shuffling future piles ahead of time, in
+        the same RNG order the tick loop would), resolves the fight with
+        resolve_fight_arrays, then applies the ticks before the victory or
+        death tick: essence integration, pack crossings and state snapshots
+        are computed from the per-tick arrays exactly as the tick loop would.
+        The outcome tick itself is left to the regular loop.
         
         Args:
-            duration_minutes: Simulation duration
+            next_tick: Clock value of the next tick
+            tick_step: Clock ticks between ticks
+            end_clock: Clock value at the end of the run
             
         Returns:
-            Results dictionary with stats, events, and timeline
+            Clock value of the next tick after the jump
         """
-        # Find pack affordable times
-        pack_times = {}
-        for event in self.events:
-            if event.event_type == "pack_affordable":
-                pack_num = event.data["pack_number"]
-                if pack_num not in pack_times:
-                    pack_times[pack_num] = event.time / 60  # Convert to minutes
-        
-        # Calculate average combat duration
-        avg_combat_duration = (
-            sum(self.combat_durations) / len(self.combat_durations)
-            if self.combat_durations
-            else 0.0
+        enemy = self.current_enemy
+        if enemy is None:
+            return next_tick
+        available = (end_clock - 1 - next_tick) // tick_step + 1 if next_tick < end_clock else 0
+        horizon = min(available, max(64, 2 * enemy.combat_ticks_elapsed))
+        if horizon <= 0:
+            return next_tick
+
+        attack_gain, defense_gain, rate_gain, burst, drawn = self._walk_draws(horizon)
+        resolution = resolve_fight_arrays(
+            attack_gain,
+            defense_gain,
+            enemy,
+            self.player.current_hp,
+            self.player.attack,
+            self.player.defense,
         )
+        ticks = resolution.ticks - 1 if resolution.outcome else resolution.ticks
+        if ticks <= 0:
+            return next_tick
+
+        # Essence: rate is constant between ticks, bursts land on the tick.
+        # Sequential sums (interleaved growth, burst) reproduce the tick loop exactly.
+        rates = np.add.accumulate(np.concatenate([[self.player.essence_rate], rate_gain[:ticks]]))
+        growth = rates[:-1] * tick_step / CLOCK_RESOLUTION
+        steps = np.empty(2 * ticks + 1)
+        steps[0] = self.essence
+        steps[1::2] = growth
+        steps[2::2] = burst[:ticks]
+        essence = np.add.accumulate(steps)
+        after_tick = essence[0::2].tolist()  # [start, after tick 1, ..., after tick `ticks`]
+        rates = rates.tolist()
+        clocks = (self._clock + tick_step * np.arange(ticks + 1)).tolist()
+
+        # Pack crossings, in the order the tick loop checks them
+        while self.pack_tracker.next_threshold is not None:
+            cost = self.pack_tracker.next_threshold[0]
+            tick = bisect.bisect_left(after_tick, cost)
+            if tick > ticks:
+                break
+            tick = max(tick, 1)
+            self._check_pack_affordability(
+                clocks[tick - 1] / CLOCK_RESOLUTION,
+                after_tick[tick - 1],
+                clocks[tick] / CLOCK_RESOLUTION,
+                rate=rates[tick - 1],
+            )
+            self._check_pack_affordability(
+                clocks[tick] / CLOCK_RESOLUTION,
+                after_tick[tick],
+                clocks[tick] / CLOCK_RESOLUTION,
+                rate=rates[tick],
+            )
+
+        # State after a resolved tick (tick 0 = the current state, left as is)
+        player = self.player
+        start_ticks = (self.combat_ticks, enemy.combat_ticks_elapsed, self.cards_drawn)
+        cards_drawn = np.add.accumulate(drawn[:ticks])
+
+        def apply(tick: int, clock: int, essence_now: float) -> None:
+            self._clock = clock
+            self.current_time = clock / CLOCK_RESOLUTION
+            self.essence = essence_now
+            if tick == 0:
+                return
+            player.current_hp = float(resolution.player_hp_by_tick[tick - 1])
+            player.attack = int(resolution.attack_by_tick[tick - 1])
+            player.defense = int(resolution.defense_by_tick[tick - 1])
+            player.essence_rate = rates[tick]
+            enemy.current_health = float(resolution.enemy_hp_by_tick[tick - 1])
+            self.combat_ticks = start_ticks[0] + tick
+            enemy.combat_ticks_elapsed = start_ticks[1] + tick
+            self.cards_drawn = start_ticks[2] + int(cards_drawn[tick - 1])
+
+        # Deck state after the jumped-over ticks (walked from the current clock)
+        self._walk_draws(ticks, commit=True)
+
+        # State snapshots inside the jumped-over span
+        last_clock = clocks[ticks]
+        while self._next_state_clock <= last_clock:
+            snapshot = self._next_state_clock
+            tick = bisect.bisect_left(clocks, snapshot)
+            if clocks[tick] == snapshot:
+                # Due exactly on a tick: taken after that tick
+                apply(tick, snapshot, after_tick[tick])
+            else:
+                # Between ticks: previous tick's state, essence integrated to the snapshot
+                start = clocks[tick - 1]
+                apply(
+                    tick - 1,
+                    snapshot,
+                    after_tick[tick - 1] + rates[tick - 1] * (snapshot - start) / CLOCK_RESOLUTION,
+                )
+            self._record_state()
+            self._next_state_clock += self._state_clock_step
 
-        return {
-            "duration_minutes": duration_minutes,
-            "duration_seconds": duration_minutes * 60,
-            "status": "completed",
+        # Commit the state after the last jumped-over tick
+        apply(ticks, last_clock, after_tick[ticks])
+        self.total_damage_dealt = _running_total(
+            self.total_damage_dealt, resolution.player_damage_by_tick[:ticks]
+        )
+        self.total_damage_taken = _running_total(
+            self.total_damage_taken, resolution.enemy_damage_by_tick[:ticks]
+        )
+        self.loop_iterations += 1
+        return next_tick + ticks * tick_step
+
+    def _walk_draws(self, ticks: int, commit: bool = False) -> tuple[np.ndarray, ...]:
+        """Plan (or commit) the draw state machine for the next `ticks` ticks.
+        
+        Follows _draw_card exactly: the rest of the current pile, one tick
+        that starts the reshuffle cooldown, ticks waiting out the cooldown,
+        then the next pile. Future piles are shuffled into the pile queue
+        when first needed, so the RNG is consumed in the same order as the
+        tick loop.
+        
+        Args:
+            ticks: Number of upcoming ticks
+            commit: Update the deck state to after those ticks instead of planning
+            
+        Returns:
+            Per-tick (attack, defense, essence_rate, essence_burst, drawn) arrays
+            (empty tuple when committing)
+        """
+        tick_step = round(self.draw_interval * CLOCK_RESOLUTION)
+        cooldown = round(self.reshuffle_cooldown * CLOCK_RESOLUTION)
+        deck_size = len(self.deck_cards)
+        no_draw = deck_size  # Column of _deck_stats for ticks without a draw
+
+        clock = self._clock
+        pile = 0  # 0 = current draw pile, k = self._pile_queue[k - 1]
+        index = self.draw_index
+        reshuffling = self.is_reshuffling
+        reshuffle_end = round(self.reshuffle_end_time * CLOCK_RESOLUTION)
+        slots: list[int] = []
+        remaining = ticks
+        while remaining > 0:
+            if reshuffling:
+                # Ticks before the cooldown ends draw nothing
+                waits = max(1, -(-(reshuffle_end - clock) // tick_step)) - 1
+                take = min(waits, remaining)
+                if not commit:
+                    slots.extend([no_draw] * take)
+                clock += take * tick_step
+                remaining -= take
+                if remaining == 0:
+                    break
+                # Cooldown over: this tick shuffles the next pile and draws from it
+                pile += 1
+                if len(self._pile_queue) < pile:
+                    self._pile_queue.append(self._new_pile())
+                index = 0
+                reshuffling = False
+            else:
+                take = min(deck_size - index, remaining)
+                if not commit:
+                    cards = self.draw_pile if pile == 0 else self._pile_queue[pile - 1]
+                    slots.extend(self._deck_slots[id(card)] for card in cards[index : index + take])
+                index += take
+                clock += take * tick_step
+                remaining -= take
+                if remaining == 0:
+                    break
+                # Deck exhausted: this tick starts the cooldown instead of drawing
+                slots.append(no_draw)
+                clock += tick_step
+                remaining -= 1
+                reshuffling = True
+                reshuffle_end = clock + cooldown
+
+        if not commit:
+            return tuple(self._deck_stats[:, slots])
+
+        for _ in range(pile):
+            self._shuffle_deck()
+        self.draw_index = index
+        self.is_reshuffling = reshuffling
+        self.reshuffle_end_time = reshuffle_end / CLOCK_RESOLUTION
+        return ()
+
+    def _advance_clock(self, target: int) -> None:
+        """Advance the integer clock, integrating essence exactly.
+        
+        Records state snapshots that fall strictly inside the segment and
+        logs pack thresholds crossed at their analytic crossing times.
+        
+        Args:
+            target: Clock value to advance to
+        """
+        start = self._clock
+        start_essence = self.essence
+        rate = self.player.essence_rate
+
+        # Pack crossings inside the segment (rate is constant until target)
+        self._check_pack_affordability(
+            start / CLOCK_RESOLUTION, start_essence, target / CLOCK_RESOLUTION
+        )
+
+        # Snapshots strictly between start and target
+        while self._next_state_clock < target:
+            self._clock = self._next_state_clock
+            self.current_time = self._clock / CLOCK_RESOLUTION
+            self.essence = start_essence + rate * (self._clock - start) / CLOCK_RESOLUTION
+            self._record_state()
+            self._next_state_clock += self._state_clock_step
+
+        self._clock = target
+        self.current_time = target / CLOCK_RESOLUTION
+        self.essence = start_essence + rate * (target - start) / CLOCK_RESOLUTION
+
+    def _compile_results(self, duration_minutes: float) -> SimulationResult:
+        """Collect the run's stats and tables (no per-row conversion).
+
+        Args:
+            duration_minutes: Simulation duration
+
+        Returns:
+            SimulationResult holding the simulator's event log, state
+            history and fight log
+        """
+        # Pack affordable times (first crossing, converted to minutes)
+        pack_times = {
+            pack_num: time / 60
+            for pack_num, time in sorted(self.pack_tracker.first_reached.items())
+        }
+
+        return SimulationResult(
+            duration_minutes=duration_minutes,
             # Final stats
-            "final_essence": self.essence,
-            "final_shards": self.shards,
-            "cards_drawn": self.cards_drawn,
-            "enemies_defeated": self.enemies_defeated,
-            "enemies_encountered": self.enemies_encountered,
-            "total_damage_dealt": self.total_damage_dealt,
-            "total_damage_taken": self.total_damage_taken,
-            "combat_ticks": self.combat_ticks,
+            final_essence=self.essence,
+            final_shards=self.shards,
+            cards_drawn=self.cards_drawn,
+            enemies_defeated=self.enemies_defeated,
+            enemies_encountered=self.enemies_encountered,
+            total_damage_dealt=self.total_damage_dealt,
+            total_damage_taken=self.total_damage_taken,
+            combat_ticks=self.combat_ticks,
             # Player stats
-            "player_hp": self.player.current_hp,
-            "player_max_hp": self.player.max_hp,
-            "player_attack": self.player.attack,
-            "player_defense": self.player.defense,
-            "player_essence_rate": self.player.essence_rate,
-            "player_deaths": self.player.deaths,
-            "furthest_enemy": self.player.furthest_enemy,
-            # Combat metrics
-            "avg_combat_duration": avg_combat_duration,
-            "total_combat_time": sum(self.combat_durations),
-            "combat_count": len(self.combat_durations),
-            # Pack timing
-            "pack_affordable_times": pack_times,
-            # Event timeline
-            "events": [
-                {
-                    "time": e.time,
-                    "time_minutes": e.time / 60,
-                    "type": e.event_type,
-                    "data": e.data,
-                }
-                for e in self.events
-            ],
-            # State history
-            "state_history": [
-                {
-                    "time": s.time,
-                    "time_minutes": s.time / 60,
-                    "essence": s.essence,
-                    "player_hp": s.player.current_hp,
-                    "player_essence_rate": s.player.essence_rate,
-                    "player_attack": s.player.attack,
-                    "player_defense": s.player.defense,
-                    "cards_drawn": s.cards_drawn,
-                    "enemies_defeated": s.enemies_defeated,
-                    "in_combat": s.in_combat,
-                }
-                for s in self.state_history
-            ],
-        }
+            player_hp=self.player.current_hp,
+            player_max_hp=self.player.max_hp,
+            player_attack=self.player.attack,
+            player_defense=self.player.defense,
+            player_essence_rate=self.player.essence_rate,
+            player_deaths=self.player.deaths,
+            furthest_enemy=self.player.furthest_enemy,
+            # Per-fight records (combat duration stats are derived on access)
+            fights=self.fights,
+            pack_affordable_times=pack_times,
+            events=self.events,
+            state_history=self.state_history,
+        )
 
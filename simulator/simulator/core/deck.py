@@ -5,7 +5,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
 
-from simulator.core.cards import Card
+from simulator.core.cards import STARTER_DECK_CARDS, Card
 
 
 class Deck(BaseModel):
@@ -93,3 +93,11 @@ class Deck(BaseModel):
             f"  Generation: {self.total_essence_rate:.1f}/sec + {self.total_essence_burst} burst"
         )
 
+
+def starter_deck() -> Deck:
+    """Build the starter deck (STARTER_DECK_CARDS, Arcane tier).
+
+    Returns:
+        New Deck instance
+    """
+    return Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
@@ -96,3 +96,102 @@ def time_to_pack(
     cost = pack_cost(pack_number, base_cost, multiplier)
     return cost / essence_per_second if essence_per_second > 0 else float("inf")
 
+
+
+class PackThresholdTracker:
+    """Tracks when each pack cost is first reached.
+    
+    Costs are sorted once, so an affordability check compares essence against
+    the next unreached cost only. Between events essence grows linearly at the
+    player's current rate, so crossing times are solved analytically instead
+    of being sampled on the simulation clock.
+    """
+
+    def __init__(self, pack_costs: dict[int, int]) -> None:
+        """Initialize tracker.
+        
+        Args:
+            pack_costs: Dictionary mapping pack number to cost
+        """
+        self.thresholds: list[tuple[int, int]] = sorted(
+            (cost, pack_number) for pack_number, cost in pack_costs.items()
+        )
+        self.next_index = 0
+        self.first_reached: dict[int, float] = {}  # Pack number -> time (seconds)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "PackThresholdTracker":
+        """Build tracker from the pack_costs table in balance config.
+        
+        Args:
+            config: Balance configuration dictionary
+            
+        Returns:
+            Tracker for every Arcane pack cost in the config
+        """
+        return cls(load_pack_costs_from_config(config))
+
+    @property
+    def next_threshold(self) -> tuple[int, int] | None:
+        """Next unreached (cost, pack_number), or None if all were reached."""
+        if self.next_index < len(self.thresholds):
+            return self.thresholds[self.next_index]
+        return None
+
+    def reset(self) -> None:
+        """Forget all reached thresholds."""
+        self.next_index = 0
+        self.first_reached = {}
+
+    def crossing_time(self, time: float, essence: float, rate: float) -> float | None:
+        """Calculate when the next unreached cost will be reached.
+        
+        Args:
+            time: Current time (seconds)
+            essence: Essence at `time`
+            rate: Essence generation rate (Essence/sec), assumed constant
+            
+        Returns:
+            Crossing time in seconds, or None if it is never reached at this rate
+        """
+        threshold = self.next_threshold
+        if threshold is None:
+            return None
+
+        cost = threshold[0]
+        if essence >= cost:
+            return time
+        if rate <= 0:
+            return None
+        return time + (cost - essence) / rate
+
+    def advance(
+        self,
+        time: float,
+        essence: float,
+        rate: float,
+        end_time: float,
+    ) -> list[tuple[int, int, float]]:
+        """Mark costs reached while essence grows linearly until `end_time`.
+        
+        Args:
+            time: Segment start time (seconds)
+            essence: Essence at segment start
+            rate: Essence generation rate during the segment
+            end_time: Segment end time (seconds)
+            
+        Returns:
+            Newly reached (pack_number, cost, crossing_time) tuples, cheapest first
+        """
+        reached = []
+        while True:
+            crossing = self.crossing_time(time, essence, rate)
+            if crossing is None or crossing > end_time:
+                break
+
+            cost, pack_number = self.thresholds[self.next_index]
+            self.first_reached[pack_number] = crossing
+            self.next_index += 1
+            reached.append((pack_number, cost, crossing))
+
+        return reached
@@ -0,0 +1,175 @@
+"""Precomputed enemy stat table.
+
+Enemy stats depend only on the enemy number and the balance config, so
+they are computed once per config into contiguous arrays indexed by enemy
+number (index 0 is unused). Spawning an enemy is then an array lookup, and
+the same arrays can be used directly by vectorized (NumPy) analyses.
+
+DATA OWNERSHIP (Task 2.1.2C):
+All values come from balance-config.json enemy_scaling. The linear
+"formula" strings ("base + (n - start) * growth") are parsed, not
+re-typed in code.
+"""
+
+import re
+from typing import Any
+
+import numpy as np
+
+# "base + (n - start) * growth"
+_LINEAR_FORMULA = re.compile(
+    r"^\s*(?P<base>-?[\d.]+)\s*\+\s*\(\s*n\s*-\s*(?P<start>\d+)\s*\)\s*\*\s*(?P<growth>-?[\d.]+)\s*$"
+)
+
+# Boss every N enemies
+BOSS_INTERVAL = 50
+
+# Boss HP multiplier for bosses without an entry in boss_multipliers.hp
+DEFAULT_BOSS_HP_MULTIPLIER = 2.0
+
+
+def parse_linear_formula(formula: str) -> tuple[float, int, float]:
+    """Parse a config formula of the form "base + (n - start) * growth".
+
+    Args:
+        formula: Formula string from balance-config.json
+
+    Returns:
+        (base, start, growth) tuple
+    """
+    match = _LINEAR_FORMULA.match(formula)
+    if not match:
+        raise ValueError(
+            f"Unsupported enemy formula '{formula}' (expected 'base + (n - start) * growth')"
+        )
+    return float(match["base"]), int(match["start"]), float(match["growth"])
+
+
+def _tick_terms(tick_data: dict[str, Any], stat: str) -> tuple[float, int, float]:
+    """Get (base, start, growth) for an act's per-tick ATK or DEF.
+
+    Args:
+        tick_data: Act entry from per_tick_scaling
+        stat: "atk" or "def"
+
+    Returns:
+        (base, start, growth) tuple
+    """
+    formula = tick_data.get(f"formula_{stat}")
+    if formula is not None:
+        return parse_linear_formula(formula)
+    return (
+        float(tick_data[f"{stat}_base"]),
+        int(tick_data["range"][0]),
+        float(tick_data[f"{stat}_growth_per_enemy"]),
+    )
+
+
+class EnemyTable:
+    """Enemy stats for enemies 1..N as contiguous arrays.
+
+    Acts are selected by the "range" of each hp_formulas entry; the last act
+    is open-ended, and the arrays are extended lazily for enemies past the
+    end of the table.
+
+    Attributes:
+        max_health: Max HP by enemy number (float64)
+        atk_per_tick: ATK gained per combat tick by enemy number (float64)
+        def_per_tick: DEF gained per combat tick by enemy number (float64)
+        is_boss: Boss flag by enemy number (bool)
+    """
+
+    def __init__(self, config: dict[str, Any], size: int = 200) -> None:
+        """Build table from balance config.
+
+        Args:
+            config: Balance configuration dictionary
+            size: Number of enemies to precompute
+        """
+        enemy_config = config["enemy_scaling"]
+        hp_formulas = enemy_config["hp_formulas"]
+        per_tick_config = enemy_config["per_tick_scaling"]
+        boss_config = enemy_config["boss_multipliers"]
+
+        acts = sorted(
+            (key for key in hp_formulas if key.startswith("act_")),
+            key=lambda key: hp_formulas[key]["range"][0],
+        )
+        # Act boundaries (first enemy number of each act) and linear terms per act
+        self._act_starts = np.array([hp_formulas[act]["range"][0] for act in acts])
+        hp_terms = [parse_linear_formula(hp_formulas[act]["formula"]) for act in acts]
+        atk_terms = [_tick_terms(per_tick_config[act], "atk") for act in acts]
+        def_terms = [_tick_terms(per_tick_config[act], "def") for act in acts]
+        self._terms = {
+            name: tuple(np.array(values, dtype=float) for values in zip(*terms, strict=True))
+            for name, terms in [("hp", hp_terms), ("atk", atk_terms), ("def", def_terms)]
+        }
+
+        self._boss_hp = {
+            int(number): float(mult)
+            for number, mult in boss_config["hp"].items()
+            if number.isdigit()
+        }
+        self._boss_tick_multiplier = float(boss_config["per_tick_rates"]["multiplier"])
+
+        self.max_health = np.zeros(1)
+        self.atk_per_tick = np.zeros(1)
+        self.def_per_tick = np.zeros(1)
+        self.is_boss = np.zeros(1, dtype=bool)
+        self.ensure(size)
+
+    @property
+    def size(self) -> int:
+        """Highest enemy number in the table."""
+        return len(self.max_health) - 1
+
+    def ensure(self, enemy_number: int) -> None:
+        """Extend the table to cover `enemy_number` (grows geometrically).
+
+        Args:
+            enemy_number: Highest enemy number needed
+        """
+        known = self.size
+        if enemy_number <= known:
+            return
+
+        numbers = np.arange(known + 1, max(enemy_number, 2 * known) + 1)
+        act = np.searchsorted(self._act_starts, numbers, side="right") - 1
+        if (act < 0).any():
+            raise ValueError(f"No enemy act covers enemy {int(numbers[act < 0][0])}")
+
+        def linear(name: str) -> np.ndarray:
+            base, start, growth = self._terms[name]
+            return base[act] + (numbers - start[act]) * growth[act]
+
+        is_boss = numbers % BOSS_INTERVAL == 0
+        hp_multiplier = np.array(
+            [self._boss_hp.get(int(n), DEFAULT_BOSS_HP_MULTIPLIER) for n in numbers]
+        )
+        tick_multiplier = np.where(is_boss, self._boss_tick_multiplier, 1.0)
+
+        self.max_health = np.concatenate(
+            [self.max_health, np.where(is_boss, linear("hp") * hp_multiplier, linear("hp"))]
+        )
+        self.atk_per_tick = np.concatenate([self.atk_per_tick, linear("atk") * tick_multiplier])
+        self.def_per_tick = np.concatenate([self.def_per_tick, linear("def") * tick_multiplier])
+        self.is_boss = np.concatenate([self.is_boss, is_boss])
+
+    def stats(self, enemy_number: int) -> tuple[float, float, float, bool]:
+        """Look up one enemy's stats.
+
+        Args:
+            enemy_number: Enemy sequence number (1-indexed)
+
+        Returns:
+            (max_health, atk_per_tick, def_per_tick, is_boss) tuple
+        """
+        if enemy_number < 1:
+            raise ValueError(f"Enemy numbers start at 1 (got {enemy_number})")
+        self.ensure(enemy_number)
+        return (
+            float(self.max_health[enemy_number]),
+            float(self.atk_per_tick[enemy_number]),
+            float(self.def_per_tick[enemy_number]),
+            bool(self.is_boss[enemy_number]),
+        )
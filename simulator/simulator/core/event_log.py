@@ -0,0 +1,554 @@
+"""Columnar event log for simulation traces.
+
+Stores every simulation event as one row across a fixed set of typed NumPy
+columns instead of a dict per event. Each event type maps its data fields
+onto a subset of the shared columns (see EVENT_SCHEMAS); draw events store
+an index into a small card table instead of repeating card fields.
+
+Readers can use:
+- columns(): dict of zero-copy column views (for vectorized analysis)
+- indices() / rows(): positions or lazy row dicts filtered by event type
+- iteration / indexing: lazy row dicts in the original results format
+  ({"time", "time_minutes", "type", "data"})
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from simulator.core.cards import Card
+
+
+# Event type names, indexed by their integer code
+EVENT_TYPES = (
+    "draw",
+    "reshuffle",
+    "enemy_spawn",
+    "combat_tick",
+    "victory",
+    "death",
+    "pack_affordable",
+)
+EVENT_TYPE_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+
+DRAW = EVENT_TYPE_CODES["draw"]
+RESHUFFLE = EVENT_TYPE_CODES["reshuffle"]
+ENEMY_SPAWN = EVENT_TYPE_CODES["enemy_spawn"]
+COMBAT_TICK = EVENT_TYPE_CODES["combat_tick"]
+VICTORY = EVENT_TYPE_CODES["victory"]
+DEATH = EVENT_TYPE_CODES["death"]
+PACK_AFFORDABLE = EVENT_TYPE_CODES["pack_affordable"]
+
+# Column name -> dtype
+COLUMNS: dict[str, type] = {
+    "time": np.float64,
+    "type": np.uint8,
+    "enemy_number": np.int32,
+    "card": np.int16,
+    "count": np.int32,
+    "aux": np.int32,
+    "shards": np.int32,
+    "flag": np.bool_,
+    "essence": np.float64,
+    "player_hp": np.float64,
+    "player_attack": np.float64,
+    "player_defense": np.float64,
+    "player_essence_rate": np.float64,
+    "enemy_hp": np.float64,
+    "enemy_attack": np.float64,
+    "enemy_defense": np.float64,
+    "player_damage": np.float64,
+    "enemy_damage": np.float64,
+    "value": np.float64,
+}
+
+# Event type -> [(data key, column, python type)]
+EVENT_SCHEMAS: dict[str, list[tuple[str, str, type]]] = {
+    "draw": [
+        ("player_attack", "player_attack", int),
+        ("player_defense", "player_defense", int),
+        ("player_essence_rate", "player_essence_rate", float),
+    ],
+    "reshuffle": [
+        ("deck_size", "count", int),
+        ("cooldown", "value", float),
+    ],
+    "enemy_spawn": [
+        ("enemy_number", "enemy_number", int),
+        ("max_health", "enemy_hp", float),
+        ("atk_per_tick", "enemy_attack", float),
+        ("def_per_tick", "enemy_defense", float),
+        ("is_boss", "flag", bool),
+        ("player_hp", "player_hp", float),
+        ("player_attack", "player_attack", int),
+        ("player_defense", "player_defense", int),
+    ],
+    "combat_tick": [
+        ("enemy_number", "enemy_number", int),
+        ("player_damage", "player_damage", float),
+        ("enemy_damage", "enemy_damage", float),
+        ("enemy_hp", "enemy_hp", float),
+        ("enemy_attack", "enemy_attack", float),
+        ("enemy_defense", "enemy_defense", float),
+        ("player_hp", "player_hp", float),
+        ("player_attack", "player_attack", int),
+        ("player_defense", "player_defense", int),
+        ("ticks_elapsed", "count", int),
+    ],
+    "victory": [
+        ("enemy_number", "enemy_number", int),
+        ("combat_duration", "value", float),
+        ("overkill", "enemy_hp", float),
+        ("shards_earned", "shards", int),
+        ("is_boss", "flag", bool),
+        ("player_hp", "player_hp", float),
+    ],
+    "death": [
+        ("furthest_enemy", "enemy_number", int),
+        ("enemies_defeated", "count", int),
+        ("essence_earned", "essence", float),
+        ("shards_earned", "shards", int),
+        ("deaths", "aux", int),
+    ],
+    "pack_affordable": [
+        ("pack_number", "count", int),
+        ("pack_cost", "value", float),
+        ("essence", "essence", float),
+    ],
+}
+
+# Card fields copied into draw event data (stored once per card in the card table)
+CARD_FIELDS = ("card_id", "card_name", "essence_rate", "essence_burst", "attack", "defense")
+
+
+class EventLog:
+    """Growable, array-backed simulation event trace.
+
+    Columns are preallocated and doubled when full, so appending an event
+    writes a handful of array slots and allocates nothing per event.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize empty log.
+
+        Args:
+            capacity: Initial row capacity
+        """
+        self._size = 0
+        self._capacity = max(1, capacity)
+        self._columns = {
+            name: np.zeros(self._capacity, dtype=dtype) for name, dtype in COLUMNS.items()
+        }
+        self.cards: list[tuple[str, str, float, int, int, int]] = []
+        self._card_slots: dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def register_card(self, card: "Card") -> int:
+        """Add card to the card table (once per card id).
+
+        Args:
+            card: Card that may appear in draw events
+
+        Returns:
+            Card table index for draw events
+        """
+        return self._register_card_fields(
+            (card.id, card.name, card.essence_rate, card.essence_burst, card.attack, card.defense)
+        )
+
+    def _register_card_fields(self, fields: tuple[str, str, float, int, int, int]) -> int:
+        """Add raw card fields to the card table (once per card id)."""
+        slot = self._card_slots.get(fields[0])
+        if slot is None:
+            slot = len(self.cards)
+            self.cards.append(fields)
+            self._card_slots[fields[0]] = slot
+        return slot
+
+    def card_slot(self, card_id: str) -> int:
+        """Get card table index for a registered card id."""
+        return self._card_slots[card_id]
+
+    def _grow(self) -> None:
+        """Double column capacity."""
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(self._capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    def _new_row(self, code: int, time: float) -> int:
+        """Reserve next row and write its type and time."""
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        self._size += 1
+        self._columns["type"][row] = code
+        self._columns["time"][row] = time
+        return row
+
+    def add_draw(
+        self,
+        time: float,
+        card_slot: int,
+        player_attack: int,
+        player_defense: int,
+        player_essence_rate: float,
+    ) -> None:
+        """Append a card draw event."""
+        row = self._new_row(DRAW, time)
+        columns = self._columns
+        columns["card"][row] = card_slot
+        columns["player_attack"][row] = player_attack
+        columns["player_defense"][row] = player_defense
+        columns["player_essence_rate"][row] = player_essence_rate
+
+    def add_reshuffle(self, time: float, deck_size: int, cooldown: float) -> None:
+        """Append a reshuffle (deck exhausted) event."""
+        row = self._new_row(RESHUFFLE, time)
+        self._columns["count"][row] = deck_size
+        self._columns["value"][row] = cooldown
+
+    def add_enemy_spawn(
+        self,
+        time: float,
+        enemy_number: int,
+        max_health: float,
+        atk_per_tick: float,
+        def_per_tick: float,
+        is_boss: bool,
+        player_hp: float,
+        player_attack: int,
+        player_defense: int,
+    ) -> None:
+        """Append an enemy spawn event."""
+        row = self._new_row(ENEMY_SPAWN, time)
+        columns = self._columns
+        columns["enemy_number"][row] = enemy_number
+        columns["enemy_hp"][row] = max_health
+        columns["enemy_attack"][row] = atk_per_tick
+        columns["enemy_defense"][row] = def_per_tick
+        columns["flag"][row] = is_boss
+        columns["player_hp"][row] = player_hp
+        columns["player_attack"][row] = player_attack
+        columns["player_defense"][row] = player_defense
+
+    def add_combat_tick(
+        self,
+        time: float,
+        enemy_number: int,
+        player_damage: float,
+        enemy_damage: float,
+        enemy_hp: float,
+        enemy_attack: float,
+        enemy_defense: float,
+        player_hp: float,
+        player_attack: int,
+        player_defense: int,
+        ticks_elapsed: int,
+    ) -> None:
+        """Append a combat tick event."""
+        row = self._new_row(COMBAT_TICK, time)
+        columns = self._columns
+        columns["enemy_number"][row] = enemy_number
+        columns["player_damage"][row] = player_damage
+        columns["enemy_damage"][row] = enemy_damage
+        columns["enemy_hp"][row] = enemy_hp
+        columns["enemy_attack"][row] = enemy_attack
+        columns["enemy_defense"][row] = enemy_defense
+        columns["player_hp"][row] = player_hp
+        columns["player_attack"][row] = player_attack
+        columns["player_defense"][row] = player_defense
+        columns["count"][row] = ticks_elapsed
+
+    def add_victory(
+        self,
+        time: float,
+        enemy_number: int,
+        combat_duration: float,
+        overkill: float,
+        shards_earned: int,
+        is_boss: bool,
+        player_hp: float,
+    ) -> None:
+        """Append an enemy defeated event."""
+        row = self._new_row(VICTORY, time)
+        columns = self._columns
+        columns["enemy_number"][row] = enemy_number
+        columns["value"][row] = combat_duration
+        columns["enemy_hp"][row] = overkill
+        columns["shards"][row] = shards_earned
+        columns["flag"][row] = is_boss
+        columns["player_hp"][row] = player_hp
+
+    def add_death(
+        self,
+        time: float,
+        furthest_enemy: int,
+        enemies_defeated: int,
+        essence_earned: float,
+        shards_earned: int,
+        deaths: int,
+    ) -> None:
+        """Append a player death event."""
+        row = self._new_row(DEATH, time)
+        columns = self._columns
+        columns["enemy_number"][row] = furthest_enemy
+        columns["count"][row] = enemies_defeated
+        columns["essence"][row] = essence_earned
+        columns["shards"][row] = shards_earned
+        columns["aux"][row] = deaths
+
+    def add_pack_affordable(
+        self, time: float, pack_number: int, pack_cost: float, essence: float
+    ) -> None:
+        """Append a pack affordable event (costs may be fractional config overrides)."""
+        row = self._new_row(PACK_AFFORDABLE, time)
+        self._columns["count"][row] = pack_number
+        self._columns["value"][row] = pack_cost
+        self._columns["essence"][row] = essence
+
+    def append(self, event_type: str, time: float, data: dict[str, Any]) -> None:
+        """Append an event from its results-format data dict.
+
+        Slower than the typed add_* methods; used for converting traces.
+
+        Args:
+            event_type: Event type name (see EVENT_TYPES)
+            time: Event time in seconds
+            data: Event data fields
+        """
+        code = EVENT_TYPE_CODES[event_type]
+        if event_type == "draw":
+            card_fields = (
+                data.get("card_id", ""),
+                data.get("card_name", ""),
+                data.get("essence_rate", 0.0),
+                data.get("essence_burst", 0),
+                data.get("attack", 0),
+                data.get("defense", 0),
+            )
+            slot = self._register_card_fields(card_fields)
+
+        row = self._new_row(code, time)
+        if event_type == "draw":
+            self._columns["card"][row] = slot
+        for key, column, _ in EVENT_SCHEMAS[event_type]:
+            if key in data:
+                self._columns[column][row] = data[key]
+
+    def empty_like(self, capacity: int = 1024) -> "EventLog":
+        """Create an empty log with a copy of this log's card table.
+
+        Draw events can be appended with the same card slots as here (e.g.
+        when a simulation hands its events over in batches).
+
+        Args:
+            capacity: Initial row capacity
+
+        Returns:
+            Empty EventLog
+        """
+        log = EventLog(capacity)
+        log.cards = list(self.cards)
+        log._card_slots = dict(self._card_slots)
+        return log
+
+    def extend(self, other: "EventLog") -> None:
+        """Append every row of another log.
+
+        Columns are copied as whole slices; draw events are remapped to this
+        log's card table (cards not seen yet are registered first). The row
+        count is updated last, so readers of this log never see partly
+        copied rows.
+
+        Args:
+            other: Log whose rows to append (its first time must not precede our last)
+        """
+        slots = np.array(
+            [self._register_card_fields(fields) for fields in other.cards] or [0],
+            dtype=COLUMNS["card"],
+        )
+        count = len(other)
+        if not count:
+            return
+        while self._size + count > self._capacity:
+            self._grow()
+
+        start, end = self._size, self._size + count
+        for name, column in self._columns.items():
+            column[start:end] = other._columns[name][:count]
+        draws = other.type_codes == DRAW
+        self._columns["card"][start:end][draws] = slots[other.column("card")[draws]]
+        self._size = end
+
+    @classmethod
+    def from_dicts(cls, events: Iterable[dict[str, Any]]) -> "EventLog":
+        """Build log from results-format event dicts.
+
+        Args:
+            events: Event dicts with "time", "type" and "data" keys
+
+        Returns:
+            Equivalent columnar log
+        """
+        log = cls()
+        for event in events:
+            log.append(event["type"], event["time"], event.get("data", {}))
+        return log
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: dict[str, np.ndarray],
+        cards: Iterable[tuple[str, str, float, int, int, int]] = (),
+    ) -> "EventLog":
+        """Wrap saved columns (e.g. from columns()) as a log without copying them.
+
+        Appending to the log copies the columns first (they are adopted at
+        full capacity).
+
+        Args:
+            columns: Column name -> array, one entry per name in COLUMNS
+            cards: Card table the "card" column indexes into
+
+        Returns:
+            EventLog over the given arrays
+        """
+        log = cls(capacity=1)
+        log._size = log._capacity = len(columns["time"])
+        log._columns = {
+            name: np.asarray(columns[name], dtype=dtype) for name, dtype in COLUMNS.items()
+        }
+        for fields in cards:
+            log._register_card_fields(tuple(fields))
+        return log
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Number of recorded events."""
+        return self._size
+
+    def __bool__(self) -> bool:
+        """True if any events were recorded."""
+        return self._size > 0
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy view of one column (valid rows only)."""
+        return self._columns[name][: self._size]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Dict-of-arrays view of all columns (zero-copy, valid rows only)."""
+        return {name: column[: self._size] for name, column in self._columns.items()}
+
+    @property
+    def times(self) -> np.ndarray:
+        """Event times in seconds."""
+        return self._columns["time"][: self._size]
+
+    @property
+    def type_codes(self) -> np.ndarray:
+        """Integer event type codes (see EVENT_TYPES)."""
+        return self._columns["type"][: self._size]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by valid rows across all columns."""
+        return sum(column.itemsize * self._size for column in self._columns.values())
+
+    def indices(self, *event_types: str) -> np.ndarray:
+        """Row positions of events with any of the given types.
+
+        Args:
+            event_types: Event type names (all rows if none given)
+
+        Returns:
+            Sorted row indices
+        """
+        if not event_types:
+            return np.arange(self._size)
+        codes = [EVENT_TYPE_CODES[name] for name in event_types]
+        return np.flatnonzero(np.isin(self.type_codes, codes))
+
+    def rows(self, *event_types: str) -> Iterator[dict[str, Any]]:
+        """Lazily materialize row dicts, optionally filtered by type.
+
+        Args:
+            event_types: Event type names (all rows if none given)
+
+        Yields:
+            Results-format event dicts
+        """
+        if not event_types:
+            yield from self
+            return
+        for row in self.indices(*event_types):
+            yield self.row(int(row))
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Materialize one row as a results-format event dict.
+
+        Args:
+            index: Row index (negative indices count from the end)
+
+        Returns:
+            {"time", "time_minutes", "type", "data"} dict
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("event index out of range")
+
+        columns = self._columns
+        event_type = EVENT_TYPES[columns["type"][index]]
+        data: dict[str, Any] = {}
+        if event_type == "draw":
+            data.update(zip(CARD_FIELDS, self.cards[columns["card"][index]], strict=True))
+        for key, column, kind in EVENT_SCHEMAS[event_type]:
+            data[key] = kind(columns[column][index])
+
+        time = float(columns["time"][index])
+        return {"time": time, "time_minutes": time / 60, "type": event_type, "data": data}
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Get row dict by index, or a list of row dicts for a slice."""
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self._size))]
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate lazily over row dicts (rows appended meanwhile are included)."""
+        index = 0
+        while index < self._size:
+            yield self.row(index)
+            index += 1
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialize every row (results-format list of dicts)."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        """Short representation."""
+        return f"EventLog({self._size} events, {self.nbytes:,} bytes)"
+
+
+def as_event_log(events: "EventLog | Iterable[dict[str, Any]]") -> EventLog:
+    """Get a columnar view of simulation events.
+
+    Args:
+        events: EventLog (returned as-is) or results-format event dicts
+
+    Returns:
+        EventLog with the same events
+    """
+    if isinstance(events, EventLog):
+        return events
+    return EventLog.from_dicts(events)
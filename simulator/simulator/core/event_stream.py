@@ -0,0 +1,211 @@
+"""Stream simulation events to a consumer while the simulation is running.
+
+EventStream runs CombatSimulator.simulate in a background thread. Every few
+simulated seconds the simulator hands over the events recorded since the
+last handover as one batch (a small EventLog, see the event_sink argument
+of simulate). Batches go through a bounded queue: once the producer is
+`max_batches` ahead of the consumer it blocks until the consumer catches up,
+so it only ever holds the batch it is recording plus the queued ones.
+
+The consumer appends the batches it takes to a single growing EventLog
+(`events`) and can use everything before `complete_time` as final. A live
+view can therefore start playing as soon as the first batch arrives,
+however long the run is.
+"""
+
+import queue
+import threading
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from simulator.core.event_log import EventLog
+
+if TYPE_CHECKING:
+    from simulator.core.combat import CombatSimulator
+    from simulator.core.deck import Deck
+
+# Simulated seconds of events per batch
+BATCH_SECONDS = 5.0
+
+# Batches the producer may run ahead of the consumer
+MAX_BATCHES = 64
+
+
+class _StreamClosedError(Exception):
+    """Raised inside the producer thread when the consumer closed the stream."""
+
+
+class EventStream:
+    """Simulation run producing its events in batches on a background thread.
+
+    Attributes:
+        events: Events received so far (one log, extended batch by batch)
+        complete_time: Every event before this simulation time has been received
+        finished: True once the last batch has been received
+        results: Simulation results once finished (results["events"] is `events`)
+        error: Exception raised by the simulation, if it failed
+    """
+
+    def __init__(
+        self,
+        simulator: "CombatSimulator",
+        duration_minutes: float,
+        deck: "Deck",
+        batch_seconds: float = BATCH_SECONDS,
+        max_batches: int = MAX_BATCHES,
+        **simulate_kwargs: Any,
+    ) -> None:
+        """Initialize stream (call start() to begin simulating).
+
+        Args:
+            simulator: Simulator to run (used by the producer thread only)
+            duration_minutes: Simulation duration in minutes
+            deck: Deck to simulate with
+            batch_seconds: Simulated seconds of events per batch
+            max_batches: Batches the producer may run ahead before it blocks
+            **simulate_kwargs: Further arguments for CombatSimulator.simulate
+        """
+        self.simulator = simulator
+        self.duration_minutes = duration_minutes
+        self.deck = deck
+        self.batch_seconds = batch_seconds
+        self.simulate_kwargs = simulate_kwargs
+
+        self.events = EventLog()
+        self.complete_time = 0.0
+        self.finished = False
+        self.results: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=max(1, max_batches))
+        self._closed = threading.Event()
+        # Serializes consumers (e.g. a playback thread and a UI thread)
+        self._receive_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "EventStream":
+        """Start the simulation thread.
+
+        Returns:
+            This stream
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._produce, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the simulation (if still running) and release its thread."""
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    # ------------------------------------------------------------------
+    # Producer (background thread)
+    # ------------------------------------------------------------------
+
+    def _produce(self) -> None:
+        """Run the simulation, queueing event batches and then the outcome."""
+        try:
+            results = self.simulator.simulate(
+                duration_minutes=self.duration_minutes,
+                deck=self.deck,
+                event_sink=self._put_batch,
+                sink_interval=self.batch_seconds,
+                **self.simulate_kwargs,
+            )
+        except _StreamClosedError:
+            return
+        except Exception as e:
+            self._put(("error", e))
+        else:
+            self._put(("done", results))
+
+    def _put_batch(self, batch: EventLog, complete_time: float) -> None:
+        """Event sink: queue one batch (blocks while the queue is full)."""
+        self._put(("batch", (batch, complete_time)))
+
+    def _put(self, item: tuple[str, Any]) -> None:
+        """Queue an item, waiting for space unless the stream is closed."""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise _StreamClosedError
+
+    # ------------------------------------------------------------------
+    # Consumer
+    # ------------------------------------------------------------------
+
+    def poll(self, timeout: float | None = 0.0) -> bool:
+        """Receive the next batch (or the end of the run) if there is one.
+
+        Args:
+            timeout: Seconds to wait for it (0: don't wait, None: wait until it arrives)
+
+        Returns:
+            True if anything was received
+        """
+        with self._receive_lock:
+            if self.finished:
+                return False
+            try:
+                if timeout == 0.0:
+                    kind, payload = self._queue.get_nowait()
+                else:
+                    kind, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                return False
+
+            if kind == "batch":
+                batch, complete_time = payload
+                self.events.extend(batch)
+                self.complete_time = complete_time
+            elif kind == "done":
+                payload.events = self.events
+                self.results = payload
+                self.complete_time = float(payload["duration_seconds"])
+                self.finished = True
+            else:
+                self.error = payload
+                self.finished = True
+            return True
+
+    def fill(self, until: float, timeout: float | None = None) -> None:
+        """Receive batches until every event up to a simulation time is in.
+
+        Args:
+            until: Simulation time (seconds)
+            timeout: Seconds to wait for each batch (None: no limit)
+        """
+        while not self.finished and self.complete_time <= until:
+            if not self.poll(timeout):
+                return
+
+    def wait(self) -> dict[str, Any] | None:
+        """Receive everything up to the end of the run.
+
+        Returns:
+            Simulation results (None if the simulation failed, see `error`)
+        """
+        self.fill(float("inf"))
+        return self.results
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over results-format event dicts as they are produced.
+
+        Raises:
+            Exception: The simulation's exception, if it failed
+        """
+        index = 0
+        while True:
+            while index < len(self.events):
+                yield self.events[index]
+                index += 1
+            if self.finished:
+                break
+            self.poll(timeout=None)
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,154 @@
+"""Closed-form resolution of a single fight.
+
+Within one fight the player's ATK/DEF after tick i are prefix sums of the
+cards drawn so far, and the enemy's ATK/DEF grow linearly with its tick
+count. Each tick's damage is therefore a simple function of those prefix
+sums, and HP after tick i is a cumulative sum of damage. resolve_fight
+evaluates a whole stretch of upcoming draws at once and finds the victory
+or death tick directly, instead of running the combat loop tick by tick.
+
+Accumulations are sequential (np.add.accumulate), so HP values match the
+tick-by-tick loop bit for bit.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from simulator.core.cards import Card
+    from simulator.core.combat import Enemy
+
+
+@dataclass
+class FightResolution:
+    """Outcome of resolving a stretch of combat ticks.
+
+    Per-tick arrays hold the state after each resolved tick (index 0 = first
+    tick), so callers can fast-forward to any tick before the outcome.
+    """
+
+    outcome: str | None  # "victory", "death", or None if undecided within the draws given
+    ticks: int  # Ticks resolved (the outcome tick, or every tick given)
+    draw_index: int  # Position in the draw order after those ticks
+    player_hp: float
+    enemy_hp: float
+    attack: int
+    defense: int
+    enemy_ticks: int  # Enemy combat_ticks_elapsed after those ticks
+    attack_by_tick: np.ndarray
+    defense_by_tick: np.ndarray
+    player_damage_by_tick: np.ndarray
+    enemy_damage_by_tick: np.ndarray
+    player_hp_by_tick: np.ndarray
+    enemy_hp_by_tick: np.ndarray
+
+
+def resolve_fight_arrays(
+    attack_gain: np.ndarray,
+    defense_gain: np.ndarray,
+    enemy: "Enemy",
+    player_hp: float,
+    attack: int = 0,
+    defense: int = 0,
+) -> FightResolution:
+    """Resolve combat ticks given the ATK/DEF each upcoming tick adds.
+
+    Array form of resolve_fight: element i is what the draw on tick i+1
+    adds (0 for ticks without a draw, e.g. during reshuffle cooldown).
+
+    Args:
+        attack_gain: ATK added before each tick's combat
+        defense_gain: DEF added before each tick's combat
+        enemy: Enemy being fought (current HP and ticks elapsed are the start state)
+        player_hp: Player HP at the start
+        attack: Player ATK at the start
+        defense: Player DEF at the start
+
+    Returns:
+        FightResolution for the first outcome, or for all ticks if undecided
+    """
+    n = len(attack_gain)
+    enemy_ticks = enemy.combat_ticks_elapsed + np.arange(1, n + 1)
+
+    # Player ATK/DEF are prefix sums of draws; enemy ATK/DEF grow linearly
+    attack_by_tick = np.add.accumulate(np.concatenate([[attack], attack_gain]))[1:]
+    defense_by_tick = np.add.accumulate(np.concatenate([[defense], defense_gain]))[1:]
+    enemy_attack = enemy.atk_per_tick * enemy_ticks
+    enemy_defense = enemy.def_per_tick * enemy_ticks
+
+    # Damage (ATK - DEF, no minimum) and HP as running totals
+    player_damage = np.maximum(attack_by_tick - enemy_defense, 0)
+    enemy_damage = np.maximum(enemy_attack - defense_by_tick, 0)
+    enemy_hp = np.add.accumulate(np.concatenate([[enemy.current_health], -player_damage]))[1:]
+    hp = np.add.accumulate(np.concatenate([[player_hp], -enemy_damage]))[1:]
+
+    # Victory is checked before defeat on the same tick
+    victory = np.flatnonzero(enemy_hp <= 0)
+    death = np.flatnonzero(hp <= 0)
+    victory_tick = victory[0] + 1 if len(victory) else n + 1
+    death_tick = death[0] + 1 if len(death) else n + 1
+
+    if victory_tick <= death_tick and victory_tick <= n:
+        outcome, ticks = "victory", int(victory_tick)
+    elif death_tick <= n:
+        outcome, ticks = "death", int(death_tick)
+    else:
+        outcome, ticks = None, n
+
+    enemy_hp = np.maximum(enemy_hp[:ticks], 0)
+    hp = np.maximum(hp[:ticks], 0)
+    return FightResolution(
+        outcome=outcome,
+        ticks=ticks,
+        draw_index=ticks,
+        player_hp=float(hp[-1]) if ticks else player_hp,
+        enemy_hp=float(enemy_hp[-1]) if ticks else enemy.current_health,
+        attack=int(attack_by_tick[ticks - 1]) if ticks else attack,
+        defense=int(defense_by_tick[ticks - 1]) if ticks else defense,
+        enemy_ticks=enemy.combat_ticks_elapsed + ticks,
+        attack_by_tick=attack_by_tick[:ticks],
+        defense_by_tick=defense_by_tick[:ticks],
+        player_damage_by_tick=player_damage[:ticks],
+        enemy_damage_by_tick=enemy_damage[:ticks],
+        player_hp_by_tick=hp,
+        enemy_hp_by_tick=enemy_hp,
+    )
+
+
+def resolve_fight(
+    draw_order: Sequence["Card | None"],
+    start_index: int,
+    enemy: "Enemy",
+    player_hp: float,
+    attack: int = 0,
+    defense: int = 0,
+) -> FightResolution:
+    """Resolve a fight in closed form over the upcoming draws.
+
+    Each entry of `draw_order` from `start_index` on is one combat tick:
+    the card drawn before that tick's combat, or None for a tick without a
+    draw (reshuffle cooldown).
+
+    Args:
+        draw_order: Upcoming draws, one per tick
+        start_index: Position of the next tick's draw in `draw_order`
+        enemy: Enemy being fought (current HP and ticks elapsed are the start state)
+        player_hp: Player HP at the start
+        attack: Player ATK at the start
+        defense: Player DEF at the start
+
+    Returns:
+        FightResolution with the victory/death tick, remaining HP and the
+        position in `draw_order` after the resolved ticks (outcome None if
+        the fight outlasts the draws given)
+    """
+    upcoming = draw_order[start_index:]
+    attack_gain = np.array([card.attack if card else 0 for card in upcoming], dtype=np.int64)
+    defense_gain = np.array([card.defense if card else 0 for card in upcoming], dtype=np.int64)
+
+    resolution = resolve_fight_arrays(attack_gain, defense_gain, enemy, player_hp, attack, defense)
+    resolution.draw_index = start_index + resolution.ticks
+    return resolution
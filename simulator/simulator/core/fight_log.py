@@ -0,0 +1,358 @@
+"""Per-fight record table.
+
+One fixed-width row per fight (an enemy's spawn until its defeat, the
+player's death or the end of the run), written by the simulator as it
+runs. Columns are preallocated NumPy arrays, doubled when full, like
+EventLog; unlike the event trace the table is always recorded (a run has
+at most a few hundred fights).
+
+Tables from several runs can be joined with FightLog.concat (the "run"
+column tells them apart) and reduced per enemy with mean_by_enemy.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import numpy as np
+
+from simulator.core.event_log import COMBAT_TICK, DEATH, ENEMY_SPAWN, VICTORY, EventLog
+
+# Fight outcome names, indexed by their integer code
+FIGHT_OUTCOMES = ("unresolved", "victory", "death")
+FIGHT_OUTCOME_CODES = {name: code for code, name in enumerate(FIGHT_OUTCOMES)}
+
+UNRESOLVED = FIGHT_OUTCOME_CODES["unresolved"]
+WON = FIGHT_OUTCOME_CODES["victory"]
+LOST = FIGHT_OUTCOME_CODES["death"]
+
+# Column name -> dtype
+FIGHT_COLUMNS: dict[str, type] = {
+    "run": np.int32,
+    "enemy_number": np.int32,
+    "spawn_time": np.float64,
+    "end_time": np.float64,  # End of run for unresolved fights
+    "outcome": np.uint8,  # See FIGHT_OUTCOMES
+    "ticks": np.int32,
+    "damage_dealt": np.float64,
+    "damage_taken": np.float64,
+    "overkill": np.float64,
+    "player_hp_start": np.float64,
+    "player_hp_end": np.float64,
+    "enemy_max_hp": np.float64,
+    "enemy_atk_per_tick": np.float64,
+    "enemy_def_per_tick": np.float64,
+    "is_boss": np.bool_,
+}
+
+
+class FightLog:
+    """Growable, array-backed table with one row per fight.
+
+    The simulator calls start() at each spawn and end() when the fight is
+    decided; a fight still open when the run stops is ended as UNRESOLVED.
+    """
+
+    def __init__(self, capacity: int = 64, run: int = 0) -> None:
+        """Initialize empty table.
+
+        Args:
+            capacity: Initial row capacity
+            run: Value of the "run" column for fights started in this table
+        """
+        self.run = run
+        self._size = 0
+        self._capacity = max(1, capacity)
+        self._columns = {
+            name: np.zeros(self._capacity, dtype=dtype) for name, dtype in FIGHT_COLUMNS.items()
+        }
+        self._open = False  # Last row is a fight that has not ended yet
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _grow(self, size: int) -> None:
+        """Double column capacity until it holds `size` rows."""
+        while self._capacity < size:
+            self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(self._capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    def start(
+        self,
+        time: float,
+        enemy_number: int,
+        player_hp: float,
+        max_health: float,
+        atk_per_tick: float,
+        def_per_tick: float,
+        is_boss: bool,
+    ) -> None:
+        """Append a fight at its enemy's spawn."""
+        if self._size == self._capacity:
+            self._grow(self._size + 1)
+        row = self._size
+        self._size += 1
+        self._open = True
+        columns = self._columns
+        columns["run"][row] = self.run
+        columns["enemy_number"][row] = enemy_number
+        columns["spawn_time"][row] = time
+        columns["outcome"][row] = UNRESOLVED
+        columns["player_hp_start"][row] = player_hp
+        columns["enemy_max_hp"][row] = max_health
+        columns["enemy_atk_per_tick"][row] = atk_per_tick
+        columns["enemy_def_per_tick"][row] = def_per_tick
+        columns["is_boss"][row] = is_boss
+
+    def end(
+        self,
+        time: float,
+        outcome: int,
+        ticks: int,
+        damage_dealt: float,
+        damage_taken: float,
+        player_hp: float,
+        overkill: float = 0.0,
+    ) -> None:
+        """Fill in the outcome of the open fight.
+
+        Args:
+            time: Time the fight ended (seconds)
+            outcome: WON, LOST or UNRESOLVED
+            ticks: Combat ticks fought
+            damage_dealt: Damage the player dealt in this fight
+            damage_taken: Damage the player took in this fight
+            player_hp: Player HP when the fight ended
+            overkill: Damage beyond the enemy's remaining HP (victories)
+        """
+        if not self._open:
+            return
+        row = self._size - 1
+        self._open = False
+        columns = self._columns
+        columns["end_time"][row] = time
+        columns["outcome"][row] = outcome
+        columns["ticks"][row] = ticks
+        columns["damage_dealt"][row] = damage_dealt
+        columns["damage_taken"][row] = damage_taken
+        columns["player_hp_end"][row] = player_hp
+        columns["overkill"][row] = overkill
+
+    @classmethod
+    def concat(cls, logs: Iterable["FightLog"]) -> "FightLog":
+        """Join tables (e.g. one per Monte Carlo run) into one.
+
+        Args:
+            logs: Tables to join, in order (their "run" columns are kept)
+
+        Returns:
+            New table with every row of `logs`
+        """
+        logs = list(logs)
+        joined = cls(capacity=sum(len(log) for log in logs))
+        offset = 0
+        for log in logs:
+            for name, column in joined._columns.items():
+                column[offset : offset + len(log)] = log.column(name)
+            offset += len(log)
+        joined._size = offset
+        return joined
+
+    @classmethod
+    def from_events(cls, events: EventLog, duration_seconds: float) -> "FightLog":
+        """Rebuild the table from an event trace (for results without one).
+
+        Each spawn is paired with the first victory or death after it.
+        Ticks and damage are only known if the trace has combat ticks
+        (RecordLevel.FIGHTS or higher); they are 0 otherwise.
+
+        Args:
+            events: Event trace with at least milestone events
+            duration_seconds: End of the run (end time of unresolved fights)
+
+        Returns:
+            Equivalent FightLog
+        """
+        codes = events.type_codes
+        spawns = np.flatnonzero(codes == ENEMY_SPAWN)
+        ends = np.flatnonzero((codes == VICTORY) | (codes == DEATH))
+        log = cls(capacity=len(spawns))
+        log._size = len(spawns)
+        if not len(spawns):
+            return log
+
+        if len(ends):
+            candidates = ends[np.minimum(np.searchsorted(ends, spawns), len(ends) - 1)]
+            next_spawns = np.append(spawns[1:], len(events))
+            # A spawn followed by another spawn first never got an outcome
+            ended = (candidates > spawns) & (candidates < next_spawns)
+        else:
+            candidates = np.zeros(len(spawns), dtype=np.int64)
+            ended = np.zeros(len(spawns), dtype=bool)
+        won = ended & (codes[candidates] == VICTORY)
+
+        source = events.columns()
+        columns = log._columns
+        columns["enemy_number"][:] = source["enemy_number"][spawns]
+        columns["spawn_time"][:] = source["time"][spawns]
+        columns["end_time"][:] = np.where(ended, source["time"][candidates], duration_seconds)
+        columns["outcome"][:] = np.where(won, WON, np.where(ended, LOST, UNRESOLVED))
+        columns["overkill"][:] = np.where(won, source["enemy_hp"][candidates], 0.0)
+        columns["player_hp_start"][:] = source["player_hp"][spawns]
+        columns["player_hp_end"][:] = np.where(won, source["player_hp"][candidates], 0.0)
+        columns["enemy_max_hp"][:] = source["enemy_hp"][spawns]
+        columns["enemy_atk_per_tick"][:] = source["enemy_attack"][spawns]
+        columns["enemy_def_per_tick"][:] = source["enemy_defense"][spawns]
+        columns["is_boss"][:] = source["flag"][spawns]
+
+        # Combat ticks belong to the latest spawn before them
+        ticks = np.flatnonzero(codes == COMBAT_TICK)
+        if len(ticks):
+            fight = np.searchsorted(spawns, ticks) - 1
+            ticks, fight = ticks[fight >= 0], fight[fight >= 0]
+            columns["ticks"][:] = np.bincount(fight, minlength=len(spawns))
+            for name, source_name in (
+                ("damage_dealt", "player_damage"),
+                ("damage_taken", "enemy_damage"),
+            ):
+                columns[name][:] = np.bincount(
+                    fight, weights=source[source_name][ticks], minlength=len(spawns)
+                )
+            # Unresolved fights end with the player's HP after their last tick
+            last_tick = np.full(len(spawns), -1)
+            last_tick[fight] = ticks
+            open_with_ticks = ~ended & (last_tick >= 0)
+            columns["player_hp_end"][open_with_ticks] = source["player_hp"][
+                last_tick[open_with_ticks]
+            ]
+        return log
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, np.ndarray], run: int = 0) -> "FightLog":
+        """Wrap saved columns (e.g. from columns()) as a table without copying them.
+
+        Args:
+            columns: Column name -> array, one entry per name in FIGHT_COLUMNS
+            run: "run" value for fights started in this table
+
+        Returns:
+            FightLog over the given arrays (every fight closed)
+        """
+        log = cls(capacity=1, run=run)
+        log._size = log._capacity = len(columns["spawn_time"])
+        log._columns = {
+            name: np.asarray(columns[name], dtype=dtype) for name, dtype in FIGHT_COLUMNS.items()
+        }
+        return log
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Number of fights recorded."""
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy view of one column (valid rows only)."""
+        return self._columns[name][: self._size]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Dict-of-arrays view of all columns (zero-copy, valid rows only)."""
+        return {name: column[: self._size] for name, column in self._columns.items()}
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Seconds from spawn to the end of each fight."""
+        return self.column("end_time") - self.column("spawn_time")
+
+    def indices(self, outcome: str | None = None, enemy_number: int | None = None) -> np.ndarray:
+        """Row positions of fights matching an outcome and/or enemy.
+
+        Args:
+            outcome: "victory", "death" or "unresolved" (any if None)
+            enemy_number: Enemy sequence number (any if None)
+
+        Returns:
+            Sorted row indices
+        """
+        mask = np.ones(self._size, dtype=bool)
+        if outcome is not None:
+            mask &= self.column("outcome") == FIGHT_OUTCOME_CODES[outcome]
+        if enemy_number is not None:
+            mask &= self.column("enemy_number") == enemy_number
+        return np.flatnonzero(mask)
+
+    def mean_by_enemy(
+        self, values: str | np.ndarray, outcome: str | None = None
+    ) -> dict[int, float]:
+        """Average a column (or per-fight values) per enemy number.
+
+        Args:
+            values: Column name, or an array aligned with the rows (e.g. durations)
+            outcome: Only average fights with this outcome
+
+        Returns:
+            Enemy number -> mean over that enemy's fights
+        """
+        if isinstance(values, str):
+            values = self.column(values)
+        rows = self.indices(outcome)
+        enemies = self.column("enemy_number")[rows]
+        counts = np.bincount(enemies)
+        sums = np.bincount(enemies, weights=values[rows])
+        return {
+            int(enemy): float(sums[enemy] / counts[enemy]) for enemy in np.flatnonzero(counts)
+        }
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Materialize one fight as a dict of Python values.
+
+        Args:
+            index: Row index (negative indices count from the end)
+
+        Returns:
+            Column name -> value ("outcome" as its name)
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("fight index out of range")
+        row = {name: column[index].item() for name, column in self._columns.items()}
+        row["outcome"] = FIGHT_OUTCOMES[row["outcome"]]
+        return row
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over fight dicts."""
+        for index in range(self._size):
+            yield self.row(index)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialize every fight (list of dicts)."""
+        return list(self)
+
+    def to_records(self) -> np.ndarray:
+        """Copy the table into one NumPy structured array (e.g. for np.save).
+
+        Returns:
+            Structured array with one field per column
+        """
+        records = np.empty(self._size, dtype=list(FIGHT_COLUMNS.items()))
+        for name, column in self.columns().items():
+            records[name] = column
+        return records
+
+    def __eq__(self, other: object) -> bool:
+        """Tables are equal when every column holds the same rows."""
+        if not isinstance(other, FightLog):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            np.array_equal(column, other.column(name)) for name, column in self.columns().items()
+        )
+
+    def __repr__(self) -> str:
+        """Short representation."""
+        return f"FightLog({self._size} fights)"
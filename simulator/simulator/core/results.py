@@ -0,0 +1,204 @@
+"""Results of one simulation run.
+
+CombatSimulator.simulate() returns a SimulationResult: scalar stats are
+plain attributes, and the per-run tables (events, state history, fights)
+are the simulator's own columnar objects, handed over without copying.
+Nothing is converted to dicts until someone asks: combat duration
+averages are computed from the fight table on access, and rows of the
+event and state tables materialize one at a time as they are read.
+
+SimulationResult is also a read-only Mapping with the keys of the old
+results dict, so results["final_essence"], results.get(...) and
+iteration over items() keep working. to_dict() builds that dict, with
+events and state history as lists of dicts, for callers that need plain
+Python values. save() and load() write and read a run as an on-disk
+archive of typed columns (see archive.py).
+"""
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from simulator.core.event_log import EventLog
+from simulator.core.fight_log import FightLog
+from simulator.core.state_history import StateHistory
+
+# Results keys, in the order of the original results dict
+RESULT_KEYS = (
+    "duration_minutes",
+    "duration_seconds",
+    "status",
+    "final_essence",
+    "final_shards",
+    "cards_drawn",
+    "enemies_defeated",
+    "enemies_encountered",
+    "total_damage_dealt",
+    "total_damage_taken",
+    "combat_ticks",
+    "player_hp",
+    "player_max_hp",
+    "player_attack",
+    "player_defense",
+    "player_essence_rate",
+    "player_deaths",
+    "furthest_enemy",
+    "avg_combat_duration",
+    "total_combat_time",
+    "combat_count",
+    "fights",
+    "pack_affordable_times",
+    "events",
+    "state_history",
+    "record_level",
+    "seed",
+    "run_index",
+)
+
+
+@dataclass(eq=False)
+class SimulationResult(Mapping[str, Any]):
+    """One run's stats and tables (also readable as a results dict).
+
+    Attributes:
+        duration_minutes: Simulated duration
+        final_essence..furthest_enemy: End-of-run stats
+        fights: One row per fight
+        events: Columnar event trace (empty at RecordLevel.OFF or when streamed)
+        state_history: State snapshots
+        pack_affordable_times: Pack number -> first time it was affordable (minutes)
+        record_level: Event recording level name
+        seed: Entropy of the run's seed sequence
+        run_index: Run index within its seed
+        status: "completed"
+    """
+
+    duration_minutes: float
+    final_essence: float
+    final_shards: int
+    cards_drawn: int
+    enemies_defeated: int
+    enemies_encountered: int
+    total_damage_dealt: float
+    total_damage_taken: float
+    combat_ticks: int
+    player_hp: float
+    player_max_hp: float
+    player_attack: float
+    player_defense: float
+    player_essence_rate: float
+    player_deaths: int
+    furthest_enemy: int
+    fights: FightLog
+    events: EventLog
+    state_history: StateHistory
+    pack_affordable_times: dict[int, float] = field(default_factory=dict)
+    record_level: str = "off"
+    seed: int | None = None
+    run_index: int = 0
+    status: str = "completed"
+
+    @property
+    def duration_seconds(self) -> float:
+        """Simulated duration in seconds."""
+        return self.duration_minutes * 60
+
+    @property
+    def combat_durations(self) -> list[float]:
+        """Seconds from spawn to victory of each won fight."""
+        durations: list[float] = self.fights.durations[self.fights.indices("victory")].tolist()
+        return durations
+
+    @property
+    def total_combat_time(self) -> float:
+        """Seconds spent in won fights."""
+        return sum(self.combat_durations)
+
+    @property
+    def combat_count(self) -> int:
+        """Number of won fights."""
+        return len(self.fights.indices("victory"))
+
+    @property
+    def avg_combat_duration(self) -> float:
+        """Mean duration of won fights (0.0 without any)."""
+        durations = self.combat_durations
+        return sum(durations) / len(durations) if durations else 0.0
+
+    # ------------------------------------------------------------------
+    # Mapping (results dict) interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        """Value of a results key."""
+        if key not in RESULT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over results keys."""
+        return iter(RESULT_KEYS)
+
+    def __len__(self) -> int:
+        """Number of results keys."""
+        return len(RESULT_KEYS)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Build the plain results dict (events and states as lists of dicts).
+
+        Returns:
+            Results key -> value; the FightLog is kept as-is
+        """
+        results = dict(self.items())
+        results["events"] = self.events.to_dicts()
+        results["state_history"] = self.state_history.to_dicts()
+        return results
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path | str) -> Path:
+        """Write this run to an archive directory (see simulator.core.archive).
+
+        Args:
+            path: Archive directory (e.g. "output/run.simrun")
+
+        Returns:
+            Archive directory
+        """
+        from simulator.core.archive import save_results
+
+        return save_results(path, [self])
+
+    @classmethod
+    def load(cls, path: Path | str, mmap: bool = True) -> "SimulationResult":
+        """Open a one-run archive written by save().
+
+        Args:
+            path: Archive directory
+            mmap: Memory-map the columns (False: read them into memory)
+
+        Returns:
+            SimulationResult whose tables view the archive's columns
+
+        Raises:
+            ValueError: If the archive holds more than one run (see load_results)
+        """
+        from simulator.core.archive import load_results
+
+        archive = load_results(path, mmap=mmap)
+        if len(archive) != 1:
+            raise ValueError(
+                f"{path} holds {len(archive)} runs; open it with load_results() instead"
+            )
+        return archive[0]
+
+    def __repr__(self) -> str:
+        """Short representation."""
+        return (
+            f"SimulationResult({self.duration_minutes:g} min, "
+            f"essence={self.final_essence:,.0f}, enemies_defeated={self.enemies_defeated}, "
+            f"{len(self.events)} events, {len(self.state_history)} states)"
+        )
@@ -0,0 +1,234 @@
+"""Content-addressed on-disk cache of simulation runs.
+
+A seeded run is fully determined by its inputs, so its results can be
+stored once and reused. Each entry is keyed by the SHA-256 of a canonical
+JSON description of those inputs: the deck's card list (in order, since
+shuffles depend on it), the balance config contents (BalanceConfig.digest),
+the seed and run index, the duration, the engine and recording options,
+and ENGINE_VERSION.
+
+Entries are uncompressed .npz files, one per run: every column of the
+event log, state history and fight log as a NumPy array, plus the run's
+JSON header in the result archive format (see archive.py). Writes go to
+a temporary file in the cache directory that is then renamed over the
+entry (os.replace is atomic), so
+concurrent workers never read a partial entry and the last writer of a
+key simply wins. Reads touch the entry's mtime; when the directory grows
+past max_bytes, the least recently used entries are deleted.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from simulator.core.archive import (
+    ARCHIVE_TABLES,
+    result_from_columns,
+    result_header,
+    result_tables,
+    to_json,
+)
+from simulator.core.balance_config import BalanceConfig
+from simulator.core.results import SimulationResult
+
+if TYPE_CHECKING:
+    from simulator.core.deck import Deck
+
+# Bump whenever a simulator change alters the results of a seeded run,
+# so entries written by older code are never returned
+ENGINE_VERSION = 2
+
+# Default cache location (simulator/.cache/runs) and size limit
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "runs"
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+# Entry file format version (header "format")
+_FORMAT = 1
+
+
+def canonical_json(value: Any) -> str:
+    """JSON with sorted keys and no whitespace (same input, same text)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=to_json)
+
+
+def run_key(deck: "Deck", config: BalanceConfig, **params: Any) -> str:
+    """Cache key of a seeded run.
+
+    Args:
+        deck: Deck the run simulates (its card list, in order, is hashed)
+        config: Balance config of the run
+        **params: Every other input that affects the results (seed, run index,
+            duration, engine, recording options, timing overrides)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "engine_version": ENGINE_VERSION,
+        "deck": [card.model_dump(mode="json") for card in deck.cards],
+        "config": config.digest,
+        **params,
+    }
+    return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+
+
+def encode_result(result: SimulationResult) -> dict[str, np.ndarray]:
+    """Flatten a result into named arrays (the contents of a cache entry).
+
+    Args:
+        result: Simulation result
+
+    Returns:
+        Array name -> array ("header" holds the JSON header as bytes)
+    """
+    header = {"format": _FORMAT, **result_header(result)}
+    arrays = {"header": np.frombuffer(canonical_json(header).encode("utf-8"), dtype=np.uint8)}
+    for table, columns in result_tables(result).items():
+        for name, column in columns.items():
+            arrays[f"{table}.{name}"] = column
+    return arrays
+
+
+def decode_result(arrays: dict[str, np.ndarray]) -> SimulationResult:
+    """Rebuild a result from the arrays of encode_result.
+
+    Args:
+        arrays: Array name -> array
+
+    Returns:
+        Equivalent SimulationResult
+
+    Raises:
+        ValueError: If the arrays were written in another format
+    """
+    header = json.loads(bytes(arrays["header"]).decode("utf-8"))
+    if header.get("format") != _FORMAT:
+        raise ValueError(f"Unsupported run cache format: {header.get('format')}")
+    tables = {
+        table: {name: arrays[f"{table}.{name}"] for name in columns}
+        for table, columns in ARCHIVE_TABLES.items()
+    }
+    return result_from_columns(header, tables)
+
+
+class RunCache:
+    """Directory of cached simulation results, keyed by run_key().
+
+    Attributes:
+        directory: Where entries are stored (created on first write)
+        max_bytes: Size the directory is trimmed to after each write
+        hits: get() calls that returned an entry
+        misses: get() calls that did not
+    """
+
+    def __init__(
+        self, directory: Path | str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_BYTES
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            directory: Cache directory
+            max_bytes: Most bytes of entries kept (least recently used go first)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> Path:
+        """Entry file of a key."""
+        return self.directory / f"{key}.npz"
+
+    def get(self, key: str) -> SimulationResult | None:
+        """Load a cached result.
+
+        Args:
+            key: Cache key (see run_key)
+
+        Returns:
+            Cached result, or None if there is no (readable) entry
+        """
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+            result = decode_result(arrays)
+            os.utime(path)  # Most recently used
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # Missing, evicted meanwhile, or written by an incompatible version
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        """Store a result (atomically replacing any entry with the same key).
+
+        Args:
+            key: Cache key (see run_key)
+            result: Result to store
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.savez(file, allow_pickle=False, **encode_result(result))
+            os.replace(temp_name, self.path(key))
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every entry, least recently used first."""
+        entries = []
+        for path in self.directory.glob("*.npz"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # Evicted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            Number of entries deleted
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        deleted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            deleted += 1
+        return deleted
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """Number of entries."""
+        return len(self._entries())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def __repr__(self) -> str:
+        """Short representation."""
+        return f"RunCache({self.directory}, {len(self)} entries, {self.nbytes:,} bytes)"
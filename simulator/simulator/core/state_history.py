@@ -0,0 +1,321 @@
+"""Bounded, columnar state history.
+
+The simulator snapshots a handful of scalars (time, essence, player and
+enemy stats) every few seconds. StateHistory stores them as one row across
+fixed-dtype NumPy columns in a ring buffer: columns grow by doubling up to
+`capacity` rows, after which each new row overwrites the oldest one, so a
+run's history never takes more than capacity * row size bytes.
+
+Sampling is either fixed (every snapshot offered is kept) or adaptive:
+with `tolerances`, an offered snapshot is only kept when a tracked field
+moved by more than its tolerance since the last kept row, or when
+`max_interval` seconds have passed. Offering snapshots at a fine
+resolution then gives dense rows while fights change HP and stats and
+sparse rows while little changes.
+
+Reading mirrors EventLog: len(), indexing and iteration give lazy
+results-format dicts, column() gives a whole field as an array.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import numpy as np
+
+# Column name -> dtype
+STATE_COLUMNS: dict[str, type] = {
+    "time": np.float64,
+    "essence": np.float64,
+    "player_hp": np.float64,
+    "player_essence_rate": np.float64,
+    "player_attack": np.int64,
+    "player_defense": np.int64,
+    "player_deaths": np.int32,
+    "cards_drawn": np.int64,
+    "enemies_defeated": np.int32,
+    "in_combat": np.bool_,
+    "enemy_number": np.int32,  # 0 when no enemy is spawned
+    "enemy_hp": np.float64,
+}
+
+# Default maximum rows kept (a 10 s interval covers ~22 hours)
+STATE_HISTORY_CAPACITY = 8192
+
+# Example tolerances for adaptive sampling: HP moves, stat swings, kills and deaths
+ADAPTIVE_STATE_TOLERANCES: dict[str, float] = {
+    "player_hp": 5.0,
+    "player_attack": 25.0,
+    "player_defense": 25.0,
+    "player_essence_rate": 0.0,
+    "enemies_defeated": 0.0,
+    "player_deaths": 0.0,
+    "enemy_hp": 250.0,
+}
+
+
+class StateHistory:
+    """Ring buffer of state snapshots with optional change-based sampling.
+
+    Attributes:
+        capacity: Most rows kept (older rows are overwritten)
+        tolerances: Field -> change that makes a snapshot worth keeping
+            (None: keep every snapshot)
+        max_interval: With tolerances, keep a snapshot at least this often (seconds)
+        offered: Snapshots offered to record()
+        dropped: Rows overwritten after the buffer filled up
+    """
+
+    def __init__(
+        self,
+        capacity: int = STATE_HISTORY_CAPACITY,
+        tolerances: dict[str, float] | None = None,
+        max_interval: float | None = None,
+    ) -> None:
+        """Initialize empty history.
+
+        Args:
+            capacity: Most rows kept
+            tolerances: Field -> tolerance for adaptive sampling (None: fixed sampling)
+            max_interval: Longest gap between kept rows in adaptive mode (seconds)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        unknown = set(tolerances or ()) - set(STATE_COLUMNS)
+        if unknown:
+            raise ValueError(
+                f"Unknown state fields in tolerances: {', '.join(sorted(unknown))} "
+                f"(expected STATE_COLUMNS names)"
+            )
+
+        self.capacity = capacity
+        self.tolerances = dict(tolerances) if tolerances is not None else None
+        self.max_interval = max_interval
+        self.offered = 0
+        self.dropped = 0
+
+        self._start = 0  # Physical index of the oldest row
+        self._size = 0
+        self._allocated = min(capacity, 256)
+        self._columns = {
+            name: np.zeros(self._allocated, dtype=dtype) for name, dtype in STATE_COLUMNS.items()
+        }
+        self._last: dict[str, float] = {}  # Tracked fields of the last kept row
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        time: float,
+        essence: float,
+        player_hp: float,
+        player_essence_rate: float,
+        player_attack: int,
+        player_defense: int,
+        player_deaths: int,
+        cards_drawn: int,
+        enemies_defeated: int,
+        in_combat: bool,
+        enemy_number: int = 0,
+        enemy_hp: float = 0.0,
+        force: bool = False,
+    ) -> bool:
+        """Offer a snapshot (kept unless adaptive sampling finds it redundant).
+
+        Args:
+            time..enemy_hp: Snapshot fields (see STATE_COLUMNS)
+            force: Keep the snapshot regardless of tolerances
+
+        Returns:
+            True if the snapshot was kept
+        """
+        self.offered += 1
+        values = {
+            "time": time,
+            "essence": essence,
+            "player_hp": player_hp,
+            "player_essence_rate": player_essence_rate,
+            "player_attack": player_attack,
+            "player_defense": player_defense,
+            "player_deaths": player_deaths,
+            "cards_drawn": cards_drawn,
+            "enemies_defeated": enemies_defeated,
+            "in_combat": in_combat,
+            "enemy_number": enemy_number,
+            "enemy_hp": enemy_hp,
+        }
+        tolerances = self.tolerances
+        if tolerances is not None and not force and self._last:
+            if self.max_interval is None or time - self._last["time"] < self.max_interval:
+                last = self._last
+                if all(abs(values[name] - last[name]) <= tol for name, tol in tolerances.items()):
+                    return False
+
+        if self._size < self.capacity:
+            if self._size == self._allocated:
+                self._grow()
+            row = self._size
+            self._size += 1
+        else:
+            row = self._start
+            self._start = (self._start + 1) % self.capacity
+            self.dropped += 1
+
+        for name, value in values.items():
+            self._columns[name][row] = value
+        if tolerances is not None:
+            self._last = {name: values[name] for name in tolerances}
+            self._last["time"] = time
+        return True
+
+    def _grow(self) -> None:
+        """Double allocated rows (up to capacity); only called before wrapping."""
+        self._allocated = min(self.capacity, self._allocated * 2)
+        for name, column in self._columns.items():
+            grown = np.zeros(self._allocated, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[dict[str, Any]]) -> "StateHistory":
+        """Build history from results-format state dicts (missing fields are 0).
+
+        Args:
+            rows: State dicts in time order
+
+        Returns:
+            Equivalent StateHistory
+        """
+        rows = list(rows)
+        history = cls(capacity=max(1, len(rows)))
+        for row in rows:
+            history.record(**{name: row.get(name, 0) for name in STATE_COLUMNS}, force=True)
+        return history
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: dict[str, np.ndarray],
+        capacity: int | None = None,
+        tolerances: dict[str, float] | None = None,
+        max_interval: float | None = None,
+    ) -> "StateHistory":
+        """Wrap saved columns (e.g. from columns()) as a history without copying them.
+
+        Args:
+            columns: Field -> array (oldest row first), one entry per name in STATE_COLUMNS
+            capacity: Most rows kept from here on (default: the rows given)
+            tolerances: Adaptive sampling tolerances of further records
+            max_interval: Longest gap between kept rows in adaptive mode (seconds)
+
+        Returns:
+            StateHistory over the given arrays
+        """
+        size = len(columns["time"])
+        history = cls(max(1, size, capacity or 0), tolerances, max_interval)
+        if not size:
+            return history
+        history._size = history._allocated = size
+        history._columns = {
+            name: np.asarray(columns[name], dtype=dtype) for name, dtype in STATE_COLUMNS.items()
+        }
+        if tolerances is not None:
+            history._last = {name: history._columns[name][-1].item() for name in tolerances}
+            history._last["time"] = history._columns["time"][-1].item()
+        return history
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Number of rows kept."""
+        return self._size
+
+    def __bool__(self) -> bool:
+        """True if any rows were kept."""
+        return self._size > 0
+
+    def column(self, name: str) -> np.ndarray:
+        """One field for every kept row, oldest first.
+
+        Zero-copy until the buffer has wrapped around; a copy after that.
+        """
+        column = self._columns[name]
+        if self._start == 0:
+            return column[: self._size]
+        return np.concatenate([column[self._start : self._size], column[: self._start]])
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Dict-of-arrays view of every field (see column)."""
+        return {name: self.column(name) for name in self._columns}
+
+    @property
+    def times(self) -> np.ndarray:
+        """Snapshot times in seconds (sorted)."""
+        return self.column("time")
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the columns."""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Materialize one row as a results-format state dict.
+
+        Args:
+            index: Row index, oldest first (negative indices count from the end)
+
+        Returns:
+            State dict (with "time_minutes" added)
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("state index out of range")
+        physical = (self._start + index) % self.capacity
+        state = {name: column[physical].item() for name, column in self._columns.items()}
+        state["time_minutes"] = state["time"] / 60
+        return state
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Get state dict by index, or a list of state dicts for a slice."""
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self._size))]
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over state dicts, oldest first."""
+        for index in range(self._size):
+            yield self.row(index)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialize every row (results-format list of dicts)."""
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        """Histories are equal when they hold the same rows."""
+        if not isinstance(other, StateHistory):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            np.array_equal(column, other.column(name)) for name, column in self.columns().items()
+        )
+
+    def __repr__(self) -> str:
+        """Short representation."""
+        return f"StateHistory({self._size} states, {self.nbytes:,} bytes)"
+
+
+def as_state_history(states: "StateHistory | Iterable[dict[str, Any]]") -> StateHistory:
+    """Get a columnar view of simulation state snapshots.
+
+    Args:
+        states: StateHistory (returned as-is) or results-format state dicts
+
+    Returns:
+        StateHistory with the same states
+    """
+    if isinstance(states, StateHistory):
+        return states
+    return StateHistory.from_dicts(states)
@@ -0,0 +1,227 @@
+"""Headless replay export to an asciicast (asciinema v2) file.
+
+export_cast plays a simulation through the same EventPlayer and
+SimulationDisplay as the live viewer, but on a virtual clock: each frame
+moves the clock forward by 1/fps, plays the events due, renders the display
+to an in-memory console and appends the frame to the .cast file. Nothing
+sleeps, so a 30-minute run exports in seconds at any playback speed.
+
+Frames are written as they are rendered, and only the screen lines that
+changed since the previous frame are written, so memory use does not grow
+with the length of the replay. Play the file with `asciinema play`.
+"""
+
+import io
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+from rich.console import Console
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import Deck
+from simulator.core.event_stream import EventStream
+from simulator.visualization.display import SimulationDisplay
+from simulator.visualization.event_player import MAX_SPEED, EventPlayer
+from simulator.visualization.viewer_state import ViewerStateReducer
+
+# Terminal size of the recording
+CAST_WIDTH = 100
+CAST_HEIGHT = 40
+
+# Seconds the summary screen stays up at the end of the recording
+SUMMARY_SECONDS = 3.0
+
+
+class VirtualClock:
+    """Clock that only moves when told to (stands in for time.monotonic)."""
+
+    def __init__(self) -> None:
+        """Initialize clock at 0 seconds."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Current virtual time in seconds."""
+        return self.now
+
+
+class CastWriter:
+    """Writes an asciicast v2 file one output event at a time.
+
+    Each screen is written as cursor-addressed lines; lines identical to
+    the previous screen are skipped.
+    """
+
+    def __init__(self, file: TextIO, width: int, height: int, title: str | None = None) -> None:
+        """Write the header.
+
+        Args:
+            file: Text file to write to
+            width: Terminal columns
+            height: Terminal rows
+            title: Recording title
+        """
+        self.file = file
+        self.frames = 0
+        self._screen: list[str] = []
+        header: dict[str, Any] = {
+            "version": 2,
+            "width": width,
+            "height": height,
+            "timestamp": int(time.time()),
+            "env": {"TERM": "xterm-256color"},
+        }
+        if title:
+            header["title"] = title
+        file.write(json.dumps(header) + "\n")
+
+    def output(self, at: float, data: str) -> None:
+        """Append raw terminal output.
+
+        Args:
+            at: Seconds since the start of the recording
+            data: Characters written to the terminal
+        """
+        self.file.write(json.dumps([round(at, 6), "o", data]) + "\n")
+
+    def screen(self, at: float, text: str) -> None:
+        """Append a full-screen frame (only its changed lines are written).
+
+        Args:
+            at: Seconds since the start of the recording
+            text: Rendered screen, one terminal row per line
+        """
+        lines = text.split("\n")
+        changed = [
+            f"\x1b[{row + 1};1H{line}"
+            for row, line in enumerate(lines)
+            if row >= len(self._screen) or self._screen[row] != line
+        ]
+        self._screen = lines
+        self.frames += 1
+        if changed:
+            self.output(at, "".join(changed))
+
+    def clear(self, at: float, text: str = "") -> None:
+        """Clear the terminal and write text from the top-left corner.
+
+        Args:
+            at: Seconds since the start of the recording
+            text: Text to show (rows separated by newlines)
+        """
+        self._screen = []
+        self.output(at, "\x1b[2J\x1b[H" + text.replace("\n", "\r\n"))
+
+
+@dataclass
+class CastExport:
+    """Outcome of a replay export."""
+
+    path: Path
+    frames: int
+    cast_seconds: float  # Length of the recording
+    results: dict[str, Any]  # Simulation results
+
+
+def _take_output(console: Console) -> str:
+    """Return and clear what was printed to an in-memory console."""
+    buffer: io.StringIO = console.file
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
+
+
+def export_cast(
+    path: Path | str,
+    deck: Deck,
+    duration_minutes: float = 30.0,
+    speed: float = 1.0,
+    fps: float = 10.0,
+    width: int = CAST_WIDTH,
+    height: int = CAST_HEIGHT,
+    simulator: CombatSimulator | None = None,
+) -> CastExport:
+    """Simulate a run and record its live view to an asciicast file.
+
+    Args:
+        path: Output .cast file
+        deck: Deck to simulate with
+        duration_minutes: Simulation duration
+        speed: Playback speed multiplier (simulated seconds per recorded second)
+        fps: Frames per recorded second
+        width: Terminal columns
+        height: Terminal rows
+        simulator: Simulator to run (default: a new CombatSimulator)
+
+    Returns:
+        CastExport with frame count, recording length and simulation results
+
+    Raises:
+        RuntimeError: The simulation ended without results (chains its exception)
+    """
+    if fps <= 0:
+        raise ValueError("fps must be positive")
+    path = Path(path)
+    frame_seconds = 1.0 / fps
+
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=True,
+        color_system="256",
+        width=width,
+        height=height,
+        legacy_windows=False,
+    )
+    simulator = simulator or CombatSimulator()
+    display = SimulationDisplay(console, simulator.config)
+    display.duration = duration_minutes
+    display.set_playback_state(False, speed)
+
+    clock = VirtualClock()
+    stream = EventStream(simulator, duration_minutes, deck).start()
+    try:
+        stream.poll(timeout=None)
+        reducer = ViewerStateReducer(stream.events, keyframe_interval=None)
+        player = EventPlayer(
+            stream.events,
+            on_event=display.add_event,
+            on_complete=lambda: None,
+            initial_speed=speed,
+            stream=stream,
+            max_events_per_step=display.event_log.maxlen,
+            clock=clock,
+        )
+
+        with path.open("w", encoding="utf-8") as f:
+            writer = CastWriter(f, width, height, title=f"{deck.name} - {duration_minutes:g} min")
+            writer.output(0.0, "\x1b[?25l\x1b[2J")  # Hide cursor, clear screen
+            frame = 0
+            while True:
+                # Everything up to this frame's time must have been simulated
+                stream.fill(MAX_SPEED if speed == MAX_SPEED else clock.now * speed)
+                now = player.play_due()
+                display.update_state(**reducer.advance(now).display_kwargs())
+                console.print(display.render(), end="")
+                writer.screen(clock.now, _take_output(console))
+                if player.event_index >= len(stream.events):
+                    stream.poll(timeout=None)  # Played all received: wait for more or the end
+                if player.at_end:
+                    break
+                frame += 1
+                clock.now = frame * frame_seconds
+            player.finish()
+
+            results = stream.wait()
+            if results is None:
+                raise RuntimeError("Simulation failed during cast export") from stream.error
+            console.print(display.render_results_summary(results), end="")
+            writer.clear(clock.now + frame_seconds, _take_output(console))
+            cast_seconds = clock.now + frame_seconds + SUMMARY_SECONDS
+            writer.output(cast_seconds, "\x1b[?25h")  # Show cursor again
+    finally:
+        stream.close()
+
+    return CastExport(path=path, frames=writer.frames, cast_seconds=cast_seconds, results=results)
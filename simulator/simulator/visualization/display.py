@@ -1,16 +1,83 @@
-"""Display rendering for live simulation view using Rich library."""
+"""Display rendering for live simulation view using Rich library.
+
+The screen is one Layout built once; each section (header, card highlight,
+event log, pack status, controls) is a CachedSection that keeps its built
+renderable and its rendered lines until the section's version changes.
+Setters bump a section's version only when something it shows changes, so
+a frame re-renders just the sections that changed.
+"""
 
 from collections import deque
+from collections.abc import Callable, Hashable
 from typing import Any
 
 from rich.align import Align
-from rich.console import Console, Group, RenderableType
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn
+from rich.segment import Segment
 from rich.table import Table
 from rich.text import Text
 
+from simulator.core.balance_config import BalanceConfig, default_balance_config
+from simulator.visualization.event_player import SPEED_PRESETS, format_speed
+
+
+class CachedSection:
+    """Renderable that rebuilds and re-renders its content only when invalidated.
+
+    The content is built by `build` on first use after each invalidate();
+    its rendered lines are reused while the version and size stay the same.
+    """
+
+    def __init__(self, build: Callable[[], RenderableType]) -> None:
+        """Initialize section.
+
+        Args:
+            build: Creates the section's renderable from the current display state
+        """
+        self.build = build
+        self.version = 0
+        self._key: Hashable = None  # Inputs at the last invalidate_if_changed
+        self._renderable: RenderableType | None = None
+        self._built_version = -1
+        self._lines: list[list[Segment]] = []
+        self._lines_key: tuple[int, int, int | None] | None = None
+
+    def invalidate(self) -> None:
+        """Mark the content as changed."""
+        self.version += 1
+
+    def invalidate_if_changed(self, key: Hashable) -> None:
+        """Mark the content as changed if its inputs differ from last time.
+
+        Args:
+            key: Everything the section shows (compared with ==)
+        """
+        if key != self._key:
+            self._key = key
+            self.version += 1
+
+    @property
+    def renderable(self) -> RenderableType:
+        """Content for the current version (built if stale)."""
+        if self._built_version != self.version:
+            self._renderable = self.build()
+            self._built_version = self.version
+        return self._renderable
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        """Yield the cached lines, re-rendering only if stale or resized."""
+        key = (self.version, options.max_width, options.height)
+        if key != self._lines_key:
+            self._lines = console.render_lines(self.renderable, options)
+            self._lines_key = key
+        new_line = Segment.line()
+        for line in self._lines:
+            yield from line
+            yield new_line
+
 
 class SimulationDisplay:
     """Renders live simulation state using Rich library.
@@ -23,11 +90,12 @@ class SimulationDisplay:
     - Control hints
     """
 
-    def __init__(self, console: Console | None = None):
+    def __init__(self, console: Console | None = None, config: BalanceConfig | None = None):
         """Initialize display.
         
         Args:
             console: Rich console to use (creates new if None)
+            config: Balance config whose pack costs are shown (default config if None)
         """
         # Force UTF-8 encoding and disable legacy Windows mode for better Unicode support
         self.console = console or Console(force_terminal=True, legacy_windows=False)
@@ -60,12 +128,52 @@ class SimulationDisplay:
         self.last_card: dict[str, Any] | None = None
         self.card_display_time = 0.0
         
-        # Pack affordability tracking
-        self.pack_status: dict[int, float | None] = {1: None, 2: None, 3: None, 4: None}
+        # Pack affordability tracking, in pack order
+        config = config if config is not None else default_balance_config()
+        self.pack_costs = dict(sorted(config.pack_costs.items()))
+        self.pack_status: dict[int, float | None] = dict.fromkeys(self.pack_costs)
         
         # Playback state
         self.is_paused = False
         self.speed = 1
+        self._prompt: str | None = None
+        
+        # Screen sections (rebuilt only when invalidated) in one stable layout
+        self.sections = {
+            "header": CachedSection(self._render_header),
+            "card": CachedSection(self._render_card_highlight),
+            "log": CachedSection(self._render_event_log),
+            "packs": CachedSection(self._render_pack_status),
+            "controls": CachedSection(self._render_controls),
+        }
+        self.layout = Layout()
+        self.layout.split_column(
+            Layout(self.sections["header"], name="header", size=5),
+            Layout(name="main", ratio=1, minimum_size=8),
+            Layout(self.sections["packs"], name="packs", size=3),
+            Layout(self.sections["controls"], name="controls", size=7),
+        )
+        self.layout["main"].split_column(
+            Layout(self.sections["card"], name="card", size=7),
+            Layout(self.sections["log"], name="log", ratio=1),
+        )
+        # Outer frame without extra border lines inside
+        self.screen = Panel(
+            self.layout,
+            title="[bold cyan]IDLE DECK BATTLER - LIVE SIMULATION[/bold cyan]",
+            border_style="cyan",
+            padding=(0, 0),
+        )
+        
+    @property
+    def prompt(self) -> str | None:
+        """Pending input shown under the controls (e.g. enemy number to jump to)."""
+        return self._prompt
+        
+    @prompt.setter
+    def prompt(self, value: str | None) -> None:
+        self._prompt = value
+        self.sections["controls"].invalidate()
         
     def update_state(
         self,
@@ -117,6 +225,24 @@ class SimulationDisplay:
         self.player_deaths = player_deaths
         self.furthest_enemy = furthest_enemy
         
+        self.sections["header"].invalidate_if_changed((
+            int(time),
+            self.duration,
+            round(essence),
+            round(essence_rate),
+            attack,
+            defense,
+            enemy_number,
+            self.enemy_hp,
+            enemy_max_hp,
+            enemy_attack,
+            enemy_defense,
+            player_hp,
+            player_max_hp,
+            player_deaths,
+        ))
+        self.sections["packs"].invalidate_if_changed(tuple(self._pack_labels()))
+        
     def add_event(self, event: dict) -> None:
         """Add event to log and handle card display.
         
@@ -142,16 +268,30 @@ class SimulationDisplay:
             }
             self.card_display_time = event_time
             
+        if event_type in ("draw", "reshuffle"):
+            self.sections["card"].invalidate()
+            
         # Add to event log
         self.event_log.append(event)
+        self.sections["log"].invalidate()
         
         # Update pack status if affordable
         if event_type == "pack_affordable":
             pack_num = data.get("pack_number")
             if pack_num and pack_num not in [k for k, v in self.pack_status.items() if v is not None]:
                 self.pack_status[pack_num] = event_time / 60  # Convert to minutes
+                self.sections["packs"].invalidate_if_changed(tuple(self._pack_labels()))
                 
-    def set_playback_state(self, is_paused: bool, speed: int) -> None:
+    def clear_events(self) -> None:
+        """Forget displayed events (before refilling the log after a seek)."""
+        self.event_log.clear()
+        self.last_card = None
+        self.pack_status = dict.fromkeys(self.pack_costs)
+        self.sections["card"].invalidate()
+        self.sections["log"].invalidate()
+        self.sections["packs"].invalidate_if_changed(tuple(self._pack_labels()))
+        
+    def set_playback_state(self, is_paused: bool, speed: float) -> None:
         """Update playback state.
         
         Args:
@@ -160,30 +300,18 @@ class SimulationDisplay:
         """
         self.is_paused = is_paused
         self.speed = speed
+        self.sections["controls"].invalidate_if_changed((is_paused, speed))
         
     def render(self) -> RenderableType:
         """Render current display state.
         
+        Returns the same renderable every time; sections whose inputs
+        changed since the last frame are rebuilt when it is drawn.
+        
         Returns:
             Rich renderable for display
         """
-        # Create main layout with flexible sizing
-        layout = Layout()
-        layout.split_column(
-            Layout(name="header", size=5),
-            Layout(name="main", ratio=1, minimum_size=8),
-            Layout(name="packs", size=3),
-            Layout(name="controls", size=5),
-        )
-        
-        # Render each section
-        layout["header"].update(self._render_header())
-        layout["main"].update(self._render_main())
-        layout["packs"].update(self._render_pack_status())
-        layout["controls"].update(self._render_controls())
-        
-        # Return layout without outer Panel to avoid extra border lines
-        return Panel(layout, title="[bold cyan]IDLE DECK BATTLER - LIVE SIMULATION[/bold cyan]", border_style="cyan", padding=(0, 0))
+        return self.screen
         
     def _render_header(self) -> RenderableType:
         """Render top status bar."""
@@ -251,23 +379,6 @@ class SimulationDisplay:
         
         return table
         
-    def _render_main(self) -> RenderableType:
-        """Render main content area (card highlight + event log)."""
-        # Card highlight
-        card_panel = self._render_card_highlight()
-        
-        # Event log
-        log_panel = self._render_event_log()
-        
-        # Split layout
-        main_layout = Layout()
-        main_layout.split_column(
-            Layout(card_panel, size=7),
-            Layout(log_panel, ratio=1),
-        )
-        
-        return main_layout
-        
     def _render_card_highlight(self) -> RenderableType:
         """Render recently drawn card highlight."""
         if not self.last_card:
@@ -374,25 +485,32 @@ class SimulationDisplay:
         content = Group(*lines)  # Show all available events
         return Panel(content, title="Recent Activity", border_style="white")
         
-    def _render_pack_status(self) -> RenderableType:
-        """Render pack affordability status."""
-        pack_costs = {1: 40_000, 2: 100_000, 3: 250_000, 4: 625_000}
+    def _pack_labels(self) -> list[tuple[str, str]]:
+        """Status text and style shown for each pack.
         
-        status_parts = []
-        for pack_num in [1, 2, 3, 4]:
+        Returns:
+            (text, style) per pack, in pack order
+        """
+        labels = []
+        for pack_num, cost in self.pack_costs.items():
             affordable_time = self.pack_status.get(pack_num)
-            cost = pack_costs[pack_num]
             
             if affordable_time is not None:
-                status_parts.append(Text(f"Pack {pack_num} ", style="white") + Text(f"✓ ({affordable_time:.1f}m)", style="green"))
+                labels.append((f"✓ ({affordable_time:.1f}m)", "green"))
             elif self.essence >= cost:
-                status_parts.append(Text(f"Pack {pack_num} ", style="white") + Text("✓", style="green"))
+                labels.append(("✓", "green"))
             else:
                 needed = cost - self.essence
-                status_parts.append(Text(f"Pack {pack_num} ", style="white") + Text(f"(needs {needed:,.0f})", style="dim"))
-                
-            if pack_num < 4:
+                labels.append((f"(needs {needed:,.0f})", "dim"))
+        return labels
+        
+    def _render_pack_status(self) -> RenderableType:
+        """Render pack affordability status."""
+        status_parts = []
+        for pack_num, (label, style) in zip(self.pack_costs, self._pack_labels(), strict=True):
+            if status_parts:
                 status_parts.append(Text("  ", style="dim"))
+            status_parts.append(Text(f"Pack {pack_num} ", style="white") + Text(label, style=style))
                 
         content = Text.assemble(*status_parts)
         return Panel(Align.center(content), title="Packs", border_style="green")
@@ -401,12 +519,14 @@ class SimulationDisplay:
         """Render control hints."""
         # First line: Speed controls
         speed_indicators = []
-        for s in [1, 2, 5, 10]:
-            key = str([1, 2, 5, 10].index(s) + 1)
+        for key, s in enumerate(SPEED_PRESETS, start=1):
+            label = format_speed(s)
             if s == self.speed:
-                speed_indicators.append(Text(f"[{key}]", style="bold yellow") + Text(f"{s}x", style="bold white"))
+                speed_indicators.append(Text(f"[{key}]", style="bold yellow") + Text(label, style="bold white"))
             else:
-                speed_indicators.append(Text(f"[{key}]", style="dim") + Text(f"{s}x", style="dim"))
+                speed_indicators.append(Text(f"[{key}]", style="dim") + Text(label, style="dim"))
+        if self.speed not in SPEED_PRESETS:
+            speed_indicators.append(Text(format_speed(self.speed), style="bold white"))
                 
         speed_line = Text("Speed: ")
         for i, indicator in enumerate(speed_indicators):
@@ -428,8 +548,20 @@ class SimulationDisplay:
         control_line.append("  [Q]", style="yellow")
         control_line.append("Quit", style="white")
         
+        # Third line: Seek controls
+        seek_line = Text()
+        seek_line.append("[,/.]", style="yellow")
+        seek_line.append("-/+30s", style="white")
+        seek_line.append("  [D]", style="yellow")
+        seek_line.append("Next death", style="white")
+        seek_line.append("  [G]", style="yellow")
+        seek_line.append("Go to enemy", style="white")
+        
         # Combine lines
-        lines = [speed_line, control_line]
+        lines = [speed_line, control_line, seek_line]
+        
+        if self.prompt is not None:
+            lines.append(Text(self.prompt, style="bold cyan"))
         
         if self.is_paused:
             lines.append(Text("⏸ PAUSED", style="bold yellow"))
@@ -437,6 +569,39 @@ class SimulationDisplay:
         content = Group(*lines)
         return Panel(Align.center(content, vertical="middle"), border_style="cyan")
         
+    def render_results_summary(self, results: dict[str, Any]) -> RenderableType:
+        """Render the post-simulation summary for a results dictionary.
+        
+        Args:
+            results: CombatSimulator.simulate results
+            
+        Returns:
+            Rich renderable for summary screen
+        """
+        enemies_defeated = results.get("enemies_defeated", 0)
+        enemies_encountered = results.get("enemies_encountered", 0)
+        
+        # Check if died to a boss
+        death_enemy = None
+        if enemies_defeated < enemies_encountered:
+            death_enemy = enemies_defeated + 1
+            
+        return self.render_summary(
+            duration=results.get("duration_minutes", 0),
+            final_essence=results.get("final_essence", 0),
+            final_rate=results.get("player_essence_rate", 0),
+            enemies_defeated=enemies_defeated,
+            enemies_encountered=enemies_encountered,
+            cards_drawn=results.get("cards_drawn", 0),
+            total_damage=results.get("total_damage_dealt", 0),
+            pack_times=results.get("pack_affordable_times", {}),
+            death_enemy=death_enemy,
+            player_hp=results.get("player_hp", 0),
+            player_max_hp=results.get("player_max_hp", 100),
+            player_deaths=results.get("player_deaths", 0),
+            furthest_enemy=results.get("furthest_enemy", 0),
+        )
+        
     def render_summary(
         self,
         duration: float,
@@ -1,13 +1,75 @@
 """Event playback system for live simulation view.
 
 Consumes simulation events at a controlled rate with speed multipliers.
+Playback runs as a coroutine on the viewer's asyncio event loop: it sleeps
+until the wall-clock deadline of the next event (or until a control such as
+pause, seek or a speed change wakes it), so nothing polls while waiting.
+
+Any speed is allowed, up to MAX_SPEED (play as fast as events arrive). At
+high speeds one wake-up covers many events; only the last few of them are
+passed to on_event (the rest are coalesced, see max_events_per_step), so
+the work per wake-up stays bounded however many events it covers.
 """
 
-import threading
+import asyncio
 import time
-from collections import deque
+from collections.abc import Callable
 from enum import Enum
-from typing import Callable
+from typing import Any
+
+import numpy as np
+
+from simulator.core.event_log import EVENT_TYPE_CODES, EventLog, as_event_log
+from simulator.core.event_stream import EventStream
+
+# Real seconds of playback to keep received ahead of the playback time
+READ_AHEAD_SECONDS = 2.0
+
+# Real seconds between checks for new batches while playback waits on the stream
+STREAM_RETRY_SECONDS = 0.01
+
+# Shortest real time between wake-ups (events due sooner are delivered together)
+MIN_STEP_SECONDS = 1 / 60
+
+# "max" speed: playback time jumps to the end of the events received so far
+MAX_SPEED = float("inf")
+
+# Speeds selectable with the number keys 1..7 in the live viewer
+SPEED_PRESETS = (1, 2, 5, 10, 100, 1000, MAX_SPEED)
+
+
+def parse_speed(value: str | float) -> float:
+    """Parse a speed multiplier ("max" or a positive number).
+
+    Args:
+        value: Speed as given on the command line or in code
+
+    Returns:
+        Speed multiplier (MAX_SPEED for "max")
+    """
+    if isinstance(value, str) and value.strip().lower() == "max":
+        return MAX_SPEED
+    try:
+        speed = float(value)
+    except ValueError:
+        raise ValueError(f"Invalid speed '{value}' (expected a positive number or 'max')") from None
+    if not speed > 0:
+        raise ValueError(f"Invalid speed '{value}' (expected a positive number or 'max')")
+    return speed
+
+
+def format_speed(speed: float) -> str:
+    """Format a speed multiplier for display ("10x", "2.5x", "max").
+
+    Args:
+        speed: Speed multiplier
+
+    Returns:
+        Short label
+    """
+    if speed == MAX_SPEED:
+        return "max"
+    return f"{speed:g}x"
 
 
 class PlaybackState(Enum):
@@ -21,73 +83,115 @@ class PlaybackState(Enum):
 
 class EventPlayer:
     """Manages event playback with speed control and pause/resume.
-    
+
     Events are consumed from the simulation and played back at a controlled
-    rate based on the speed multiplier. Supports pause, resume, and step-through.
+    rate based on the speed multiplier. Supports pause, resume, step-through
+    and seeking to any simulation time.
+
+    The simulation time is not ticked: it is derived from the wall clock
+    since the last control change (see current_sim_time). Controls must be
+    called from the event loop running run().
+
+    Events of the `milestones` types are never coalesced: a wake-up stops
+    delivering at the first one, so on_event can pause right there.
+
+    When playing from an EventStream, batches are taken from the stream only
+    as playback approaches the end of what has been received, and playback
+    waits at `stream.complete_time` until more events arrive.
     """
 
     def __init__(
         self,
-        events: list[dict],
-        on_event: Callable[[dict], None],
+        events: EventLog | list[dict[str, Any]],
+        on_event: Callable[[dict[str, Any]], None],
         on_complete: Callable[[], None],
-        initial_speed: int = 1,
+        initial_speed: float = 1,
+        stream: EventStream | None = None,
+        max_events_per_step: int | None = None,
+        milestones: tuple[str, ...] = (),
+        clock: Callable[[], float] = time.monotonic,
     ):
         """Initialize event player.
-        
+
         Args:
-            events: List of simulation events to play
+            events: Simulation events to play (EventLog or list of event dicts;
+                ignored when playing from a stream)
             on_event: Callback when event should be displayed
             on_complete: Callback when playback completes
-            initial_speed: Initial speed multiplier (1, 2, 5, 10)
+            initial_speed: Initial speed multiplier (any positive number or MAX_SPEED)
+            stream: Running simulation to play while it is produced
+            max_events_per_step: Most events passed to on_event per wake-up;
+                earlier ones are skipped (None: pass every event)
+            milestones: Event types that are always passed to on_event
+            clock: Wall clock in seconds (a virtual clock plays without real time passing)
         """
-        self.events = events
+        self.stream = stream
+        self.events = stream.events if stream is not None else as_event_log(events)
         self.on_event = on_event
         self.on_complete = on_complete
-        
+
         self.event_index = 0
         self.state = PlaybackState.PLAYING
         self.speed = initial_speed
-        
-        # Simulation time tracking
-        self.current_sim_time = 0.0
-        self.last_update_time = time.time()
-        
-        # Thread control
-        self.thread: threading.Thread | None = None
-        self.stop_flag = threading.Event()
-        self.step_flag = threading.Event()
-        
-    def start(self) -> None:
-        """Start event playback in background thread."""
-        if self.thread is not None and self.thread.is_alive():
-            return
-            
-        self.stop_flag.clear()
-        self.thread = threading.Thread(target=self._playback_loop, daemon=True)
-        self.thread.start()
-        
+        self.max_events_per_step = max_events_per_step
+        self._milestone_codes = [EVENT_TYPE_CODES[name] for name in milestones]
+
+        # Simulation time at the wall-clock anchor (clock())
+        self.clock = clock
+        self._anchor_sim_time = 0.0
+        self._anchor_wall_time = clock()
+
+        # Set by controls to wake run() early; created inside the event loop
+        self._wake: asyncio.Event | None = None
+        self._pending_steps = 0
+
+    @property
+    def current_sim_time(self) -> float:
+        """Simulation time being shown (advances with the wall clock while playing)."""
+        sim_time = self._anchor_sim_time
+        if self.state == PlaybackState.PLAYING:
+            if self.speed == MAX_SPEED:
+                sim_time = self._end_time()
+            else:
+                sim_time += (self.clock() - self._anchor_wall_time) * self.speed
+        return self._playable_time(sim_time)
+
+    def _set_time(self, sim_time: float) -> None:
+        """Re-anchor the simulation time at the current wall-clock time.
+
+        Args:
+            sim_time: Simulation time as of now (seconds)
+        """
+        self._anchor_sim_time = sim_time
+        self._anchor_wall_time = self.clock()
+
+    def _notify(self) -> None:
+        """Wake run() so it reschedules after a control change."""
+        if self._wake is not None:
+            self._wake.set()
+
     def stop(self) -> None:
         """Stop event playback."""
         self.state = PlaybackState.STOPPED
-        self.stop_flag.set()
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
-            
+        self._notify()
+
     def pause(self) -> None:
         """Pause event playback."""
         if self.state == PlaybackState.PLAYING:
+            self._set_time(self.current_sim_time)
             self.state = PlaybackState.PAUSED
-            
+            self._notify()
+
     def resume(self) -> None:
         """Resume event playback."""
         if self.state == PlaybackState.PAUSED:
+            self._set_time(self._anchor_sim_time)
             self.state = PlaybackState.PLAYING
-            self.last_update_time = time.time()
-            
+            self._notify()
+
     def toggle_pause(self) -> bool:
         """Toggle pause state.
-        
+
         Returns:
             True if now paused, False if now playing
         """
@@ -97,82 +201,195 @@ class EventPlayer:
         elif self.state == PlaybackState.PAUSED:
             self.resume()
             return False
-        return self.state == PlaybackState.PAUSED
-        
+        return False  # Stopped or completed
+
     def step_forward(self) -> None:
         """Advance to next event (when paused)."""
         if self.state == PlaybackState.PAUSED:
-            self.step_flag.set()
-            
-    def set_speed(self, speed: int) -> None:
+            self._pending_steps += 1
+            self._notify()
+
+    def seek(self, sim_time: float) -> None:
+        """Move playback to a simulation time (forwards or backwards).
+
+        Events at or before `sim_time` count as already played; they are
+        not replayed through on_event.
+
+        Args:
+            sim_time: Simulation time to continue from (seconds)
+        """
+        self._set_time(self._playable_time(max(0.0, sim_time)))
+        self.event_index = int(
+            np.searchsorted(self.events.times, self._anchor_sim_time, side="right")
+        )
+        self._notify()
+
+    def set_speed(self, speed: float) -> None:
         """Set playback speed multiplier.
-        
+
         Args:
-            speed: Speed multiplier (1, 2, 5, 10)
+            speed: Speed multiplier (any positive number or MAX_SPEED)
         """
-        if speed in [1, 2, 5, 10]:
+        if speed > 0:
+            self._set_time(self.current_sim_time)
             self.speed = speed
-            
-    def get_next_event(self) -> dict | None:
+            self._notify()
+
+    def get_next_event(self) -> dict[str, Any] | None:
         """Get next event without consuming it.
-        
+
         Returns:
             Next event or None if no more events
         """
         if self.event_index < len(self.events):
-            return self.events[self.event_index]
+            event: dict[str, Any] = self.events[self.event_index]
+            return event
         return None
-        
-    def _playback_loop(self) -> None:
-        """Main playback loop running in background thread."""
-        while not self.stop_flag.is_set() and self.event_index < len(self.events):
-            # Handle pause
+
+    def _live_stream(self) -> EventStream | None:
+        """The stream while more events may still arrive from it, else None."""
+        if self.stream is not None and not self.stream.finished:
+            return self.stream
+        return None
+
+    def _playable_time(self, sim_time: float) -> float:
+        """Clamp a simulation time to the part of the run received so far.
+
+        Args:
+            sim_time: Requested simulation time (seconds)
+
+        Returns:
+            `sim_time`, or the stream's complete_time if that is earlier
+        """
+        stream = self._live_stream()
+        if stream is not None:
+            return min(sim_time, stream.complete_time)
+        return sim_time
+
+    def _end_time(self) -> float:
+        """Time of the last event received (the stream's complete_time while streaming)."""
+        stream = self._live_stream()
+        if stream is not None:
+            return stream.complete_time
+        return float(self.events.times[-1]) if len(self.events) else 0.0
+
+    def _receive(self) -> None:
+        """Take batches from the stream until the read-ahead window is covered."""
+        stream = self._live_stream()
+        if stream is not None:
+            horizon = self.current_sim_time + self.speed * READ_AHEAD_SECONDS
+            while stream.complete_time <= horizon and stream.poll():
+                pass
+
+    async def _sleep(self, wake: asyncio.Event, delay: float | None) -> None:
+        """Wait for `delay` real seconds (None: indefinitely) or until a control wakes us.
+
+        Args:
+            wake: Event set by the controls (run()'s `_wake`)
+            delay: Seconds to wait
+        """
+        wake.clear()
+        try:
+            await asyncio.wait_for(wake.wait(), delay)
+        except TimeoutError:
+            pass
+
+    async def run(self) -> None:
+        """Play events until the end of the trace or stop().
+
+        Each iteration delivers the events that are due and then sleeps
+        until the next one is due.
+        """
+        self._wake = wake = asyncio.Event()
+        self._set_time(self._anchor_sim_time)
+
+        while self.state != PlaybackState.STOPPED:
+            self._receive()
+            if self.at_end:
+                break
+
             if self.state == PlaybackState.PAUSED:
-                # Wait for resume or step
-                if self.step_flag.wait(timeout=0.1):
-                    self.step_flag.clear()
+                if self._pending_steps:
+                    self._pending_steps -= 1
                     self._process_next_event()
-                continue
-                
-            # Playing - advance simulation time based on speed
-            current_time = time.time()
-            elapsed_real = current_time - self.last_update_time
-            self.last_update_time = current_time
-            
-            # Advance simulation time (real time × speed multiplier)
-            self.current_sim_time += elapsed_real * self.speed
-            
-            # Process all events up to current sim time
-            while self.event_index < len(self.events):
-                event = self.events[self.event_index]
-                event_time = event.get("time", 0)
-                
-                if event_time <= self.current_sim_time:
-                    self._process_event(event)
-                    self.event_index += 1
                 else:
-                    break
-                    
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.016)  # ~60 FPS
-            
-        # Playback complete
-        self.state = PlaybackState.COMPLETED
+                    await self._sleep(wake, None)
+                continue
+
+            # Deliver everything due, then sleep until the next event is due
+            now = self.play_due()
+
+            if self.state != PlaybackState.PLAYING:
+                continue
+            if self.event_index < len(self.events):
+                delay = (float(self.events.times[self.event_index]) - now) / self.speed
+            else:
+                # Waiting on the stream: hold the clock where the received events end
+                self._set_time(now)
+                delay = STREAM_RETRY_SECONDS
+            await self._sleep(wake, max(delay, MIN_STEP_SECONDS))
+
+        self.finish()
+
+    @property
+    def at_end(self) -> bool:
+        """True once every event has been played and no more can arrive."""
+        return self.event_index >= len(self.events) and self._live_stream() is None
+
+    def play_due(self) -> float:
+        """Deliver every event due at the current simulation time, without waiting.
+
+        Returns:
+            The current simulation time
+        """
+        now = self.current_sim_time
+        self._deliver(int(np.searchsorted(self.events.times, now, side="right")))
+        return now
+
+    def finish(self) -> None:
+        """Mark playback complete (unless stopped) and call on_complete."""
+        if self.state != PlaybackState.STOPPED:
+            self.state = PlaybackState.COMPLETED
         self.on_complete()
-        
+
+    def _deliver(self, end: int) -> None:
+        """Play events up to (not including) index `end`.
+
+        Only the last max_events_per_step events before each milestone (and
+        before `end`) go through on_event; stops early if a callback pauses
+        or stops playback.
+
+        Args:
+            end: Index of the first event not due yet
+        """
+        while self.event_index < end and self.state == PlaybackState.PLAYING:
+            stop = end
+            if self._milestone_codes:
+                codes = self.events.type_codes[self.event_index : end]
+                hits = np.flatnonzero(np.isin(codes, self._milestone_codes))
+                if len(hits):
+                    stop = self.event_index + int(hits[0]) + 1
+
+            if self.max_events_per_step is not None:
+                self.event_index = max(self.event_index, stop - self.max_events_per_step)
+            while self.event_index < stop:
+                self._process_event(self.events[self.event_index])
+                self.event_index += 1
+                if self.state != PlaybackState.PLAYING:
+                    return  # Paused or stopped by a callback
+
     def _process_next_event(self) -> None:
         """Process the next event (for step-through)."""
         if self.event_index < len(self.events):
             event = self.events[self.event_index]
-            self.current_sim_time = event.get("time", 0)
+            self._set_time(event.get("time", 0))
             self._process_event(event)
             self.event_index += 1
-            
-    def _process_event(self, event: dict) -> None:
+
+    def _process_event(self, event: dict[str, Any]) -> None:
         """Process an event and call callback.
-        
+
         Args:
             event: Event to process
         """
         self.on_event(event)
-
@@ -3,7 +3,11 @@
 Orchestrates event playback, display rendering, and keyboard input.
 """
 
+import asyncio
+import os
 import sys
+import time
+from collections.abc import Callable, Coroutine
 from pathlib import Path
 from typing import Any
 
@@ -17,8 +21,47 @@ from rich.live import Live
 
 from simulator.core.combat import CombatSimulator
 from simulator.core.deck import Deck
+from simulator.core.event_log import EventLog
+from simulator.core.event_stream import EventStream
 from simulator.visualization.display import SimulationDisplay
-from simulator.visualization.event_player import EventPlayer, PlaybackState
+from simulator.visualization.event_player import SPEED_PRESETS, EventPlayer, PlaybackState
+from simulator.visualization.viewer_state import ViewerStateReducer
+
+# Simulated seconds moved by the rewind/forward keys
+SEEK_SECONDS = 30.0
+
+# Number key -> speed multiplier
+SPEED_KEYS = {str(key): speed for key, speed in enumerate(SPEED_PRESETS, start=1)}
+
+# Real seconds between frames while playing
+FRAME_SECONDS = 0.1
+
+# Real seconds between keyboard checks where stdin can't be watched (Windows)
+KEY_POLL_SECONDS = 0.02
+
+# Real seconds spent receiving batches per step while searching ahead (well under a frame)
+SEARCH_STEP_SECONDS = 0.02
+
+
+def split_keys(data: str) -> list[str]:
+    """Split raw terminal input into keys (escape sequences stay whole).
+    
+    Args:
+        data: Characters read from stdin in one go
+        
+    Returns:
+        Keys in the order they were typed, e.g. ["n", "\\x1b[C"]
+    """
+    keys = []
+    index = 0
+    while index < len(data):
+        if data.startswith("\x1b[", index) and index + 2 < len(data):
+            keys.append(data[index : index + 3])
+            index += 3
+        else:
+            keys.append(data[index])
+            index += 1
+    return keys
 
 
 class LiveViewer:
@@ -29,19 +72,20 @@ class LiveViewer:
     - Display rendering with Rich
     - Keyboard input handling
     - Auto-pause on milestones
+    - Seeking (rewind/forward, jump to enemy N or the next death)
     """
 
     def __init__(
         self,
         duration_minutes: float = 30.0,
-        initial_speed: int = 1,
+        initial_speed: float = 1,
         auto_pause_milestones: bool = True,
     ):
         """Initialize live viewer.
         
         Args:
             duration_minutes: Simulation duration
-            initial_speed: Initial speed multiplier
+            initial_speed: Initial speed multiplier (any positive number, or MAX_SPEED)
             auto_pause_milestones: Auto-pause on pack milestones
         """
         self.duration_minutes = duration_minutes
@@ -53,8 +97,11 @@ class LiveViewer:
         self.display = SimulationDisplay(self.console)
         self.display.duration = duration_minutes
         
+        self.stream: EventStream | None = None
         self.event_player: EventPlayer | None = None
         self.simulation_results: dict[str, Any] | None = None
+        self.events: EventLog | None = None
+        self.reducer: ViewerStateReducer | None = None
         
         # Terminal settings for keyboard input
         self.old_terminal_settings: Any = None
@@ -62,6 +109,15 @@ class LiveViewer:
         # State tracking for auto-pause
         self.packs_seen: set[int] = set()
         
+        # Digits typed after [G] (enemy number to jump to), None when not entering
+        self.goto_input: str | None = None
+        
+        # Set to draw a frame before the next frame is due (created in _display_loop)
+        self._redraw: asyncio.Event | None = None
+
+        # Running look-ahead (next death, enemy N, seek past the streamed events)
+        self._search: asyncio.Task[None] | None = None
+        
     def run(self, deck: Deck) -> None:
         """Run live simulation view.
         
@@ -69,21 +125,26 @@ class LiveViewer:
             deck: Deck to simulate with
         """
         try:
-            # Run simulation to get events
-            self.console.print("[yellow]Running simulation...[/yellow]")
-            sim = CombatSimulator()
-            self.simulation_results = sim.simulate(
-                duration_minutes=self.duration_minutes,
-                deck=deck,
-            )
+            # Simulate in the background; playback starts with the first batch
+            self.console.print("[yellow]Starting simulation...[/yellow]")
+            self.stream = EventStream(CombatSimulator(), self.duration_minutes, deck).start()
+            while not self.stream.events and not self.stream.finished:
+                self.stream.poll(timeout=0.05)
+            if self.stream.error is not None:
+                self.console.print(f"[red]Simulation failed: {self.stream.error}[/red]")
+                return
             
-            # Extract events
-            events = self.simulation_results.get("events", [])
+            # Columnar log, extended as batches arrive and folded incrementally into display state
+            events = self.stream.events
+            self.events = events
+            self.reducer = ViewerStateReducer(
+                events, complete_time=None if self.stream.finished else self.stream.complete_time
+            )
             if not events:
                 self.console.print("[red]No events generated from simulation[/red]")
                 return
                 
-            self.console.print(f"[green]Loaded {len(events)} events[/green]")
+            self.console.print("[green]Streaming events from the simulation[/green]")
             self.console.print("[dim]Press Q to quit at any time[/dim]\n")
             
             # Set up event player
@@ -92,22 +153,30 @@ class LiveViewer:
                 on_event=self._handle_event,
                 on_complete=self._handle_complete,
                 initial_speed=self.initial_speed,
+                stream=self.stream,
+                # At high speeds only the events the log panel can show are rendered
+                max_events_per_step=self.display.event_log.maxlen,
+                milestones=("pack_affordable",) if self.auto_pause_milestones else (),
             )
             
             # Set up keyboard input
             self._setup_terminal()
             
-            # Start event playback
-            self.event_player.start()
+            # Play, render and read keys on one event loop
+            asyncio.run(self._display_loop())
             
-            # Run display loop
-            self._display_loop()
+            # Show summary after playback completes (finishing the run if quit early)
+            self.simulation_results = self.stream.wait()
+            if self.simulation_results:
+                self._show_summary()
             
         finally:
             # Clean up
             self._restore_terminal()
             if self.event_player:
                 self.event_player.stop()
+            if self.stream:
+                self.stream.close()
                 
     def _setup_terminal(self) -> None:
         """Set up terminal for non-blocking keyboard input."""
@@ -117,7 +186,7 @@ class LiveViewer:
             import tty
             self.old_terminal_settings = termios.tcgetattr(sys.stdin)
             tty.setcbreak(sys.stdin.fileno())
-        # Windows: No special setup needed, will use msvcrt in _check_keyboard
+        # Windows: No special setup needed, will use msvcrt in _poll_windows_keyboard
         
     def _restore_terminal(self) -> None:
         """Restore terminal to original settings."""
@@ -125,66 +194,96 @@ class LiveViewer:
             import termios
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_terminal_settings)
             
-    def _check_keyboard(self) -> str | None:
-        """Check for keyboard input (non-blocking).
+    def _start_keyboard(self) -> Callable[[], None]:
+        """Start delivering keypresses to _handle_keypress on the running event loop.
         
         Returns:
-            Key pressed or None
+            Function that stops keyboard input
         """
+        loop = asyncio.get_running_loop()
         if sys.platform == "win32":
-            # Windows
-            import msvcrt
-            if msvcrt.kbhit():
-                return msvcrt.getch().decode("utf-8", errors="ignore")
-        else:
-            # Unix-like
-            import select
-            if select.select([sys.stdin], [], [], 0)[0]:
-                return sys.stdin.read(1)
-        return None
-        
-    def _display_loop(self) -> None:
-        """Main display loop with keyboard input."""
-        import time
-        
-        with Live(
-            self.display.render(),
-            console=self.console,
-            refresh_per_second=10,  # Reduced to avoid overwhelming display
-            transient=False,  # Keep display visible
-        ) as live:
-            while self.event_player and self.event_player.state not in [
-                PlaybackState.STOPPED,
-                PlaybackState.COMPLETED,
-            ]:
-                # Update state from current simulation time (not just on events)
-                self._update_display_from_current_time()
-                
-                # Update playback state indicators
-                self.display.set_playback_state(
-                    self.event_player.state == PlaybackState.PAUSED,
-                    self.event_player.speed
-                )
-                
-                # Update display
-                live.update(self.display.render())
-                
-                # Check keyboard
-                key = self._check_keyboard()
-                if key:
-                    self._handle_keypress(key)
+            # Windows: the console has no selectable handle, poll msvcrt instead
+            task = loop.create_task(self._poll_windows_keyboard())
+            return task.cancel
+        
+        # Unix-like: wake up only when stdin becomes readable
+        fd = sys.stdin.fileno()
+        loop.add_reader(fd, self._read_keyboard, fd)
+        return lambda: loop.remove_reader(fd)
+        
+    def _read_keyboard(self, fd: int) -> None:
+        """Handle the keys waiting on stdin (selector reader callback).
+        
+        Args:
+            fd: stdin file descriptor
+        """
+        data = os.read(fd, 64).decode("utf-8", errors="ignore")
+        for key in split_keys(data):
+            self._handle_keypress(key)
+        self._redraw.set()
+        
+    async def _poll_windows_keyboard(self) -> None:
+        """Handle keypresses on Windows, checking every KEY_POLL_SECONDS."""
+        import msvcrt
+        while True:
+            while msvcrt.kbhit():
+                self._handle_keypress(msvcrt.getch().decode("utf-8", errors="ignore"))
+                self._redraw.set()
+            await asyncio.sleep(KEY_POLL_SECONDS)
+        
+    async def _display_loop(self) -> None:
+        """Main display loop: playback, rendering and keyboard on one event loop.
+        
+        While playing, a frame is drawn every FRAME_SECONDS; a keypress or the
+        end of playback redraws at once. While paused, nothing runs until a
+        key is pressed.
+        """
+        self._redraw = asyncio.Event()
+        playback = asyncio.create_task(self.event_player.run())
+        stop_keyboard = self._start_keyboard()
+        try:
+            with Live(
+                self.display.render(),
+                console=self.console,
+                auto_refresh=False,  # Frames are drawn by this loop
+                transient=False,  # Keep display visible
+            ) as live:
+                while not playback.done():
+                    self._draw_frame(live)
                     
-                # Sleep to control refresh rate
-                # Longer sleep at higher speeds to avoid display spam
-                sleep_time = 0.1 if self.event_player.speed >= 5 else 0.05
-                time.sleep(sleep_time)
-                
-            # Final update
-            live.update(self.display.render())
+                    self._redraw.clear()
+                    playing = self.event_player.state == PlaybackState.PLAYING
+                    try:
+                        await asyncio.wait_for(
+                            self._redraw.wait(), FRAME_SECONDS if playing else None
+                        )
+                    except TimeoutError:
+                        pass
+                    
+                # Final update
+                self._draw_frame(live)
+        finally:
+            stop_keyboard()
+            if self._search is not None:
+                self._search.cancel()
+            self.event_player.stop()
+            await playback
             
-        # Show summary after playback completes
-        if self.simulation_results:
-            self._show_summary()
+    def _draw_frame(self, live: Live) -> None:
+        """Update the display to the current playback time and draw it.
+        
+        Args:
+            live: Live display to draw into
+        """
+        # Update state from current simulation time (not just on events)
+        self._update_display_from_current_time()
+        
+        # Update playback state indicators
+        self.display.set_playback_state(
+            self.event_player.state == PlaybackState.PAUSED,
+            self.event_player.speed
+        )
+        live.refresh()  # Live holds the display's stable screen; only changed sections re-render
             
     def _handle_keypress(self, key: str) -> None:
         """Handle keyboard input.
@@ -195,21 +294,20 @@ class LiveViewer:
         if not self.event_player:
             return
             
-        key = key.lower()
+        if len(key) == 1:
+            key = key.lower()
+        
+        # Enemy number entry after [G]
+        if self.goto_input is not None:
+            self._handle_goto_key(key)
+            return
         
         # Speed controls
-        if key == "1":
-            self.event_player.set_speed(1)
-            self.display.set_playback_state(self.event_player.state == PlaybackState.PAUSED, 1)
-        elif key == "2":
-            self.event_player.set_speed(2)
-            self.display.set_playback_state(self.event_player.state == PlaybackState.PAUSED, 2)
-        elif key == "3":
-            self.event_player.set_speed(5)
-            self.display.set_playback_state(self.event_player.state == PlaybackState.PAUSED, 5)
-        elif key == "4":
-            self.event_player.set_speed(10)
-            self.display.set_playback_state(self.event_player.state == PlaybackState.PAUSED, 10)
+        if key in SPEED_KEYS:
+            self.event_player.set_speed(SPEED_KEYS[key])
+            self.display.set_playback_state(
+                self.event_player.state == PlaybackState.PAUSED, self.event_player.speed
+            )
             
         # Pause/resume
         elif key == " ":
@@ -220,183 +318,181 @@ class LiveViewer:
         elif key in ["n", "\x1b[C"]:  # N or right arrow
             self.event_player.step_forward()
             
-        # Quit
+        # Seeking
+        elif key in [",", "<"]:
+            self._seek_when_received(self.event_player.current_sim_time - SEEK_SECONDS)
+        elif key in [".", ">"]:
+            self._seek_when_received(self.event_player.current_sim_time + SEEK_SECONDS)
+        elif key == "d" and self.reducer is not None:
+            self._start_search(
+                "Searching for the next death...", self._find_ahead(self.reducer.next_death_time)
+            )
+        elif key == "g":
+            self.goto_input = ""
+            self.display.prompt = "Go to enemy: _"
+            
+        # Quit (or cancel a running search)
         elif key in ["q", "\x1b"]:  # Q or ESC
-            self.event_player.stop()
+            if key == "\x1b" and self._search is not None and not self._search.done():
+                self._search.cancel()
+            else:
+                self.event_player.stop()
             
-    def _update_display_from_current_time(self) -> None:
-        """Update display state from current simulation time."""
-        if not self.simulation_results or not self.event_player:
+    def _handle_goto_key(self, key: str) -> None:
+        """Handle a key while typing the enemy number to jump to.
+        
+        Args:
+            key: Key that was pressed (digits, Enter to jump, anything else cancels)
+        """
+        digits = self.goto_input or ""
+        if key.isdigit():
+            self.goto_input = digits + key
+            self.display.prompt = f"Go to enemy: {self.goto_input}_"
             return
-            
-        current_sim_time = self.event_player.current_sim_time
-        
-        # Calculate current state from events directly for real-time accuracy
-        essence = 0.0
-        essence_rate = 0.0
-        attack = 0
-        defense = 0
-        
-        # Player state (new combat system)
-        player_hp = 100.0
-        player_max_hp = 100.0
-        player_deaths = 0
-        furthest_enemy = 0
-        
-        # Track enemy state
-        enemy_number = 0
-        enemy_hp = 0.0
-        enemy_max_hp = 0.0
-        enemy_attack = 0
-        enemy_defense = 0
-        enemy_spawn_time = 0.0
-        attack_at_spawn = 0
-        
-        # Process all events up to current time
-        last_enemy_spawn = None
-        last_victory = None
-        last_combat_tick = None  # Track most recent combat tick for enemy HP
-        
-        for event in self.simulation_results.get("events", []):
-            event_time = event.get("time", 0)
-            if event_time > current_sim_time:
-                break
-                
-            event_type = event.get("type", "")
-            data = event.get("data", {})
-            
-            # Process event
-            if event_type == "draw":
-                # Update attack/defense from card draws
-                attack += data.get("attack", 0)
-                defense += data.get("defense", 0)
-                # Update essence rate from generators
-                essence_rate += data.get("essence_rate", 0)
-                # Add burst essence
-                essence += data.get("essence_burst", 0)
-                
-            elif event_type == "enemy_spawn":
-                last_enemy_spawn = event
-                last_victory = None  # Clear previous victory
-                last_combat_tick = None  # Clear previous combat ticks
-                enemy_spawn_time = event_time
-                attack_at_spawn = attack  # Capture attack at spawn time
-                # Track player HP from spawn event
-                player_hp = data.get("player_hp", player_hp)
-                
-            elif event_type == "combat_tick":
-                # Track latest combat tick for enemy HP
-                last_combat_tick = event
-                # Update player HP from combat tick
-                player_hp = data.get("player_hp", player_hp)
-                
-            elif event_type == "victory":
-                last_victory = event
-                # Keep last_enemy_spawn so we can access enemy stats
-                # Update player HP from victory event
-                player_hp = data.get("player_hp", player_hp)
-                # Reset attack/defense after victory (new combat system)
-                attack = 0
-                defense = 0
-                
-            elif event_type == "death":
-                # Player died - track death and reset state
-                player_deaths += 1
-                player_hp = player_max_hp
-                attack = 0
-                defense = 0
-                essence_rate = 0.0
-                furthest_enemy = data.get("furthest_enemy", furthest_enemy)
-        
-        # Calculate essence from rate over time
-        # Essence accumulates continuously based on rate
-        if essence_rate > 0:
-            # Calculate total essence generated up to current time
-            # We need to integrate the rate changes over time
-            temp_rate = 0.0
-            last_time = 0.0
-            temp_essence = essence  # Start with burst essence
-            
-            for event in self.simulation_results.get("events", []):
-                event_time = event.get("time", 0)
-                if event_time > current_sim_time:
+        
+        self.goto_input = None
+        self.display.prompt = None
+        reducer = self.reducer
+        if key in ["\n", "\r"] and digits and reducer is not None:
+            enemy_number = int(digits)
+            self._start_search(
+                f"Searching for enemy {enemy_number}...",
+                self._find_ahead(
+                    lambda after: reducer.enemy_spawn_time(enemy_number, after=after)
+                ),
+            )
+        
+    def _start_search(self, prompt: str, search: Coroutine[Any, Any, None]) -> None:
+        """Run a look-ahead on the event loop, showing `prompt` until it ends.
+        
+        A new search replaces one still running.
+        
+        Args:
+            prompt: Text shown while searching
+            search: Coroutine that receives batches and seeks
+        """
+        if self._search is not None:
+            self._search.cancel()
+        self.display.prompt = prompt
+        task = asyncio.get_running_loop().create_task(search)
+        task.add_done_callback(self._search_done)
+        self._search = task
+        
+    def _search_done(self, task: "asyncio.Task[None]") -> None:
+        """Clear the search prompt and redraw (search task done callback)."""
+        if task is self._search:
+            self._search = None
+            self.display.prompt = None
+        if self._redraw is not None:
+            self._redraw.set()
+        
+    async def _receive_until(self, done: Callable[[], bool]) -> None:
+        """Receive streamed batches until `done()` is true or the run ends.
+        
+        Batches are received for at most SEARCH_STEP_SECONDS per step and the
+        event loop runs between steps, so frames and keys keep being handled
+        while the simulation catches up.
+        
+        Args:
+            done: Check made after every batch
+        """
+        stream = self.stream
+        while stream is not None and not stream.finished and not done():
+            deadline = time.monotonic() + SEARCH_STEP_SECONDS
+            while not stream.finished and not done():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
-                    
-                # Accumulate essence from previous rate
-                if temp_rate > 0:
-                    time_delta = event_time - last_time
-                    temp_essence += temp_rate * time_delta
-                
-                # Update rate if this is a draw event with generator
-                if event.get("type") == "draw":
-                    rate_bonus = event.get("data", {}).get("essence_rate", 0)
-                    if rate_bonus > 0:
-                        temp_rate += rate_bonus
-                        
-                last_time = event_time
-            
-            # Add essence from last event to current time
-            if temp_rate > 0:
-                time_delta = current_sim_time - last_time
-                temp_essence += temp_rate * time_delta
-                
-            essence = temp_essence
-        
-        # Determine current enemy state
-        if last_enemy_spawn:
-            # We have enemy spawn info (may be alive or defeated)
-            data = last_enemy_spawn.get("data", {})
-            enemy_number = data.get("enemy_number", 0)
-            enemy_max_hp = data.get("max_health", 0)
-            
-            # Get per-tick rates from spawn event
-            atk_per_tick = data.get("atk_per_tick", 0)
-            def_per_tick = data.get("def_per_tick", 0)
-            
-            # Check if we have combat tick data for real-time HP and ATK/DEF
-            if last_combat_tick:
-                # Use actual enemy HP, ATK, DEF from most recent combat tick
-                tick_data = last_combat_tick.get("data", {})
-                enemy_hp = tick_data.get("enemy_hp", 0.0)
-                # BUG FIX: Get enemy_attack and enemy_defense from combat_tick event
-                # These are already calculated as atk_per_tick * ticks_elapsed
-                enemy_attack = tick_data.get("enemy_attack", 0)
-                enemy_defense = tick_data.get("enemy_defense", 0)
-            elif last_victory:
-                # Victory means enemy is defeated
-                victory_enemy = last_victory.get("data", {}).get("enemy_number", 0)
-                if victory_enemy == enemy_number:
-                    enemy_hp = 0.0
-                    enemy_attack = 0
-                    enemy_defense = 0
-                else:
-                    # Not yet in combat (shouldn't happen but fallback)
-                    enemy_hp = enemy_max_hp
-                    enemy_attack = 0
-                    enemy_defense = 0
-            else:
-                # Enemy just spawned, no combat ticks yet
-                enemy_hp = enemy_max_hp
-                # ATK/DEF start at 0 and grow each tick
-                enemy_attack = 0
-                enemy_defense = 0
-            
-        self.display.update_state(
-            time=current_sim_time,
-            essence=essence,
-            essence_rate=essence_rate,
-            attack=attack,
-            defense=defense,
-            enemy_number=enemy_number,
-            enemy_hp=enemy_hp,
-            enemy_max_hp=max(enemy_max_hp, 1.0),
-            enemy_attack=enemy_attack,
-            enemy_defense=enemy_defense,
-            player_hp=player_hp,
-            player_max_hp=player_max_hp,
-            player_deaths=player_deaths,
-            furthest_enemy=furthest_enemy,
-        )
+                stream.poll(timeout=remaining)
+            self._extend_keyframes()
+            await asyncio.sleep(0)
+        
+    async def _find_ahead(self, lookup: Callable[[float], float | None]) -> None:
+        """Seek to the next time of something, simulating further if needed.
+        
+        While the run is still streaming, batches are received until
+        `lookup` finds a time after the current playback time or the run ends.
+        
+        Args:
+            lookup: Reducer lookup taking the time to search after (may wrap
+                around to an earlier time)
+        """
+        if self.event_player is None:
+            return
+        now = self.event_player.current_sim_time
+        
+        def found_ahead() -> bool:
+            found = lookup(now)
+            return found is not None and found > now
+        
+        await self._receive_until(found_ahead)
+        found = lookup(now)
+        if found is not None:
+            self._seek(found)
+        
+    def _seek_when_received(self, sim_time: float) -> None:
+        """Seek now, or once the stream has received the events up to `sim_time`.
+        
+        Args:
+            sim_time: Simulation time to jump to (seconds)
+        """
+        stream = self.stream
+        if stream is None or stream.finished or stream.complete_time > sim_time:
+            self._seek(sim_time)
+            return
+        
+        async def receive_and_seek() -> None:
+            await self._receive_until(lambda: stream.complete_time > sim_time)
+            self._seek(sim_time)
+        
+        self._start_search("Simulating ahead...", receive_and_seek())
+        
+    def _seek(self, sim_time: float) -> None:
+        """Jump playback and display to a simulation time.
+        
+        The display state comes from the reducer's nearest keyframe; the
+        event log panel is refilled with the events just before `sim_time`.
+        
+        Only events already received are used; see _seek_when_received.
+        
+        Args:
+            sim_time: Simulation time to jump to (seconds)
+        """
+        if not self.event_player or self.reducer is None or self.events is None:
+            return
+        
+        self._extend_keyframes()
+        self.event_player.seek(min(sim_time, float(self.events.times[-1])))
+        self.reducer.seek(self.event_player.current_sim_time)
+        
+        end = self.event_player.event_index
+        recent = max(0, end - self.display.event_log.maxlen)
+        self.display.clear_events()
+        for index in self.events.indices("pack_affordable"):
+            if index < recent:
+                self.display.add_event(self.events[int(index)])
+        for index in range(recent, end):
+            self.display.add_event(self.events[index])
+        
+    def _update_display_from_current_time(self) -> None:
+        """Update display state from current simulation time.
+
+        The reducer applies only the events since the previous frame, so a
+        frame costs O(events since last frame) rather than O(events so far).
+        """
+        if not self.event_player or self.reducer is None:
+            return
+
+        self._extend_keyframes()
+        state = self.reducer.advance(self.event_player.current_sim_time)
+        self.display.update_state(**state.display_kwargs())
+    
+    def _extend_keyframes(self) -> None:
+        """Add seek keyframes for the part of a streamed run received so far."""
+        if self.stream and self.reducer is not None:
+            self.reducer.extend_keyframes(
+                None if self.stream.finished else self.stream.complete_time
+            )
     
     def _handle_event(self, event: dict) -> None:
         """Handle simulation event for display.
@@ -420,51 +516,16 @@ class LiveViewer:
                     
     def _handle_complete(self) -> None:
         """Handle simulation playback completion."""
-        # Nothing special to do here, summary will be shown in display loop
-        pass
+        # Draw the final frame now; the summary is shown once the loop ends
+        if self._redraw is not None:
+            self._redraw.set()
         
     def _show_summary(self) -> None:
         """Show post-simulation summary screen."""
         if not self.simulation_results:
             return
             
-        # Extract data
-        duration = self.simulation_results.get("duration_minutes", 0)
-        final_essence = self.simulation_results.get("final_essence", 0)
-        final_rate = self.simulation_results.get("player_essence_rate", 0)
-        enemies_defeated = self.simulation_results.get("enemies_defeated", 0)
-        enemies_encountered = self.simulation_results.get("enemies_encountered", 0)
-        cards_drawn = self.simulation_results.get("cards_drawn", 0)
-        total_damage = self.simulation_results.get("total_damage_dealt", 0)
-        pack_times = self.simulation_results.get("pack_affordable_times", {})
-        
-        # New combat system data
-        player_hp = self.simulation_results.get("player_hp", 0)
-        player_max_hp = self.simulation_results.get("player_max_hp", 100)
-        player_deaths = self.simulation_results.get("player_deaths", 0)
-        furthest_enemy = self.simulation_results.get("furthest_enemy", 0)
-        
-        # Check if died to a boss
-        death_enemy = None
-        if enemies_defeated < enemies_encountered:
-            death_enemy = enemies_defeated + 1
-            
-        # Render summary
-        summary = self.display.render_summary(
-            duration=duration,
-            final_essence=final_essence,
-            final_rate=final_rate,
-            enemies_defeated=enemies_defeated,
-            enemies_encountered=enemies_encountered,
-            cards_drawn=cards_drawn,
-            total_damage=total_damage,
-            pack_times=pack_times,
-            death_enemy=death_enemy,
-            player_hp=player_hp,
-            player_max_hp=player_max_hp,
-            player_deaths=player_deaths,
-            furthest_enemy=furthest_enemy,
-        )
+        summary = self.display.render_results_summary(self.simulation_results)
         
         self.console.print("\n")
         self.console.print(summary)
@@ -490,10 +551,9 @@ class LiveViewer:
             
         try:
             from simulator.analysis.visualization import save_all_charts
-            from simulator.core.cards import STARTER_DECK_CARDS
-            from simulator.core.deck import Deck
+            from simulator.core.deck import starter_deck
             
-            deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+            deck = starter_deck()
             output_dir = Path("output")
             
             self.console.print("[yellow]Generating charts...[/yellow]")
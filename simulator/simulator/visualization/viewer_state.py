@@ -0,0 +1,358 @@
+"""Incremental display state for live playback.
+
+The live viewer shows running totals (essence, ATK/DEF, HP, current enemy)
+as of the playback time. ViewerStateReducer keeps those totals plus a
+cursor into the event log, and each frame applies only the events between
+the previous and the current playback time, so the cost per frame depends
+on how far playback moved rather than on how long it has been running.
+
+For seeking, full snapshots of the reducer (keyframes) are taken every K
+simulated seconds when the trace is loaded (or as it arrives, for a
+streamed trace). Seeking to any time restores
+the nearest earlier keyframe (found by bisection) and replays at most K
+seconds of events, so rewinds and jumps cost the same anywhere in a trace.
+"""
+
+import bisect
+from dataclasses import asdict, dataclass, replace
+from typing import Any
+
+import numpy as np
+
+from simulator.core.event_log import (
+    COMBAT_TICK,
+    DEATH,
+    DRAW,
+    ENEMY_SPAWN,
+    VICTORY,
+    EventLog,
+)
+
+# Default simulated seconds between keyframes
+KEYFRAME_INTERVAL = 30.0
+
+
+@dataclass
+class ViewerState:
+    """Display state at one playback time (SimulationDisplay.update_state fields)."""
+
+    time: float = 0.0
+    essence: float = 0.0
+    essence_rate: float = 0.0
+    attack: int = 0
+    defense: int = 0
+    enemy_number: int = 0
+    enemy_hp: float = 0.0
+    enemy_max_hp: float = 0.0
+    enemy_attack: float = 0.0
+    enemy_defense: float = 0.0
+    player_hp: float = 100.0
+    player_max_hp: float = 100.0
+    player_deaths: int = 0
+    furthest_enemy: int = 0
+
+    def display_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for SimulationDisplay.update_state."""
+        kwargs = asdict(self)
+        kwargs["enemy_max_hp"] = max(self.enemy_max_hp, 1.0)
+        return kwargs
+
+
+@dataclass
+class _Keyframe:
+    """Complete reducer state at one playback time."""
+
+    cursor: int
+    state: ViewerState
+    burst_essence: float
+    rate_essence: float
+    integrated_to: float
+    enemy_ticked: bool
+
+
+class ViewerStateReducer:
+    """Folds an event log into ViewerState, one playback time after another.
+
+    Draws add card stats (victory resets ATK/DEF, death also resets the
+    essence rate), burst essence is added once, and rate essence is
+    integrated piecewise between rate changes. Enemy and player HP follow
+    the latest spawn / combat tick / victory / death.
+
+    Jumps (backwards, or forwards past a keyframe) restore the nearest
+    keyframe at or before the target time and replay from there.
+    """
+
+    def __init__(
+        self,
+        events: EventLog,
+        player_max_hp: float = 100.0,
+        keyframe_interval: float | None = KEYFRAME_INTERVAL,
+        complete_time: float | None = None,
+    ) -> None:
+        """Initialize reducer and build its keyframe index.
+
+        Args:
+            events: Simulation event log
+            player_max_hp: Player max HP (HP after a death)
+            keyframe_interval: Simulated seconds between keyframes (None: no keyframes)
+            complete_time: For a log that is still being streamed, the time
+                before which its events are complete (see extend_keyframes)
+        """
+        if keyframe_interval is not None and keyframe_interval <= 0:
+            raise ValueError("keyframe_interval must be positive")
+        self.events = events
+        self.player_max_hp = player_max_hp
+        self.keyframe_interval = keyframe_interval
+
+        cards = events.cards or [("", "", 0.0, 0, 0, 0)]
+        _, _, rates, bursts, attacks, defenses = zip(*cards, strict=True)
+        self._card_rate = np.array(rates, dtype=np.float64)
+        self._card_burst = np.array(bursts, dtype=np.float64)
+        self._card_attack = np.array(attacks, dtype=np.int64)
+        self._card_defense = np.array(defenses, dtype=np.int64)
+
+        self._keyframe_times: list[float] = []
+        self._keyframes: list[_Keyframe] = []
+        self.reset()
+        self.extend_keyframes(complete_time)
+
+    def extend_keyframes(self, complete_time: float | None = None) -> None:
+        """Snapshot the reducer every `keyframe_interval` seconds past the last keyframe.
+
+        A keyframe at time t needs every event up to t, so while the log is
+        still growing only times before `complete_time` are covered; call
+        again as more events arrive. The reducer's playback state is left
+        unchanged.
+
+        Args:
+            complete_time: Events before this time are complete (default:
+                the log is complete, keyframes cover its last event)
+        """
+        interval = self.keyframe_interval
+        if interval is None or not len(self.events):
+            return
+        if complete_time is None:
+            complete_time = float(self.events.times[-1]) + interval
+        time = (len(self._keyframe_times) + 1) * interval
+        if time >= complete_time:
+            return
+
+        playback = self._snapshot()
+        if self._keyframes:
+            self._restore(self._keyframes[-1])
+        else:
+            self.reset()
+        while time < complete_time:
+            self.advance(time)
+            self._keyframe_times.append(time)
+            self._keyframes.append(self._snapshot())
+            time = (len(self._keyframe_times) + 1) * interval
+        self._restore(playback)
+
+    def _snapshot(self) -> _Keyframe:
+        """Copy of the complete reducer state."""
+        return _Keyframe(
+            cursor=self.cursor,
+            state=replace(self.state),
+            burst_essence=self._burst_essence,
+            rate_essence=self._rate_essence,
+            integrated_to=self._integrated_to,
+            enemy_ticked=self._enemy_ticked,
+        )
+
+    def _restore(self, keyframe: _Keyframe) -> None:
+        """Restore the reducer to a keyframe.
+
+        Args:
+            keyframe: Snapshot taken by _snapshot
+        """
+        self.cursor = keyframe.cursor
+        self.state = replace(keyframe.state)
+        self._burst_essence = keyframe.burst_essence
+        self._rate_essence = keyframe.rate_essence
+        self._integrated_to = keyframe.integrated_to
+        self._enemy_ticked = keyframe.enemy_ticked
+
+    def reset(self) -> None:
+        """Rewind to before the first event."""
+        self.cursor = 0  # Index of the next event to apply
+        self.state = ViewerState(player_hp=self.player_max_hp, player_max_hp=self.player_max_hp)
+        self._burst_essence = 0.0
+        self._rate_essence = 0.0  # Rate essence integrated up to _integrated_to
+        self._integrated_to = 0.0
+        self._enemy_ticked = False  # Current enemy has had a combat tick
+
+    def advance(self, time: float) -> ViewerState:
+        """Apply every event up to `time` not applied yet.
+
+        Args:
+            time: Playback time (seconds)
+
+        Returns:
+            Display state at `time` (the reducer's own state object)
+        """
+        index = bisect.bisect_right(self._keyframe_times, time) - 1
+        if time < self.state.time:
+            # Backwards: nearest keyframe at or before `time`, else the start
+            if index >= 0:
+                self._restore(self._keyframes[index])
+            else:
+                self.reset()
+        elif index >= 0 and self._keyframe_times[index] > self.state.time:
+            # Forwards past a keyframe: skip the events it already covers
+            self._restore(self._keyframes[index])
+
+        end = int(np.searchsorted(self.events.times, time, side="right"))
+        if end > self.cursor:
+            self._apply(self.cursor, end)
+            self.cursor = end
+
+        state = self.state
+        state.time = time
+        state.essence = (
+            self._burst_essence
+            + self._rate_essence
+            + state.essence_rate * (time - self._integrated_to)
+        )
+        return state
+
+    def seek(self, time: float) -> ViewerState:
+        """Jump to any playback time (see advance).
+
+        Args:
+            time: Playback time (seconds)
+
+        Returns:
+            Display state at `time`
+        """
+        return self.advance(max(0.0, time))
+
+    def enemy_spawn_time(self, enemy_number: int, after: float = -1.0) -> float | None:
+        """Time of the first spawn of an enemy after a given time.
+
+        Args:
+            enemy_number: Enemy sequence number
+            after: Only consider spawns later than this (seconds)
+
+        Returns:
+            Spawn time, the enemy's first spawn if it never spawns again, or
+            None if it never spawns
+        """
+        spawns = self.events.indices("enemy_spawn")
+        spawns = spawns[self.events.column("enemy_number")[spawns] == enemy_number]
+        times = self.events.times[spawns]
+        if not len(times):
+            return None
+        later = times[times > after]
+        return float(later[0] if len(later) else times[0])
+
+    def next_death_time(self, after: float) -> float | None:
+        """Time of the first player death after a given time.
+
+        Args:
+            after: Only consider deaths later than this (seconds)
+
+        Returns:
+            Death time, the first death if none comes later, or None if the
+            player never dies
+        """
+        times = self.events.times[self.events.indices("death")]
+        if not len(times):
+            return None
+        later = times[times > after]
+        return float(later[0] if len(later) else times[0])
+
+    def _apply(self, start: int, end: int) -> None:
+        """Fold events[start:end] into the running totals.
+
+        Args:
+            start: First event index to apply
+            end: One past the last event index to apply
+        """
+        events = self.events
+        state = self.state
+        codes = events.type_codes[start:end]
+        card_column = events.column("card")[start:end]
+
+        draws = np.flatnonzero(codes == DRAW)
+        draw_cards = card_column[draws]
+        deaths = np.flatnonzero(codes == DEATH)
+        resets = np.flatnonzero((codes == VICTORY) | (codes == DEATH))
+
+        # ATK/DEF: draws since the last victory or death
+        if len(resets):
+            draw_cards_since = draw_cards[draws > resets[-1]]
+            state.attack = int(self._card_attack[draw_cards_since].sum())
+            state.defense = int(self._card_defense[draw_cards_since].sum())
+        else:
+            state.attack += int(self._card_attack[draw_cards].sum())
+            state.defense += int(self._card_defense[draw_cards].sum())
+
+        # Burst essence is never reset
+        self._burst_essence += float(self._card_burst[draw_cards].sum())
+
+        # Rate essence: constant rate between generator draws and deaths
+        generators = draws[self._card_rate[draw_cards] > 0]
+        changes = np.union1d(generators, deaths)
+        if len(changes):
+            is_death = codes[changes] == DEATH
+            delta = np.where(is_death, 0.0, self._card_rate[card_column[changes]])
+            total = np.cumsum(delta)
+            last_death = np.maximum.accumulate(np.where(is_death, np.arange(len(changes)), -1))
+            rates = np.where(
+                last_death >= 0,
+                total - total[np.maximum(last_death, 0)],
+                state.essence_rate + total,
+            )
+            change_times = events.times[start:end][changes]
+            segment_starts = np.concatenate([[self._integrated_to], change_times[:-1]])
+            segment_rates = np.concatenate([[state.essence_rate], rates[:-1]])
+            self._rate_essence += float((segment_rates * (change_times - segment_starts)).sum())
+            self._integrated_to = float(change_times[-1])
+            state.essence_rate = float(rates[-1])
+
+        if len(deaths):
+            state.player_deaths += len(deaths)
+            state.furthest_enemy = int(events.column("enemy_number")[start + deaths[-1]])
+
+        # Player HP follows the latest spawn/tick/victory, death restores it
+        hp_rows = np.flatnonzero(
+            (codes == ENEMY_SPAWN) | (codes == COMBAT_TICK) | (codes == VICTORY) | (codes == DEATH)
+        )
+        if len(hp_rows):
+            last = hp_rows[-1]
+            if codes[last] == DEATH:
+                state.player_hp = self.player_max_hp
+            else:
+                state.player_hp = float(events.column("player_hp")[start + last])
+
+        # Current enemy: latest spawn, then its latest combat tick or victory
+        spawns = np.flatnonzero(codes == ENEMY_SPAWN)
+        first = 0
+        if len(spawns):
+            spawn = start + spawns[-1]
+            state.enemy_number = int(events.column("enemy_number")[spawn])
+            state.enemy_max_hp = float(events.column("enemy_hp")[spawn])
+            state.enemy_hp = state.enemy_max_hp
+            # ATK/DEF start at 0 and grow each tick
+            state.enemy_attack = 0.0
+            state.enemy_defense = 0.0
+            self._enemy_ticked = False
+            first = spawns[-1] + 1
+
+        if state.enemy_number == 0:
+            return
+        after_spawn = codes[first:]
+        ticks = np.flatnonzero(after_spawn == COMBAT_TICK)
+        victories = np.flatnonzero(after_spawn == VICTORY)
+        if len(ticks):
+            # Enemy HP, ATK, DEF from the most recent combat tick
+            last_tick = start + first + ticks[-1]
+            state.enemy_hp = float(events.column("enemy_hp")[last_tick])
+            state.enemy_attack = events.column("enemy_attack")[last_tick].item()
+            state.enemy_defense = events.column("enemy_defense")[last_tick].item()
+            self._enemy_ticked = True
+        elif len(victories) and not self._enemy_ticked:
+            last_victory = start + first + victories[-1]
+            if int(events.column("enemy_number")[last_victory]) == state.enemy_number:
+                state.enemy_hp = 0.0
@@ -0,0 +1,86 @@
+"""Tests for the on-disk results archive."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from simulator.core.archive import load_results, save_results
+from simulator.core.balance_config import default_balance_config
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.core.results import SimulationResult
+
+DECK = starter_deck()
+
+
+def test_save_and_load_one_run(tmp_path: Path) -> None:
+    """Test a saved run loads back equal, with memory-mapped read-only columns."""
+    results = CombatSimulator(seed=6, record_level="full").simulate(
+        duration_minutes=10.0, deck=DECK, engine="event", state_capacity=40
+    )
+    path = results.save(tmp_path / "run.simrun")
+    loaded = SimulationResult.load(path)
+
+    assert loaded.to_dict() == results.to_dict()
+    assert loaded.fights == results.fights
+    assert loaded.state_history.dropped == results.state_history.dropped > 0
+    assert loaded.events[0] == results.events[0]  # Draw events keep their card table
+
+    times = loaded.events.column("time")
+    assert not times.flags.owndata
+    assert not times.flags.writeable
+    assert SimulationResult.load(path, mmap=False).events.column("time").flags.writeable
+
+
+def test_archive_of_many_runs(tmp_path: Path) -> None:
+    """Test runs share concatenated columns and can be sliced one at a time."""
+    runs = [
+        CombatSimulator(seed=seed, record_level="milestones").simulate(
+            duration_minutes=15.0, deck=DECK, engine="resolved"
+        )
+        for seed in range(4)
+    ]
+    archive = load_results(save_results(tmp_path / "runs.simrun", runs))
+
+    assert len(archive) == 4
+    assert archive.scalars("final_essence").tolist() == [run.final_essence for run in runs]
+    spawns = archive.column("fights", "spawn_time")
+    assert len(spawns) == sum(len(run.fights) for run in runs)
+    assert np.array_equal(spawns[archive.rows("fights", 2)], runs[2].fights.column("spawn_time"))
+    assert archive[-1].to_dict() == runs[3].to_dict()
+
+    with pytest.raises(ValueError, match="4 runs"):
+        SimulationResult.load(archive.path)
+
+
+def test_incomplete_or_foreign_archives_are_rejected(tmp_path: Path) -> None:
+    """Test a directory without a header, or with another format, is not opened."""
+    results = CombatSimulator(seed=1, record_level="off").simulate(
+        duration_minutes=2.0, deck=DECK, engine="event"
+    )
+    path = results.save(tmp_path / "run.simrun")
+
+    header = json.loads((path / "header.json").read_text())
+    header["format"] = 999
+    (path / "header.json").write_text(json.dumps(header))
+    with pytest.raises(ValueError, match="format"):
+        load_results(path)
+
+    (path / "header.json").unlink()
+    with pytest.raises(FileNotFoundError):
+        load_results(path)
+
+
+def test_fractional_pack_costs_round_trip(tmp_path: Path) -> None:
+    """Test a non-integer pack cost (e.g. a sweep override) is recorded and stored exactly."""
+    config = default_balance_config().with_overrides({"pack_costs.Arcane_Pack.1": 45_000.75})
+    results = CombatSimulator(seed=2, record_level="milestones", config=config).simulate(
+        duration_minutes=9.0, deck=DECK, engine="event"
+    )
+    packs = [event for event in results.events if event["type"] == "pack_affordable"]
+    assert packs[0]["data"]["pack_cost"] == 45_000.75
+
+    loaded = SimulationResult.load(results.save(tmp_path / "run.simrun"))
+    assert loaded.events.to_dicts() == results.events.to_dicts()
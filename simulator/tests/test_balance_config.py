@@ -0,0 +1,75 @@
+"""Tests for the lazily loaded, injectable balance config."""
+
+import copy
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from simulator.core import combat
+from simulator.core.balance_config import DEFAULT_CONFIG_PATH, BalanceConfig, default_balance_config
+from simulator.core.batch import BatchCombatSimulator
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+
+
+def _write_config(path: Path, data: dict) -> Path:
+    """Write a config file and return its path."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_load_is_cached_by_path_and_mtime(tmp_path: Path) -> None:
+    """Test unchanged files reuse the instance and edited files are reloaded."""
+    data = copy.deepcopy(default_balance_config().data)
+    path = _write_config(tmp_path / "balance-config.json", data)
+
+    first = BalanceConfig.load(path)
+    assert BalanceConfig.load(str(path)) is first
+    assert first.starting_hp == data["player_stats"]["starting_hp"]
+
+    data["player_stats"]["starting_hp"] = 250
+    _write_config(path, data)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = BalanceConfig.load(path)
+    assert reloaded is not first
+    assert reloaded.starting_hp == 250.0
+
+    with pytest.raises(FileNotFoundError, match="balance-config.json"):
+        BalanceConfig.load(tmp_path / "missing.json")
+
+
+def test_module_globals_are_lazy_default_config() -> None:
+    """Test BALANCE_CONFIG and ENEMY_TABLE still resolve to the default config."""
+    default = BalanceConfig.load(DEFAULT_CONFIG_PATH)
+
+    assert combat.BALANCE_CONFIG is default.data
+    assert combat.ENEMY_TABLE is default.enemy_table
+    with pytest.raises(AttributeError):
+        combat.NOT_A_SETTING  # noqa: B018
+
+
+def test_simulators_use_injected_config() -> None:
+    """Test several config variants can be simulated side by side."""
+    data = copy.deepcopy(default_balance_config().data)
+    data["player_stats"]["starting_hp"] = 500
+    data["enemy_scaling"]["hp_formulas"]["act_1"]["formula"] = "2000 + (n - 1) * 500"
+    variant = BalanceConfig(data)
+    deck = starter_deck()
+
+    default_sim = CombatSimulator(record_level="off", seed=0)
+    variant_sim = CombatSimulator(record_level="off", seed=0, config=variant)
+    default_results = default_sim.simulate(duration_minutes=5.0, deck=deck, engine="event")
+    variant_results = variant_sim.simulate(duration_minutes=5.0, deck=deck, engine="event")
+
+    assert variant_sim.player.max_hp == 500.0
+    assert variant_results["enemies_defeated"] < default_results["enemies_defeated"]
+
+    # Derived tables are built once per config and shared between simulators
+    assert CombatSimulator(config=variant).config.enemy_table is variant.enemy_table
+    batch = BatchCombatSimulator(config=variant)
+    assert batch.starting_hp == 500.0
+    assert batch._enemy_hp is variant.enemy_table.max_health
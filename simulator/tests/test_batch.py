@@ -0,0 +1,83 @@
+"""Tests for the vectorized batch combat engine."""
+
+import numpy as np
+import pytest
+
+from simulator.core.batch import BatchCombatSimulator
+from simulator.core.cards import STARTER_DECK_CARDS
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import Deck, starter_deck
+
+
+def test_batch_matches_scalar_engine_for_fixed_order_deck() -> None:
+    """Test every run reproduces the event engine when shuffling cannot matter."""
+    # Eight copies of one hybrid card: draw order is identical for every shuffle
+    deck = Deck(name="Siphons", cards=[STARTER_DECK_CARDS[2]] * 8, tier="arcane")
+
+    scalar = CombatSimulator(record_level="off").simulate(
+        duration_minutes=30.0, deck=deck, engine="event"
+    )
+    batch = BatchCombatSimulator().simulate(duration_minutes=30.0, deck=deck, n_runs=4, seed=0)
+
+    for key in [
+        "final_essence",
+        "final_shards",
+        "cards_drawn",
+        "enemies_defeated",
+        "combat_ticks",
+        "player_deaths",
+        "furthest_enemy",
+        "total_combat_time",
+    ]:
+        np.testing.assert_allclose(batch[key], scalar[key], err_msg=key)
+
+    for pack_num, times in batch["pack_affordable_times"].items():
+        expected = scalar["pack_affordable_times"].get(pack_num, np.nan)
+        np.testing.assert_allclose(times, expected, err_msg=f"pack {pack_num}")
+
+    # Durations per enemy number agree with the scalar engine's victories
+    assert np.isnan(batch["enemy_durations"][:, 0]).all()
+    assert batch["enemy_durations"].shape[1] == scalar["furthest_enemy"] + 1
+
+
+def test_batch_distribution_matches_scalar_engine() -> None:
+    """Test aggregate outputs of shuffled decks agree with scalar runs on average."""
+    deck = starter_deck()
+
+    scalar_runs = []
+    sim = CombatSimulator(record_level="off", seed=0)
+    for run_index in range(40):
+        scalar_runs.append(
+            sim.simulate(duration_minutes=10.0, deck=deck, engine="event", run_index=run_index)
+        )
+    batch = BatchCombatSimulator().simulate(duration_minutes=10.0, deck=deck, n_runs=2000, seed=1)
+
+    for key in ["final_essence", "enemies_defeated", "furthest_enemy"]:
+        scalar_values = np.array([r[key] for r in scalar_runs], dtype=float)
+        # Within 4 standard errors of the scalar sample mean
+        tolerance = 4 * max(scalar_values.std(), 1.0) / np.sqrt(len(scalar_values))
+        assert abs(batch[key].mean() - scalar_values.mean()) < tolerance, key
+
+
+def test_batch_seed_is_reproducible() -> None:
+    """Test the same seed gives the same batch."""
+    deck = starter_deck()
+    sim = BatchCombatSimulator()
+
+    first = sim.simulate(duration_minutes=2.0, deck=deck, n_runs=50, seed=7)
+    second = sim.simulate(duration_minutes=2.0, deck=deck, n_runs=50, seed=7)
+
+    np.testing.assert_array_equal(first["final_essence"], second["final_essence"])
+    assert first["final_essence"].shape == (50,)
+
+
+def test_batch_rejects_invalid_input() -> None:
+    """Test deck size and run count validation."""
+    sim = BatchCombatSimulator()
+
+    with pytest.raises(ValueError, match="n_runs"):
+        sim.simulate(
+            duration_minutes=1.0,
+            deck=starter_deck(),
+            n_runs=0,
+        )
@@ -0,0 +1,65 @@
+"""Tests for headless asciicast replay export."""
+
+import io
+import json
+
+import pytest
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.visualization.cast_export import CastWriter, export_cast
+
+
+def test_export_writes_asciicast(tmp_path) -> None:
+    """Test a run is recorded on the virtual clock as a valid asciicast v2 file."""
+    deck = starter_deck()
+    recording = export_cast(
+        tmp_path / "replay.cast",
+        deck,
+        duration_minutes=5,
+        speed=30,
+        fps=5,
+        simulator=CombatSimulator(seed=1),
+    )
+
+    lines = recording.path.read_text(encoding="utf-8").splitlines()
+    header = json.loads(lines[0])
+    assert header["version"] == 2
+    assert (header["width"], header["height"]) == (100, 40)
+
+    events = [json.loads(line) for line in lines[1:]]
+    times = [event[0] for event in events]
+    assert times == sorted(times)
+    assert all(kind == "o" for _, kind, _ in events)
+    assert recording.frames == 5 * 60 // 30 * 5 + 1  # One frame per 1/5 s of a 10 s replay
+    assert "SIMULATION COMPLETE" in events[-2][2]
+    assert recording.results["final_essence"] > 0
+
+
+def test_export_chains_simulation_error(tmp_path) -> None:
+    """Test a failed simulation surfaces as a RuntimeError caused by its exception."""
+
+    class FailingSimulator(CombatSimulator):
+        def simulate(self, *args, **kwargs):
+            raise ValueError("bad deck")
+
+    deck = starter_deck()
+    with pytest.raises(RuntimeError, match="Simulation failed") as excinfo:
+        export_cast(
+            tmp_path / "replay.cast", deck, duration_minutes=1, simulator=FailingSimulator()
+        )
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+def test_writer_skips_unchanged_lines() -> None:
+    """Test only rows that differ from the previous screen are written."""
+    out = io.StringIO()
+    writer = CastWriter(out, 10, 3)
+    writer.screen(0.0, "aaa\nbbb\nccc")
+    writer.screen(0.1, "aaa\nBBB\nccc")
+    writer.screen(0.2, "aaa\nBBB\nccc")
+
+    events = [json.loads(line) for line in out.getvalue().splitlines()[1:]]
+    assert len(events) == 2
+    assert events[1] == [0.1, "o", "\x1b[2;1HBBB"]
+    assert writer.frames == 3
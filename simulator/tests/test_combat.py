@@ -3,8 +3,8 @@
 import pytest
 
 from simulator.core.cards import STARTER_DECK_CARDS
-from simulator.core.combat import CombatSimulator, Enemy
-from simulator.core.deck import Deck
+from simulator.core.combat import CombatSimulator, Enemy, RecordLevel
+from simulator.core.deck import Deck, starter_deck
 
 
 def test_enemy_spawning() -> None:
@@ -181,7 +181,7 @@ def test_essence_generation() -> None:
 def test_basic_simulation_run() -> None:
     """Test basic simulation execution with starter deck."""
     sim = CombatSimulator()
-    deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+    deck = starter_deck()
     
     # Run 5 minute simulation
     results = sim.simulate(duration_minutes=5.0, deck=deck)
@@ -214,7 +214,7 @@ def test_basic_simulation_run() -> None:
 def test_pack_affordability_tracking() -> None:
     """Test that pack affordability is tracked correctly."""
     sim = CombatSimulator()
-    deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+    deck = starter_deck()
     
     # Run long enough to afford first pack
     results = sim.simulate(duration_minutes=10.0, deck=deck)
@@ -254,7 +254,7 @@ def test_simulation_events() -> None:
 def test_state_history_recording() -> None:
     """Test that state history is recorded at intervals."""
     sim = CombatSimulator()
-    deck = Deck(name="Starter Deck", cards=STARTER_DECK_CARDS, tier="arcane")
+    deck = starter_deck()
     
     # Run 30 second simulation (should record ~3 states at 10s intervals)
     results = sim.simulate(duration_minutes=0.5, deck=deck, state_recording_interval=10.0)
@@ -311,3 +311,123 @@ def test_hybrid_card_mechanics() -> None:
     assert sim.accumulated_defense == 5
 
 
+def _run_seeded(seed: int, **kwargs: object) -> tuple[CombatSimulator, dict]:
+    """Run a starter-deck simulation with a fixed shuffle seed."""
+    sim = CombatSimulator(seed=seed)
+    deck = starter_deck()
+    results = sim.simulate(deck=deck, **kwargs)
+    return sim, results
+
+
+def test_event_engine_matches_stepped_engine() -> None:
+    """Test event-driven engine reproduces a drift-free stepped run."""
+    # 0.5s steps are exact in binary floating point, so the stepped clock never drifts
+    stepped_sim, stepped = _run_seeded(7, duration_minutes=10.0, engine="stepped", time_step=0.5)
+    event_sim, event = _run_seeded(7, duration_minutes=10.0, engine="event")
+
+    for key in [
+        "cards_drawn",
+        "enemies_defeated",
+        "enemies_encountered",
+        "combat_ticks",
+        "total_damage_dealt",
+        "total_damage_taken",
+        "player_hp",
+        "player_deaths",
+        "furthest_enemy",
+        "final_essence",
+    ]:
+        assert event[key] == pytest.approx(stepped[key]), key
+
+    # Pack crossings are exact in the event engine, within one step in the stepped engine
+    assert event["pack_affordable_times"].keys() == stepped["pack_affordable_times"].keys()
+    for pack_num, minutes in event["pack_affordable_times"].items():
+        assert abs(minutes - stepped["pack_affordable_times"][pack_num]) * 60 <= 0.5
+
+    assert len(event["state_history"]) == len(stepped["state_history"])
+    assert event_sim.loop_iterations * 10 <= stepped_sim.loop_iterations * 5
+
+
+def test_event_engine_iterations_and_clock() -> None:
+    """Test event-driven engine runs once per tick on an exact clock."""
+    stepped_sim, _ = _run_seeded(3, duration_minutes=5.0, engine="stepped")
+    event_sim, results = _run_seeded(3, duration_minutes=5.0, engine="event")
+
+    assert stepped_sim.loop_iterations >= 10 * event_sim.loop_iterations
+
+    # Ticks land on whole seconds (no float accumulation drift)
+    tick_times = [e["time"] for e in results["events"] if e["type"] in ("draw", "reshuffle")]
+    assert tick_times[:5] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert all(t == int(t) for t in tick_times)
+
+
+def test_unknown_engine_rejected() -> None:
+    """Test simulate() rejects unknown engine names."""
+    sim = CombatSimulator()
+    deck = starter_deck()
+
+    with pytest.raises(ValueError, match="Unknown engine"):
+        sim.simulate(duration_minutes=1.0, deck=deck, engine="warp")
+
+
+def test_record_levels_filter_events() -> None:
+    """Test each record level keeps only its event categories."""
+    _, full = _run_seeded(11, duration_minutes=5.0, engine="event")
+    full_types = {e["type"] for e in full["events"]}
+    assert {"draw", "reshuffle", "combat_tick", "enemy_spawn", "victory"} <= full_types
+    assert full["record_level"] == "full"
+
+    _, fights = _run_seeded(11, duration_minutes=5.0, engine="event", record_level="fights")
+    assert {e["type"] for e in fights["events"]} == full_types - {"draw", "reshuffle"}
+
+    _, milestones = _run_seeded(
+        11, duration_minutes=5.0, engine="event", record_level=RecordLevel.MILESTONES
+    )
+    milestone_types = {e["type"] for e in milestones["events"]}
+    assert milestone_types <= {"enemy_spawn", "victory", "death", "pack_affordable"}
+    assert list(milestones["events"]) == [
+        e for e in full["events"] if e["type"] in milestone_types
+    ]
+
+    _, off = _run_seeded(11, duration_minutes=5.0, engine="event", record_level="off")
+    assert list(off["events"]) == []
+
+    # Aggregates do not depend on what was recorded
+    for key in ["final_essence", "enemies_defeated", "combat_ticks", "pack_affordable_times"]:
+        assert off[key] == full[key]
+
+
+def test_record_level_parse() -> None:
+    """Test record level names and numbers."""
+    assert RecordLevel.parse("Milestones") is RecordLevel.MILESTONES
+    assert RecordLevel.parse(0) is RecordLevel.OFF
+    assert CombatSimulator(record_level="off").record_level is RecordLevel.OFF
+
+    with pytest.raises(ValueError, match="Unknown record level"):
+        RecordLevel.parse("verbose")
+
+
+def test_seeded_runs_are_reproducible() -> None:
+    """Test a run is re-created bit-for-bit from its seed and run index."""
+    deck = starter_deck()
+
+    first = CombatSimulator(seed=3, run_index=5).simulate(duration_minutes=5.0, deck=deck)
+    # Same stream from a shared simulator with per-run overrides
+    sim = CombatSimulator()
+    other = sim.simulate(duration_minutes=5.0, deck=deck, seed=3, run_index=6)
+    replay = sim.simulate(duration_minutes=5.0, deck=deck, seed=3, run_index=5)
+
+    assert (first["seed"], first["run_index"]) == (3, 5)
+    assert list(replay["events"]) == list(first["events"])
+    assert replay["final_essence"] == first["final_essence"]
+    assert list(other["events"]) != list(first["events"])
+
+
+def test_unseeded_runs_record_their_entropy() -> None:
+    """Test an unseeded run can be replayed from the seed in its results."""
+    deck = starter_deck()
+
+    original = CombatSimulator().simulate(duration_minutes=3.0, deck=deck)
+    replay = CombatSimulator(seed=original["seed"]).simulate(duration_minutes=3.0, deck=deck)
+
+    assert list(replay["events"]) == list(original["events"])
@@ -0,0 +1,82 @@
+"""Tests for cached section rendering in the live display."""
+
+import io
+from collections.abc import Callable
+
+from rich.console import Console, RenderableType
+
+from simulator.core.balance_config import default_balance_config
+from simulator.visualization.display import SimulationDisplay
+
+
+def _display() -> tuple[SimulationDisplay, Console]:
+    console = Console(file=io.StringIO(), force_terminal=True, width=100, height=40)
+    return SimulationDisplay(console), console
+
+
+def _state(time: float, essence: float) -> dict[str, float]:
+    return {
+        "time": time, "essence": essence, "essence_rate": 2.0, "attack": 3, "defense": 1,
+        "enemy_number": 1, "enemy_hp": 20.0, "enemy_max_hp": 20.0,
+        "enemy_attack": 0, "enemy_defense": 0,
+    }
+
+
+def test_sections_rebuild_only_when_inputs_change() -> None:
+    """Test an unchanged frame rebuilds nothing and a new event rebuilds only its sections."""
+    display, console = _display()
+    builds = dict.fromkeys(display.sections, 0)
+
+    def counted(name: str, build: Callable[[], RenderableType]) -> Callable[[], RenderableType]:
+        def wrapper() -> RenderableType:
+            builds[name] += 1
+            return build()
+        return wrapper
+
+    for name, section in display.sections.items():
+        section.build = counted(name, section.build)
+
+    display.update_state(**_state(1.2, 10.0))
+    display.set_playback_state(False, 1)
+    console.print(display.render())
+    assert set(builds.values()) == {1}
+
+    # Same whole second and rounded essence: nothing to rebuild
+    display.update_state(**_state(1.7, 10.2))
+    display.set_playback_state(False, 1)
+    console.print(display.render())
+    assert set(builds.values()) == {1}
+
+    display.add_event({"time": 2.0, "type": "reshuffle", "data": {"deck_size": 8}})
+    console.print(display.render())
+    assert builds == {"header": 1, "card": 2, "log": 2, "packs": 1, "controls": 1}
+
+    display.prompt = "Go to enemy: 4_"
+    console.print(display.render())
+    assert builds["controls"] == 2
+
+
+def test_render_returns_stable_screen() -> None:
+    """Test Live can keep one renderable for the whole session."""
+    display, console = _display()
+    screen = display.render()
+    display.update_state(**_state(5.0, 50.0))
+    assert display.render() is screen
+
+    console.print(screen)
+    assert "Essence: 50" in console.file.getvalue()
+
+
+def test_pack_status_follows_config_pack_costs() -> None:
+    """Test every configured pack is shown, at the injected config's cost."""
+    config = default_balance_config().with_overrides({"pack_costs.Arcane_Pack.1": 30_000})
+    console = Console(file=io.StringIO(), force_terminal=True, width=160, height=40)
+    display = SimulationDisplay(console, config)
+    display.update_state(**_state(5.0, 10_000.0))
+    display.add_event({"time": 180.0, "type": "pack_affordable", "data": {"pack_number": 2}})
+
+    assert list(display.pack_status) == sorted(config.pack_costs)
+    labels = dict(zip(display.pack_costs, display._pack_labels(), strict=True))
+    assert labels[1] == ("(needs 20,000)", "dim")
+    assert labels[2] == ("✓ (3.0m)", "green")
+    assert labels[5][0] == f"(needs {config.pack_costs[5] - 10_000:,})"
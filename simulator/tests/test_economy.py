@@ -3,6 +3,7 @@
 import pytest
 
 from simulator.core.economy import (
+    PackThresholdTracker,
     cumulative_pack_cost,
     pack_cost,
     time_to_pack,
@@ -71,3 +72,40 @@ def test_time_to_pack() -> None:
     time = time_to_pack(1, essence_per_second=1000.0)
     assert time == 40.0  # 40,000 / 1000
 
+
+
+def test_pack_threshold_tracker_crossings() -> None:
+    """Test analytic pack threshold crossing times."""
+    tracker = PackThresholdTracker({2: 100_000, 1: 40_000})
+
+    assert tracker.next_threshold == (40_000, 1)
+
+    # 10,000 Essence at t=0, +1,000/sec: pack 1 at t=30, pack 2 at t=90
+    assert tracker.crossing_time(0.0, 10_000.0, 1_000.0) == 30.0
+    assert tracker.advance(0.0, 10_000.0, 1_000.0, 20.0) == []
+    assert tracker.advance(20.0, 30_000.0, 1_000.0, 100.0) == [
+        (1, 40_000, 30.0),
+        (2, 100_000, 90.0),
+    ]
+    assert tracker.first_reached == {1: 30.0, 2: 90.0}
+    assert tracker.next_threshold is None
+
+    # Already-reached thresholds are never reported again
+    assert tracker.advance(100.0, 500_000.0, 1_000.0, 200.0) == []
+
+
+def test_pack_threshold_tracker_burst_and_zero_rate() -> None:
+    """Test crossings from burst essence and with no generation."""
+    tracker = PackThresholdTracker.from_config(
+        {"pack_costs": {"Arcane_Pack": {"1": 40_000, "2": 100_000}}}
+    )
+
+    # No generation: never reached
+    assert tracker.crossing_time(5.0, 0.0, 0.0) is None
+
+    # Burst already past a cost: reached immediately
+    assert tracker.advance(12.0, 45_000.0, 0.0, 12.0) == [(1, 40_000, 12.0)]
+
+    tracker.reset()
+    assert tracker.first_reached == {}
+    assert tracker.next_threshold == (40_000, 1)
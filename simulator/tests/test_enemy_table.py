@@ -0,0 +1,55 @@
+"""Tests for the precomputed enemy stat table."""
+
+import copy
+
+import pytest
+
+from simulator.core.combat import BALANCE_CONFIG, Enemy
+from simulator.core.enemy_table import EnemyTable, parse_linear_formula
+
+
+def test_parse_linear_formula() -> None:
+    """Test config formula strings are parsed into (base, start, growth)."""
+    assert parse_linear_formula("20 + (n - 1) * 120") == (20.0, 1, 120.0)
+    assert parse_linear_formula("3.75 + (n - 101) * 0.06") == (3.75, 101, 0.06)
+
+    with pytest.raises(ValueError, match="Unsupported enemy formula"):
+        parse_linear_formula("20 * 1.1 ** n")
+
+
+def test_table_follows_config_formulas() -> None:
+    """Test act boundaries, boss multipliers and act 4 values come from config."""
+    table = EnemyTable(BALANCE_CONFIG)
+
+    assert table.stats(1) == (20.0, 1.0, 0.5, False)
+    assert table.stats(51)[0] == 6000.0
+    assert table.stats(50) == (7670.0, 6.9, 3.45, True)  # 5900 HP x 1.3, 2x per-tick rates
+
+    # Act 4 per-tick scaling is read from balance-config.json
+    health, atk, defense, is_boss = table.stats(152)
+    assert health == 38880 + 200
+    assert atk == pytest.approx(13.5 + 0.15)
+    assert defense == pytest.approx(6.75 + 0.075)
+    assert not is_boss
+
+
+def test_table_extends_lazily() -> None:
+    """Test enemies past the precomputed range are added on demand."""
+    table = EnemyTable(BALANCE_CONFIG, size=10)
+    assert table.size == 10
+
+    health, _, _, is_boss = table.stats(1200)
+    assert table.size >= 1200
+    assert is_boss
+    assert health == (38880 + (1200 - 151) * 200) * 2.0  # Default boss multiplier
+    assert table.max_health[:11].tolist() == EnemyTable(BALANCE_CONFIG).max_health[:11].tolist()
+
+
+def test_table_uses_edited_config() -> None:
+    """Test a changed formula string changes spawned stats (no hard-coded formulas)."""
+    config = copy.deepcopy(BALANCE_CONFIG)
+    config["enemy_scaling"]["hp_formulas"]["act_1"]["formula"] = "100 + (n - 1) * 10"
+    table = EnemyTable(config)
+
+    assert table.stats(3)[0] == 120.0
+    assert Enemy.spawn(3).max_health == 260.0  # Default config untouched
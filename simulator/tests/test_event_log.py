@@ -0,0 +1,62 @@
+"""Tests for the columnar simulation event log."""
+
+import numpy as np
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.core.event_log import EVENT_TYPE_CODES, EventLog, as_event_log
+
+
+def _simulate(seed: int = 5) -> dict:
+    """Run a short seeded simulation with full recording."""
+    deck = starter_deck()
+    return CombatSimulator(seed=seed).simulate(duration_minutes=3.0, deck=deck, engine="event")
+
+
+def test_simulation_returns_event_log() -> None:
+    """Test results carry a columnar log with results-format rows."""
+    events = _simulate()["events"]
+
+    assert isinstance(events, EventLog)
+    assert len(events) > 0
+
+    first = events[0]
+    assert set(first) == {"time", "time_minutes", "type", "data"}
+    assert first["time_minutes"] == first["time"] / 60
+
+    draw = next(events.rows("draw"))
+    assert {"card_id", "card_name", "attack", "defense", "player_attack"} <= set(draw["data"])
+
+
+def test_columns_are_views() -> None:
+    """Test dict-of-arrays access and type filtering."""
+    events = _simulate()["events"]
+    columns = events.columns()
+
+    assert len(columns["time"]) == len(events)
+    assert np.all(np.diff(columns["time"]) >= 0)
+
+    victories = events.indices("victory")
+    assert np.all(events.type_codes[victories] == EVENT_TYPE_CODES["victory"])
+    assert [e["type"] for e in events.rows("victory")] == ["victory"] * len(victories)
+
+
+def test_round_trip_through_dicts() -> None:
+    """Test rebuilding a log from dicts reproduces every row."""
+    events = _simulate()["events"]
+    rebuilt = EventLog.from_dicts(events.to_dicts())
+
+    assert rebuilt.to_dicts() == events.to_dicts()
+    assert as_event_log(events) is events
+    assert len(as_event_log([])) == 0
+
+
+def test_log_grows_past_capacity() -> None:
+    """Test appends beyond the initial capacity keep earlier rows intact."""
+    events = EventLog(capacity=2)
+    for i in range(10):
+        events.add_reshuffle(float(i), deck_size=8, cooldown=5.0)
+
+    assert len(events) == 10
+    assert events.times.tolist() == [float(i) for i in range(10)]
+    assert events[-1]["data"] == {"deck_size": 8, "cooldown": 5.0}
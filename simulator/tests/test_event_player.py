@@ -0,0 +1,153 @@
+"""Tests for asyncio event playback and live viewer key handling."""
+
+import asyncio
+import time
+
+import pytest
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.core.event_log import EventLog
+from simulator.core.event_stream import EventStream
+from simulator.visualization.event_player import (
+    EventPlayer,
+    PlaybackState,
+    format_speed,
+    parse_speed,
+)
+from simulator.visualization.live_viewer import LiveViewer, split_keys
+from simulator.visualization.viewer_state import ViewerStateReducer
+
+
+def _log(times: list[float]) -> EventLog:
+    """Build a log of reshuffle events at the given times."""
+    log = EventLog()
+    for event_time in times:
+        log.add_reshuffle(event_time, 8, 2.0)
+    return log
+
+
+def test_events_play_at_their_deadlines() -> None:
+    """Test each event is delivered once its time is reached, then playback completes."""
+    played: list[tuple[float, float]] = []
+    player = EventPlayer(
+        _log([0.0, 1.0, 2.0]),
+        on_event=lambda event: played.append((event["time"], player.current_sim_time)),
+        on_complete=lambda: None,
+        initial_speed=10,
+    )
+
+    start = time.monotonic()
+    asyncio.run(player.run())
+    elapsed = time.monotonic() - start
+
+    assert player.state == PlaybackState.COMPLETED
+    assert [event_time for event_time, _ in played] == [0.0, 1.0, 2.0]
+    assert all(0 <= now - event_time < 0.5 for event_time, now in played)
+    assert 0.15 < elapsed < 0.5  # 2 simulated seconds at 10x
+
+
+def test_controls_wake_playback() -> None:
+    """Test a sleeping player reacts to pause, step and seek without waiting for a deadline."""
+    played: list[float] = []
+    player = EventPlayer(
+        _log([0.0, 100.0, 200.0, 300.0]),
+        on_event=lambda event: played.append(event["time"]),
+        on_complete=lambda: None,
+    )
+
+    async def drive() -> None:
+        task = asyncio.create_task(player.run())
+        await asyncio.sleep(0.05)
+        player.pause()
+        player.step_forward()
+        await asyncio.sleep(0.05)
+        assert played == [0.0, 100.0]
+        assert player.current_sim_time == 100.0
+
+        player.seek(250.0)
+        player.resume()
+        player.stop()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    asyncio.run(drive())
+    assert player.state == PlaybackState.STOPPED
+    assert player.event_index == 3
+
+
+def test_split_keys_keeps_escape_sequences() -> None:
+    """Test arrow keys read in one chunk stay one key."""
+    assert split_keys("n\x1b[C ,q") == ["n", "\x1b[C", " ", ",", "q"]
+    assert split_keys("\x1b") == ["\x1b"]
+
+
+def test_searching_ahead_keeps_the_loop_running() -> None:
+    """Test a jump to an enemy the run never reaches streams the run without blocking frames."""
+    viewer = LiveViewer(duration_minutes=240.0)
+    deck = starter_deck()
+    stream = EventStream(CombatSimulator(seed=1), 240.0, deck, max_batches=4).start()
+    stream.poll(timeout=None)
+    viewer.stream, viewer.events = stream, stream.events
+    viewer.reducer = ViewerStateReducer(stream.events, complete_time=stream.complete_time)
+    viewer.event_player = EventPlayer(
+        stream.events, on_event=lambda event: None, on_complete=lambda: None, stream=stream
+    )
+
+    async def drive() -> int:
+        for key in "g999\r":
+            viewer._handle_keypress(key)
+        assert viewer.display.prompt == "Searching for enemy 999..."
+        frames = 0
+        while viewer._search is not None:
+            frames += 1
+            await asyncio.sleep(0.001)
+
+        viewer._handle_keypress("d")  # Everything is received now: found at once
+        await asyncio.sleep(0)
+        return frames
+
+    try:
+        frames = asyncio.run(drive())
+    finally:
+        stream.close()
+    assert stream.finished
+    assert frames > 10
+    assert viewer.display.prompt is None
+    assert viewer.event_player.current_sim_time == pytest.approx(
+        viewer.reducer.next_death_time(0.0), abs=0.01
+    )
+
+
+def test_high_speed_coalesces_events() -> None:
+    """Test only the last events of each step reach on_event, but milestones always do."""
+    log = _log([float(t) for t in range(1000)])
+    log.add_pack_affordable(1000.0, 1, 100, 100.0)
+    for event_time in range(1001, 2000):
+        log.add_reshuffle(float(event_time), 8, 2.0)
+
+    played: list[dict] = []
+    player = EventPlayer(
+        log,
+        on_event=played.append,
+        on_complete=lambda: None,
+        initial_speed=parse_speed("max"),
+        max_events_per_step=5,
+        milestones=("pack_affordable",),
+    )
+    asyncio.run(player.run())
+
+    assert player.state == PlaybackState.COMPLETED
+    assert [event["time"] for event in played] == [996.0, 997.0, 998.0, 999.0, 1000.0] + [
+        1995.0, 1996.0, 1997.0, 1998.0, 1999.0
+    ]
+
+
+def test_parse_speed() -> None:
+    """Test speeds are any positive number or "max"."""
+    assert parse_speed("250") == 250.0
+    assert parse_speed("MAX") == float("inf")
+    assert format_speed(parse_speed("max")) == "max"
+    assert format_speed(2.5) == "2.5x"
+    for bad in ["0", "-3", "fast"]:
+        with pytest.raises(ValueError, match="Invalid speed"):
+            parse_speed(bad)
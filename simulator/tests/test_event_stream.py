@@ -0,0 +1,77 @@
+"""Tests for streaming simulation events through a bounded queue."""
+
+import time
+
+import numpy as np
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.core.event_stream import EventStream
+from simulator.visualization.viewer_state import ViewerStateReducer
+
+
+def test_stream_matches_full_run() -> None:
+    """Test streamed batches add up to the events and results of a normal run."""
+    for engine in ("stepped", "event"):
+        expected = CombatSimulator(seed=5).simulate(
+            duration_minutes=20.0, deck=starter_deck(), engine=engine
+        )
+        stream = EventStream(CombatSimulator(seed=5), 20.0, starter_deck(), engine=engine).start()
+        results = stream.wait()
+
+        assert stream.finished
+        assert stream.error is None
+        assert results["final_essence"] == expected["final_essence"]
+        assert results["events"] is stream.events
+        assert stream.events.to_dicts() == expected["events"].to_dicts()
+
+
+def test_batches_cover_everything_before_complete_time() -> None:
+    """Test each handover contains every event before its time."""
+    expected = CombatSimulator(seed=2).simulate(
+        duration_minutes=10.0, deck=starter_deck(), engine="event"
+    )
+    handovers = []
+    CombatSimulator(seed=2).simulate(
+        duration_minutes=10.0,
+        deck=starter_deck(),
+        engine="event",
+        event_sink=lambda batch, until: handovers.append((len(batch), until)),
+        sink_interval=7.0,
+    )
+
+    delivered = np.cumsum([count for count, _ in handovers])
+    for count, (_, until) in zip(delivered, handovers, strict=True):
+        assert count >= np.searchsorted(expected["events"].times, until, side="left")
+    assert delivered[-1] == len(expected["events"])
+
+
+def test_producer_blocks_when_queue_is_full() -> None:
+    """Test the simulation waits for the consumer (backpressure)."""
+    simulator = CombatSimulator(seed=1)
+    stream = EventStream(simulator, 240.0, starter_deck(), batch_seconds=5.0, max_batches=2).start()
+    try:
+        time.sleep(0.2)
+        assert simulator.current_time <= 4 * 5.0  # Queued batches + the one being recorded
+
+        assert stream.poll(timeout=1.0)
+        assert stream.complete_time > 0.0
+        assert len(stream.events) > 0
+    finally:
+        stream.close()
+
+
+def test_keyframes_extend_as_events_arrive() -> None:
+    """Test keyframes built while streaming match keyframes built at once."""
+    stream = EventStream(CombatSimulator(seed=3), 30.0, starter_deck(), engine="event").start()
+    stream.poll(timeout=None)
+    reducer = ViewerStateReducer(stream.events, complete_time=stream.complete_time)
+    reducer.advance(3.0)
+    while not stream.finished:
+        stream.poll(timeout=None)
+        reducer.extend_keyframes(None if stream.finished else stream.complete_time)
+    assert reducer.state.time == 3.0  # Playback state untouched
+
+    full = ViewerStateReducer(stream.events)
+    assert reducer._keyframe_times == full._keyframe_times
+    assert reducer._keyframes == full._keyframes
@@ -0,0 +1,81 @@
+"""Tests for the closed-form fight resolver and the resolved engine."""
+
+import pytest
+
+from simulator.core.cards import STARTER_DECK_CARDS
+from simulator.core.combat import CombatSimulator, Enemy
+from simulator.core.deck import Deck, starter_deck
+from simulator.core.fight import resolve_fight
+
+
+def _tick_by_tick(draw_order: list, enemy: Enemy, player_hp: float) -> tuple:
+    """Reference fight: apply the combat tick rules one tick at a time."""
+    attack = defense = 0
+    enemy_hp = enemy.current_health
+    for tick, card in enumerate(draw_order, start=1):
+        if card is not None:
+            attack += card.attack
+            defense += card.defense
+        elapsed = enemy.combat_ticks_elapsed + tick
+        enemy_hp = max(0, enemy_hp - max(attack - enemy.def_per_tick * elapsed, 0))
+        player_hp = max(0, player_hp - max(enemy.atk_per_tick * elapsed - defense, 0))
+        if enemy_hp <= 0:
+            return "victory", tick, player_hp, enemy_hp
+        if player_hp <= 0:
+            return "death", tick, player_hp, enemy_hp
+    return None, len(draw_order), player_hp, enemy_hp
+
+
+@pytest.mark.parametrize("enemy_number", [1, 10, 50, 120])
+def test_resolve_fight_matches_tick_loop(enemy_number: int) -> None:
+    """Test outcome tick, HP and draw position against a tick-by-tick fight."""
+    cards = STARTER_DECK_CARDS
+    # Three passes over the deck with a reshuffle gap (no draw) between them
+    draw_order = (cards + [None] * 5) * 3
+
+    enemy = Enemy.spawn(enemy_number)
+    resolution = resolve_fight(draw_order, 2, enemy, player_hp=100.0)
+    outcome, ticks, player_hp, enemy_hp = _tick_by_tick(draw_order[2:], enemy, 100.0)
+
+    assert resolution.outcome == outcome
+    assert resolution.ticks == ticks
+    assert resolution.draw_index == 2 + ticks
+    assert resolution.player_hp == player_hp
+    assert resolution.enemy_hp == enemy_hp
+    assert resolution.enemy_ticks == ticks
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_resolved_engine_matches_event_engine(seed: int) -> None:
+    """Test jumping over fights changes nothing but the per-tick events."""
+    # A defensive deck makes long fights (and the starter deck some deaths);
+    # snapshots every 2.5s fall both on and between ticks
+    decks = [
+        starter_deck(),
+        Deck(
+            name="Wall",
+            cards=[STARTER_DECK_CARDS[4]] * 5 + STARTER_DECK_CARDS[:2] + [STARTER_DECK_CARDS[7]],
+            tier="arcane",
+        ),
+    ]
+    for deck in decks:
+        results = [
+            CombatSimulator(record_level="milestones", seed=seed).simulate(
+                duration_minutes=20.0, deck=deck, engine=engine, state_recording_interval=2.5
+            )
+            for engine in ("event", "resolved")
+        ]
+        event, resolved = [
+            {key: value for key, value in r.items() if key not in ("events", "loop_iterations")}
+            for r in results
+        ]
+        assert resolved == event
+        assert results[1]["events"].to_dicts() == results[0]["events"].to_dicts()
+
+
+def test_resolved_engine_rejects_per_tick_recording() -> None:
+    """Test the resolved engine refuses record levels it cannot honour."""
+    deck = starter_deck()
+
+    with pytest.raises(ValueError, match="resolved"):
+        CombatSimulator(seed=0).simulate(duration_minutes=1.0, deck=deck, engine="resolved")
@@ -0,0 +1,81 @@
+"""Tests for the per-fight record table."""
+
+import numpy as np
+import pytest
+
+from simulator.analysis.montecarlo import run_monte_carlo
+from simulator.core.combat import CombatSimulator, RecordLevel
+from simulator.core.deck import starter_deck
+from simulator.core.event_log import COMBAT_TICK
+from simulator.core.fight_log import FightLog
+
+DECK = starter_deck()
+
+
+def test_fight_log_matches_run_totals() -> None:
+    """Test fight rows add up to the run's totals and agree between engines."""
+    logs = {}
+    for engine in ("event", "resolved"):
+        results = CombatSimulator(seed=3, record_level="off").simulate(
+            duration_minutes=40.0, deck=DECK, engine=engine
+        )
+        fights = results["fights"]
+        assert len(fights) == results["enemies_encountered"]
+        assert len(fights.indices("victory")) == results["enemies_defeated"]
+        assert len(fights.indices("death")) == results["player_deaths"] > 0
+        assert fights.column("damage_dealt").sum() == pytest.approx(results["total_damage_dealt"])
+        assert fights.column("damage_taken").sum() == pytest.approx(results["total_damage_taken"])
+        assert fights.column("ticks").sum() == results["combat_ticks"]
+        won = np.zeros(len(fights), dtype=bool)
+        won[fights.indices("victory")] = True
+        overkill = fights.column("overkill")
+        assert (overkill[~won] == 0).all()
+        assert (overkill[won] >= 0).all()
+        assert overkill.max() > 0
+        logs[engine] = fights
+
+    assert logs["event"] == logs["resolved"]
+
+
+def test_fight_log_from_events_matches_recorded() -> None:
+    """Test rebuilding the table from a trace with combat ticks gives the same rows."""
+    results = CombatSimulator(seed=5, record_level=RecordLevel.FIGHTS).simulate(
+        duration_minutes=30.0, deck=DECK, engine="event"
+    )
+    rebuilt = FightLog.from_events(results["events"], results["duration_seconds"])
+    for name, column in results["fights"].columns().items():
+        assert np.allclose(rebuilt.column(name), column), name
+
+    # Overkill is the killing tick's damage beyond the HP the enemy had left
+    fights = results["fights"]
+    events = results["events"].columns()
+    ticks = np.flatnonzero(results["events"].type_codes == COMBAT_TICK)
+    for row in fights.indices("victory"):
+        fight_ticks = ticks[
+            (events["time"][ticks] >= fights.column("spawn_time")[row])
+            & (events["time"][ticks] <= fights.column("end_time")[row])
+        ]
+        hp_left = (
+            events["enemy_hp"][fight_ticks[-2]]
+            if len(fight_ticks) > 1
+            else fights.column("enemy_max_hp")[row]
+        )
+        damage = events["player_damage"][fight_ticks[-1]]
+        assert fights.column("overkill")[row] == pytest.approx(damage - hp_left)
+    assert fights.column("overkill")[fights.indices("victory")].max() > 0
+
+
+def test_monte_carlo_joins_fight_logs() -> None:
+    """Test per-run fight logs are joined with their run index."""
+    report = run_monte_carlo(runs=4, workers=1, seed=2, duration_minutes=5.0, record_fights=True)
+    fights = report["fights"]
+
+    assert "fights" not in report["runs"][0]
+    assert sorted(set(fights.column("run").tolist())) == [0, 1, 2, 3]
+    assert len(fights.indices("victory")) == sum(run["enemies_defeated"] for run in report["runs"])
+    durations = fights.mean_by_enemy(fights.durations, outcome="victory")
+    assert durations[1] > 0
+    assert fights.to_records()["enemy_number"].tolist() == fights.column("enemy_number").tolist()
+
+    with pytest.raises(ValueError, match="does not record per-fight rows"):
+        run_monte_carlo(runs=2, workers=1, engine="batch", record_fights=True)
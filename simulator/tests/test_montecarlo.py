@@ -0,0 +1,58 @@
+"""Tests for the Monte Carlo runner."""
+
+import math
+
+import pytest
+
+from simulator.analysis.montecarlo import run_monte_carlo, summarize_runs
+
+
+def test_monte_carlo_is_independent_of_sharding() -> None:
+    """Test per-run results depend only on the seed, not on workers or chunks."""
+    serial = run_monte_carlo(runs=6, workers=1, seed=4, duration_minutes=3.0, chunk_size=6)
+    sharded = run_monte_carlo(runs=6, workers=2, seed=4, duration_minutes=3.0, chunk_size=2)
+
+    assert [r["run_index"] for r in sharded["runs"]] == list(range(6))
+    assert sharded["runs"] == serial["runs"]
+    assert sharded["stats"] == serial["stats"]
+
+
+def test_monte_carlo_stats() -> None:
+    """Test aggregate statistics cover every reported metric."""
+    report = run_monte_carlo(runs=20, workers=1, seed=0, duration_minutes=8.0, engine="batch")
+    stats = report["stats"]
+
+    for key in ["enemies_defeated", "player_deaths", "furthest_enemy", "final_essence", "pack_1"]:
+        assert stats[key]["p5"] <= stats[key]["p50"] <= stats[key]["p95"]
+    assert stats["pack_1"]["reached"] == 1.0
+
+
+def test_summarize_runs_unreached_pack() -> None:
+    """Test packs reached by only some runs report their reach fraction."""
+    summaries = [
+        {
+            "final_essence": 10.0,
+            "enemies_defeated": 1,
+            "player_deaths": 0,
+            "furthest_enemy": 2,
+            "pack_affordable_times": {1: 5.0},
+        },
+        {
+            "final_essence": 20.0,
+            "enemies_defeated": 3,
+            "player_deaths": 1,
+            "furthest_enemy": 4,
+            "pack_affordable_times": {},
+        },
+    ]
+    stats = summarize_runs(summaries)
+
+    assert stats["enemies_defeated"]["mean"] == 2.0
+    assert stats["pack_1"] == {"mean": 5.0, "p5": 5.0, "p50": 5.0, "p95": 5.0, "reached": 0.5}
+    assert not math.isnan(stats["final_essence"]["p95"])
+
+
+def test_monte_carlo_rejects_unknown_engine() -> None:
+    """Test engine validation."""
+    with pytest.raises(ValueError, match="Unknown engine"):
+        run_monte_carlo(runs=1, workers=1, engine="warp")
@@ -0,0 +1,59 @@
+"""Tests for the simulation results object."""
+
+import pytest
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.core.results import RESULT_KEYS, SimulationResult
+
+DECK = starter_deck()
+
+
+def _run(**kwargs: object) -> SimulationResult:
+    """Seeded 20 minute run with milestone events."""
+    return CombatSimulator(seed=4, record_level="milestones").simulate(
+        duration_minutes=20.0, deck=DECK, engine="event", **kwargs
+    )
+
+
+def test_result_reads_like_results_dict() -> None:
+    """Test attributes and mapping access agree and cover every results key."""
+    results = _run()
+
+    assert list(results) == list(RESULT_KEYS)
+    assert results["final_essence"] == results.final_essence > 0
+    assert results["duration_seconds"] == 1200.0
+    assert results.get("seed") == results.seed
+    assert results.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        results["missing"]
+
+    # Tables are the simulator's own objects, not copies
+    assert results["events"] is results.events
+    assert dict(results)["state_history"] is results.state_history
+
+
+def test_combat_stats_derive_from_fights() -> None:
+    """Test combat duration stats are computed from the won fights."""
+    results = _run()
+    fights = results.fights
+    won = fights.indices("victory")
+
+    assert results.combat_count == len(won) == results.enemies_defeated
+    assert results.total_combat_time == pytest.approx(fights.durations[won].sum())
+    assert results.avg_combat_duration == pytest.approx(
+        results.total_combat_time / results.combat_count
+    )
+
+
+def test_to_dict_materializes_tables() -> None:
+    """Test to_dict gives plain lists of event and state dicts."""
+    results = _run()
+    plain = results.to_dict()
+
+    assert list(plain) == list(RESULT_KEYS)
+    assert plain["events"] == results.events.to_dicts()
+    assert plain["state_history"] == list(results.state_history)
+    assert plain["state_history"][0]["time"] == 0.0
+    assert plain["record_level"] == "milestones"
+    assert _run().to_dict() == plain  # Same seed, same results
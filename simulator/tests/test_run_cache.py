@@ -0,0 +1,77 @@
+"""Tests for the on-disk run cache."""
+
+import copy
+import os
+from pathlib import Path
+
+from simulator.core.balance_config import BalanceConfig, default_balance_config
+from simulator.core.cards import STARTER_DECK_CARDS
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import Deck, starter_deck
+from simulator.core.run_cache import RunCache, run_key
+
+DECK = starter_deck()
+
+
+def test_cached_run_matches_simulated_run(tmp_path: Path) -> None:
+    """Test a cache hit returns the same results as simulating, on every engine."""
+    cache = RunCache(tmp_path)
+    for engine, record_level in (
+        ("stepped", "full"),
+        ("event", "fights"),
+        ("resolved", "milestones"),
+    ):
+        sim = CombatSimulator(seed=8, record_level=record_level, cache=cache)
+        simulated = sim.simulate(duration_minutes=10.0, deck=DECK, engine=engine)
+        cached = sim.simulate(duration_minutes=10.0, deck=DECK, engine=engine)
+
+        assert cached is not simulated
+        assert cached.to_dict() == simulated.to_dict()
+        assert cached.events.columns().keys() == simulated.events.columns().keys()
+
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert len(cache) == 3
+    assert not list(tmp_path.glob(".tmp-*"))  # Temporary files were renamed
+
+
+def test_key_covers_run_inputs(tmp_path: Path) -> None:
+    """Test the key changes with the deck order, config, seed and options."""
+    config = default_balance_config()
+    key = run_key(DECK, config, seed=1, duration_minutes=30.0)
+    assert run_key(DECK, config, duration_minutes=30.0, seed=1) == key
+
+    data = copy.deepcopy(config.data)
+    reordered = Deck(name="Other Name", cards=STARTER_DECK_CARDS[::-1], tier="arcane")
+    variant = copy.deepcopy(data)
+    variant["player_stats"]["starting_hp"] = 500
+    assert run_key(DECK, BalanceConfig(data), seed=1, duration_minutes=30.0) == key
+    assert run_key(reordered, config, seed=1, duration_minutes=30.0) != key
+    assert run_key(DECK, BalanceConfig(variant), seed=1, duration_minutes=30.0) != key
+    assert run_key(DECK, config, seed=2, duration_minutes=30.0) != key
+    assert run_key(DECK, config, seed=1, duration_minutes=30.0, engine="event") != key
+
+    # Unseeded runs are never cached
+    cache = RunCache(tmp_path)
+    CombatSimulator(record_level="off", cache=cache).simulate(duration_minutes=1.0, deck=DECK)
+    assert len(cache) == 0
+
+
+def test_eviction_drops_least_recently_used(tmp_path: Path) -> None:
+    """Test the cache is trimmed to max_bytes, oldest reads first, and survives bad entries."""
+    cache = RunCache(tmp_path)
+    sim = CombatSimulator(record_level="off", cache=cache)
+    keys = []
+    for seed in range(3):
+        sim.simulate(duration_minutes=5.0, deck=DECK, engine="event", seed=seed)
+        keys.append(next(iter({path.stem for path in tmp_path.glob("*.npz")} - set(keys))))
+        os.utime(cache.path(keys[-1]), (seed, seed))  # Distinct, increasing access times
+
+    assert cache.get(keys[0]) is not None  # Now the most recently used
+    cache.max_bytes = cache.nbytes - 1
+    assert cache.evict() == 1
+    assert not cache.path(keys[1]).exists()
+    assert cache.path(keys[0]).exists()
+    assert cache.path(keys[2]).exists()
+
+    cache.path(keys[2]).write_bytes(b"not an archive")
+    assert cache.get(keys[2]) is None
@@ -0,0 +1,61 @@
+"""Tests for the balance solver."""
+
+import pytest
+
+from simulator.analysis.montecarlo import run_monte_carlo
+from simulator.analysis.solve import run_solve, solve_targets
+from simulator.core.balance_config import default_balance_config
+
+PACK_1_COST = "pack_costs.Arcane_Pack.1"
+
+
+def test_targets_come_from_validator_and_brackets_are_checked() -> None:
+    """Test metrics map to baseline targets, and a bracket must straddle its target."""
+    targets = solve_targets()
+    assert targets["pack_1"].expected == 7.0
+    assert targets["enemy_50"].expected == 23.0
+    assert targets["defeat_rate"].unit == "enemies/min"
+
+    # Enemy 50 is past the horizon either way (censored at 2 x 23 min)
+    with pytest.raises(ValueError, match="does not straddle"):
+        run_solve("enemy_50", "player_stats.starting_hp", 90, 110, runs=4, workers=1)
+    with pytest.raises(KeyError, match="pack_costs.Arcane_Pack.9"):
+        run_solve("pack_1", "pack_costs.Arcane_Pack.9", 1, 2, workers=1)
+    with pytest.raises(ValueError, match="tolerance must be positive"):
+        run_solve("pack_1", PACK_1_COST, 1, 2, tolerance=0.0, workers=1)
+    with pytest.raises(ValueError, match="tolerance must be positive"):
+        run_solve("defeat_rate", "player_stats.starting_hp", 1, 2, target=0.0, workers=1)
+
+
+def test_solution_reproduces_with_monte_carlo() -> None:
+    """Test the solved value hits the target on the same seeds outside the solver."""
+    report = run_solve("pack_1", PACK_1_COST, 20_000, 80_000, runs=8, workers=1, seed=5)
+
+    assert report["converged"]
+    assert report["reason"] == "tolerance"
+    assert abs(report["mean"] - 7.0) + report["half_width"] <= report["tolerance"]
+    assert report["evaluations"][0]["value"] == 20_000
+    assert report["simulated"] == sum(e["runs"] for e in report["evaluations"])
+
+    config = default_balance_config().with_overrides({PACK_1_COST: report["value"]})
+    check = run_monte_carlo(
+        runs=report["runs"],
+        workers=1,
+        seed=5,
+        duration_minutes=report["duration_minutes"],
+        config=config,
+    )
+    assert check["stats"]["pack_1"]["mean"] == pytest.approx(report["mean"])
+
+
+def test_methods_and_workers_share_seeds() -> None:
+    """Test Brent beats bisection here, and evaluations do not depend on workers."""
+    brent = run_solve("pack_1", PACK_1_COST, 20_000, 80_000, runs=8, workers=1)
+    bisect = run_solve("pack_1", PACK_1_COST, 20_000, 80_000, runs=8, workers=1, method="bisect")
+    sharded = run_solve("pack_1", PACK_1_COST, 20_000, 80_000, runs=8, workers=2)
+
+    assert bisect["converged"]
+    assert len(brent["evaluations"]) < len(bisect["evaluations"])
+    # Both methods evaluate the bracket ends first, on the same seeds
+    assert bisect["evaluations"][:2] == brent["evaluations"][:2]
+    assert sharded["evaluations"] == brent["evaluations"]
@@ -0,0 +1,87 @@
+"""Tests for the bounded state history."""
+
+from itertools import pairwise
+
+import pytest
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.core.state_history import ADAPTIVE_STATE_TOLERANCES, StateHistory
+
+DECK = starter_deck()
+
+
+def _snapshot(time: float, player_hp: float = 100.0, **fields: object) -> dict[str, object]:
+    """Keyword arguments for StateHistory.record()."""
+    snapshot: dict[str, object] = {
+        "time": time,
+        "essence": time * 2,
+        "player_hp": player_hp,
+        "player_essence_rate": 1.0,
+        "player_attack": 0,
+        "player_defense": 0,
+        "player_deaths": 0,
+        "cards_drawn": int(time),
+        "enemies_defeated": 0,
+        "in_combat": False,
+    }
+    snapshot.update(fields)
+    return snapshot
+
+
+def test_ring_buffer_keeps_newest_rows() -> None:
+    """Test a full buffer overwrites its oldest rows and stays in time order."""
+    history = StateHistory(capacity=300)
+    for second in range(1000):
+        history.record(**_snapshot(float(second)))
+
+    assert len(history) == 300
+    assert history.dropped == 700
+    assert history.offered == 1000
+    assert list(history.times) == [float(second) for second in range(700, 1000)]
+    assert history[0]["cards_drawn"] == 700
+    assert history[-1]["time_minutes"] == 999 / 60
+    assert history.nbytes == 300 * StateHistory().nbytes // 256  # Never grows past capacity
+
+
+def test_adaptive_sampling_keeps_changes() -> None:
+    """Test adaptive sampling skips flat snapshots but keeps changes and a heartbeat."""
+    history = StateHistory(tolerances={"player_hp": 5.0}, max_interval=10.0)
+    hp = 100.0
+    for second in range(60):
+        if 20 <= second < 30:
+            hp -= 10.0
+        history.record(**_snapshot(float(second), player_hp=hp))
+
+    times = list(history.times)
+    assert times[:3] == [0.0, 10.0, 20.0]
+    assert set(range(20, 30)) <= set(times)  # Every 10 HP drop is kept
+    assert all(b - a <= 10.0 for a, b in pairwise(times))
+    assert len(history) < history.offered
+    assert not history.record(**_snapshot(59.5, player_hp=hp))
+    assert history.record(**_snapshot(59.5, player_hp=hp), force=True)
+
+    # Only state columns can be tracked (not record()'s other arguments)
+    for name in ("force", "self", "player_health"):
+        with pytest.raises(ValueError, match="Unknown state fields"):
+            StateHistory(tolerances={name: 1.0})
+
+
+def test_simulator_history_is_bounded_and_engines_agree() -> None:
+    """Test the simulator's adaptive history is capped and matches between engines."""
+    histories = {}
+    for engine in ("event", "resolved"):
+        results = CombatSimulator(seed=2, record_level="off").simulate(
+            duration_minutes=30.0,
+            deck=DECK,
+            engine=engine,
+            state_capacity=500,
+            state_tolerances=ADAPTIVE_STATE_TOLERANCES,
+        )
+        history = results["state_history"]
+        assert len(history) == 500
+        assert history.dropped > 0
+        assert history[-1]["time"] == results["duration_seconds"]
+        histories[engine] = history
+
+    assert histories["event"] == histories["resolved"]
@@ -0,0 +1,101 @@
+"""Tests for balance-config parameter sweeps."""
+
+from pathlib import Path
+
+import pytest
+
+from simulator.analysis.montecarlo import run_monte_carlo
+from simulator.analysis.sweep import (
+    parse_sweep_values,
+    read_sweep_table,
+    run_sweep,
+    write_sweep_table,
+)
+from simulator.core.balance_config import default_balance_config
+
+HP_FORMULA = "enemy_scaling.hp_formulas.act_1.formula"
+
+
+def test_config_overlays_share_untouched_sections() -> None:
+    """Test overrides copy only the sections along their path."""
+    base = default_balance_config()
+    variant = base.with_overrides(
+        {"player_stats.starting_hp": 250, "enemy_scaling.hp_formulas.act_1.range.1": 40}
+    )
+
+    assert variant.starting_hp == 250.0
+    assert base.starting_hp != 250.0
+    assert variant.data["enemy_scaling"]["hp_formulas"]["act_1"]["range"] == [1, 40]
+    assert base.data["enemy_scaling"]["hp_formulas"]["act_1"]["range"] == [1, 50]
+    assert variant.data["pack_costs"] is base.data["pack_costs"]
+    assert variant.digest != base.digest
+
+    with pytest.raises(KeyError, match="enemy_scaling.hp_formula"):
+        base.with_overrides({"enemy_scaling.hp_formula.act_1": "1"})
+    assert parse_sweep_values("110,130") == [110, 130]
+    assert parse_sweep_values("20 + (n - 1) * 110,1 + n") == ["20 + (n - 1) * 110", "1 + n"]
+
+
+def test_sweep_matches_monte_carlo_per_variant() -> None:
+    """Test each variant runs the same seeds as run_monte_carlo with that config."""
+    base_formula = default_balance_config().data["enemy_scaling"]["hp_formulas"]["act_1"]
+    params = {HP_FORMULA: [base_formula["formula"], "20 + (n - 1) * 200"]}
+    serial = run_sweep(params, runs=4, workers=1, seed=3, duration_minutes=6.0)
+    sharded = run_sweep(params, runs=4, workers=2, seed=3, duration_minutes=6.0, chunk_size=1)
+
+    assert sharded["rows"] == serial["rows"]
+    assert len(serial["rows"]) == 8
+    assert serial["computed"] == 8
+    baseline = run_monte_carlo(runs=4, workers=1, seed=3, duration_minutes=6.0)
+    assert serial["stats"][0] == baseline["stats"]
+    assert (
+        serial["stats"][1]["enemies_defeated"]["mean"]
+        < serial["stats"][0]["enemies_defeated"]["mean"]
+    )
+
+
+def test_rerun_reuses_computed_cells(tmp_path: Path) -> None:
+    """Test a rerun with one more value only simulates the new variant."""
+    path = tmp_path / "sweep.csv"
+    first = run_sweep(
+        {"player_stats.starting_hp": [80, 100]}, runs=3, workers=1, duration_minutes=4.0
+    )
+    write_sweep_table(path, first["rows"])
+
+    second = run_sweep(
+        {"player_stats.starting_hp": [80, 100, 120]},
+        runs=3,
+        workers=1,
+        duration_minutes=4.0,
+        previous=read_sweep_table(path),
+    )
+    assert (second["computed"], second["reused"]) == (3, 6)
+    assert second["rows"][:6] == first["rows"]
+    assert second["stats"][:2] == first["stats"]
+
+    # Another duration changes every cell's key
+    third = run_sweep(
+        {"player_stats.starting_hp": [80]},
+        runs=3,
+        workers=1,
+        duration_minutes=5.0,
+        previous=second["rows"],
+    )
+    assert third["reused"] == 0
+
+
+def test_pack_cost_params_round_trip(tmp_path: Path) -> None:
+    """Test pack-cost parameters are not mistaken for pack-time columns."""
+    params = {"pack_costs.Arcane_Pack.1": [30_000, 50_000]}
+    first = run_sweep(params, runs=2, workers=1, duration_minutes=9.0)
+    path = write_sweep_table(tmp_path / "sweep.csv", first["rows"])
+
+    rows = read_sweep_table(path)
+    assert [row["pack_costs.Arcane_Pack.1"] for row in rows] == [30_000] * 2 + [50_000] * 2
+    assert rows == first["rows"]
+    second = run_sweep(params, runs=2, workers=1, duration_minutes=9.0, previous=rows)
+    assert (second["computed"], second["reused"]) == (0, 4)
+    assert second["stats"] == first["stats"]
+
+    with pytest.raises(ValueError, match="seed"):
+        run_sweep({"seed": [1, 2]}, runs=1, workers=1)
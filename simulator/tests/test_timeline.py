@@ -0,0 +1,69 @@
+"""Tests for the indexed simulation timeline."""
+
+import numpy as np
+
+from simulator.analysis.timeline import SimulationTimeline
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+
+
+def _timeline(seed: int = 3) -> SimulationTimeline:
+    """Timeline of a seeded 30-minute run (includes deaths)."""
+    deck = starter_deck()
+    return SimulationTimeline(CombatSimulator(seed=seed).simulate(duration_minutes=30.0, deck=deck))
+
+
+def test_state_lookups_match_linear_scan() -> None:
+    """Test state_at / nearest_state agree with scanning the state history."""
+    timeline = _timeline()
+    history = timeline.state_history
+    for time in np.arange(-5.0, 1900.0, 7.3):
+        before = [s for s in history if s["time"] <= time]
+        assert timeline.state_at(time) == (before[-1] if before else None)
+        assert timeline.nearest_state(time) == min(history, key=lambda s: abs(s["time"] - time))
+
+
+def test_events_between_filters_by_time_and_type() -> None:
+    """Test window queries return exactly the rows in [start, end)."""
+    timeline = _timeline()
+    events = timeline.events
+    rows = timeline.indices_between(300.0, 600.0, "victory", "death")
+    expected = [
+        i for i, event in enumerate(events)
+        if 300.0 <= event["time"] < 600.0 and event["type"] in ("victory", "death")
+    ]
+    assert rows.tolist() == expected
+    assert len(timeline.indices_between(300.0, 600.0)) == sum(
+        1 for event in events if 300.0 <= event["time"] < 600.0
+    )
+    assert [e["type"] for e in timeline.events_between(0.0, 1e9, "death")] == ["death"] * len(
+        timeline.indices("death")
+    )
+
+
+def test_fights_pair_spawns_with_outcomes() -> None:
+    """Test each fight runs from its spawn to the next victory or death."""
+    timeline = _timeline()
+    events = list(timeline.events.rows("enemy_spawn", "victory", "death"))
+    assert timeline.results["player_deaths"] > 0
+
+    spawns = [e for e in events if e["type"] == "enemy_spawn" and e["data"]["enemy_number"] == 5]
+    first_spawn = spawns[0]
+    assert timeline.first_time_reaching_enemy(5) == first_spawn["time"]
+    assert timeline.first_time_reaching_enemy(10_000) is None
+
+    fights = [fight for n in range(1, 100) for fight in timeline.fights(n)]
+    assert len(fights) == timeline.fight_count
+    deaths = [fight for fight in fights if fight.outcome == "death"]
+    assert len(deaths) == timeline.results["player_deaths"]
+
+    fight = timeline.fight(5)
+    victory = next(
+        e for e in events
+        if e["type"] == "victory" and e["data"]["enemy_number"] == 5
+    )
+    assert fight.outcome == "victory"
+    assert fight.end_time == victory["time"]
+    assert fight.combat_duration == victory["data"]["combat_duration"]
+    assert fight.max_health == first_spawn["data"]["max_health"]
+    assert timeline.fight(5, occurrence=-1) == timeline.fights(5)[-1]
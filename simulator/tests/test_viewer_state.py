@@ -0,0 +1,77 @@
+"""Tests for the incremental live viewer state reducer."""
+
+import numpy as np
+import pytest
+
+from simulator.core.combat import CombatSimulator
+from simulator.core.deck import starter_deck
+from simulator.visualization.viewer_state import ViewerStateReducer
+
+
+def _simulate(seed: int = 3) -> dict:
+    """Run a seeded simulation with full recording (includes deaths)."""
+    deck = starter_deck()
+    return CombatSimulator(seed=seed).simulate(duration_minutes=30.0, deck=deck, engine="event")
+
+
+def test_reducer_matches_simulation_state() -> None:
+    """Test essence and rate agree with the simulator's own snapshots."""
+    results = _simulate()
+    reducer = ViewerStateReducer(results["events"])
+    assert results["player_deaths"] > 0  # Rate resets are exercised
+
+    for snapshot in results["state_history"]:
+        state = reducer.advance(snapshot["time"])
+        assert state.essence == snapshot["essence"]
+        assert state.essence_rate == snapshot["player_essence_rate"]
+        assert state.player_hp == snapshot["player_hp"]
+
+
+def test_frames_apply_only_new_events() -> None:
+    """Test many small steps end in the same state as one jump."""
+    events = _simulate()["events"]
+    stepped = ViewerStateReducer(events)
+    for time in np.arange(0.0, 900.0, 0.35):
+        stepped.advance(float(time))
+        assert stepped.cursor == np.searchsorted(events.times, time, side="right")
+
+    jumped = ViewerStateReducer(events).advance(stepped.state.time)
+    assert stepped.state == jumped
+
+
+def test_rewind_replays_from_start() -> None:
+    """Test moving playback backwards gives the state at the earlier time."""
+    events = _simulate()["events"]
+    reducer = ViewerStateReducer(events)
+    reducer.advance(1500.0)
+
+    rewound = reducer.advance(200.0).display_kwargs()
+    assert rewound == ViewerStateReducer(events).advance(200.0).display_kwargs()
+
+
+def test_keyframe_seek_matches_full_replay() -> None:
+    """Test seeking through keyframes gives the same state as replaying from the start."""
+    events = _simulate()["events"]
+    reducer = ViewerStateReducer(events, keyframe_interval=60.0)
+    assert len(reducer._keyframes) == int(np.ceil(events.times[-1] / 60.0))
+
+    for time in [1700.0, 95.5, 1020.0, 0.0, 600.0]:
+        expected = ViewerStateReducer(events, keyframe_interval=None).advance(time)
+        state = reducer.seek(time)
+        assert state.display_kwargs() == pytest.approx(expected.display_kwargs())
+        assert reducer.cursor == np.searchsorted(events.times, time, side="right")
+
+
+def test_jump_targets() -> None:
+    """Test enemy spawn and death lookups used by the jump controls."""
+    results = _simulate()
+    events = results["events"]
+    reducer = ViewerStateReducer(events)
+
+    spawn = reducer.enemy_spawn_time(5)
+    assert reducer.seek(spawn).enemy_number == 5
+    assert reducer.enemy_spawn_time(results["furthest_enemy"] + 1000) is None
+
+    first_death = reducer.next_death_time(0.0)
+    assert reducer.seek(first_death).player_deaths == 1
+    assert reducer.next_death_time(events.times[-1]) == first_death  # Wraps around